@@ -32,9 +32,9 @@ import urlparse
 from core import counters
 from core.domain import config_domain
 from core.domain import config_services
+from core.domain import extension_specs_services
 from core.domain import obj_services
 from core.domain import rights_manager
-from core.domain import rte_component_registry
 from core.domain import user_services
 from core.platform import models
 current_user_services = models.Registry.import_current_user_services()
@@ -359,7 +359,15 @@ class BaseHandler(webapp2.RequestHandler):
         """Base method to handle DELETE requests."""
         raise self.PageNotFoundException
 
-    def render_json(self, values):
+    def render_json(self, values, json_encoded_values=None):
+        """Writes the given values to the response as JSON.
+
+        Args:
+            values: dict. The values to encode.
+            json_encoded_values: dict or None. Additional values that have
+                already been encoded using utils.JSONEncoderForHTML, keyed by
+                name. They are added to the output without being re-encoded.
+        """
         self.response.content_type = 'application/javascript; charset=utf-8'
         self.response.headers['Content-Disposition'] = (
             'attachment; filename="oppia-attachment.txt"')
@@ -368,6 +376,12 @@ class BaseHandler(webapp2.RequestHandler):
         self.response.headers['X-Content-Type-Options'] = 'nosniff'
 
         json_output = json.dumps(values, cls=utils.JSONEncoderForHTML)
+        if json_encoded_values:
+            json_output = '{%s}' % ', '.join(
+                ([json_output[1:-1]] if values else []) + [
+                    '%s: %s' % (json.dumps(key), encoded_value)
+                    for (key, encoded_value) in json_encoded_values.iteritems()
+                ])
         self.response.write('%s%s' % (feconf.XSSI_PREFIX, json_output))
 
         # Calculate the processing time of this request.
@@ -394,6 +408,8 @@ class BaseHandler(webapp2.RequestHandler):
             'DEFAULT_LANGUAGE_CODE': feconf.ALL_LANGUAGE_CODES[0]['code'],
             'DEV_MODE': feconf.DEV_MODE,
             'DOMAIN_URL': '%s://%s' % (scheme, netloc),
+            'EXTENSION_SPECS_URL': (
+                extension_specs_services.get_specs_url()),
             'ACTIVITY_STATUS_PRIVATE': (
                 rights_manager.ACTIVITY_STATUS_PRIVATE),
             'ACTIVITY_STATUS_PUBLIC': (
@@ -405,8 +421,6 @@ class BaseHandler(webapp2.RequestHandler):
             # TODO(sll): Consider including the obj_editor html directly as
             # part of the base HTML template?
             'OBJECT_EDITORS_JS': jinja2.utils.Markup(OBJECT_EDITORS_JS.value),
-            'RTE_COMPONENT_SPECS': (
-                rte_component_registry.Registry.get_all_specs()),
             'SHOW_CUSTOM_PAGES': feconf.SHOW_CUSTOM_PAGES,
             'SIDEBAR_MENU_ADDITIONAL_LINKS': (
                 SIDEBAR_MENU_ADDITIONAL_LINKS.value),
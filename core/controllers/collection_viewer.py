@@ -21,7 +21,6 @@ from core.domain import collection_domain
 from core.domain import collection_services
 from core.domain import config_domain
 from core.domain import exp_domain
-from core.domain import exp_services
 from core.domain import rights_manager
 from core.platform import models
 (user_models,) = models.Registry.import_models([models.NAMES.user])
@@ -29,48 +28,37 @@ import feconf
 import utils
 
 
-def require_collection_playable(handler):
-    """Decorator that checks if the user can play the given collection."""
-    def test_can_play(self, collection_id, **kwargs):
-        """Check if the current user can play the collection."""
-        actor = rights_manager.Actor(self.user_id)
-        can_play = actor.can_play(
-            rights_manager.ACTIVITY_TYPE_COLLECTION, collection_id)
-        can_view = actor.can_view(
-            rights_manager.ACTIVITY_TYPE_COLLECTION, collection_id)
-        if can_play and can_view:
-            return handler(self, collection_id, **kwargs)
-        else:
-            raise self.PageNotFoundException
-
-    return test_can_play
-
-
 class CollectionPage(base.BaseHandler):
     """Page describing a single collection."""
 
     PAGE_NAME_FOR_CSRF = 'collection'
 
-    @require_collection_playable
     def get(self, collection_id):
         """Handles GET requests."""
         try:
-            collection = collection_services.get_collection_by_id(
-                collection_id)
+            page_data = collection_services.get_collection_page_data(
+                collection_id, self.user_id)
         except Exception as e:
             raise self.PageNotFoundException(e)
 
+        actor = rights_manager.Actor(self.user_id)
+        collection_rights = page_data['collection_rights']
+        if not actor.can_play_given_rights(collection_rights):
+            raise self.PageNotFoundException
+
+        collection = page_data['collection']
         self.values.update({
             'can_edit': (
                 bool(self.username) and
                 self.username not in config_domain.BANNED_USERNAMES.value and
-                rights_manager.Actor(self.user_id).can_edit(
-                    rights_manager.ACTIVITY_TYPE_COLLECTION, collection_id)
+                actor.can_edit_given_rights(collection_rights)
             ),
             'is_logged_in': bool(self.user_id),
             'collection_id': collection_id,
             'collection_title': collection.title,
-            'is_private': rights_manager.is_collection_private(collection_id),
+            'is_private': (
+                collection_rights.status ==
+                rights_manager.ACTIVITY_STATUS_PRIVATE),
             'meta_name': collection.title,
             'meta_description': utils.capitalize_string(collection.objective)
         })
@@ -84,29 +72,19 @@ class CollectionDataHandler(base.BaseHandler):
     def get(self, collection_id):
         """Populates the data on the individual collection page."""
         try:
-            collection = collection_services.get_collection_by_id(
-                collection_id)
+            page_data = collection_services.get_collection_page_data(
+                collection_id, self.user_id)
         except Exception as e:
             raise self.PageNotFoundException(e)
 
-        exp_ids = collection.exploration_ids
-
-        exp_summaries = (
-            exp_services.get_exploration_summaries_matching_ids(exp_ids))
-
-        exp_titles_dict = {}
-        for (ind, exp_id) in enumerate(exp_ids):
-            exp_summary = exp_summaries[ind]
-            exp_titles_dict[exp_id] = exp_summary.title if exp_summary else ''
+        collection = page_data['collection']
 
         # TODO(bhenning): Users should not be recommended explorations they
         # have completed outside the context of a collection.
         next_exploration_ids = None
         completed_exploration_ids = None
         if self.user_id:
-            completed_exploration_ids = (
-                collection_services.get_completed_exploration_ids(
-                    self.user_id, collection_id))
+            completed_exploration_ids = page_data['completed_exploration_ids']
             next_exploration_ids = collection.get_next_exploration_ids(
                 completed_exploration_ids)
         else:
@@ -116,23 +94,18 @@ class CollectionDataHandler(base.BaseHandler):
             next_exploration_ids = collection.init_exploration_ids
             completed_exploration_ids = []
 
-        collection_dict = collection.to_dict()
+        # The collection dict already includes meta information (ID and
+        # title) about the exploration in each collection node.
+        collection_dict = page_data['collection_dict']
         collection_dict['next_exploration_ids'] = next_exploration_ids
         collection_dict['completed_exploration_ids'] = (
             completed_exploration_ids)
 
-        # Insert an 'exploration' dict into each collection node, where the
-        # dict includes meta information about the exploration (ID and title).
-        for collection_node in collection_dict['nodes']:
-            collection_node['exploration'] = {
-                'id': collection_node['exploration_id'],
-                'title': exp_titles_dict[collection_node['exploration_id']]
-            }
-
         self.values.update({
             'can_edit': (
-                self.user_id and rights_manager.Actor(self.user_id).can_edit(
-                    rights_manager.ACTIVITY_TYPE_COLLECTION, collection_id)),
+                self.user_id and rights_manager.Actor(
+                    self.user_id).can_edit_given_rights(
+                        page_data['collection_rights'])),
             'collection': collection_dict,
             'info_card_image_url': utils.get_info_card_url_for_category(
                 collection.category),
@@ -39,6 +39,7 @@ from core.domain import user_services
 from core.domain import value_generators_domain
 from core.platform import models
 current_user_services = models.Registry.import_current_user_services()
+futures_services = models.Registry.import_futures_services()
 import feconf
 import utils
 
@@ -164,26 +165,42 @@ class ExplorationPage(EditorHandler):
 
     def get(self, exploration_id):
         """Handles GET requests."""
-        if exploration_id in base.DISABLED_EXPLORATIONS.value:
+        # Start all the independent reads, so that they run concurrently.
+        disabled_exploration_ids_future = (
+            base.DISABLED_EXPLORATIONS.get_value_async())
+        exploration_rights_future = (
+            rights_manager.get_exploration_rights_async(exploration_id))
+        exploration_future = exp_services.get_exploration_by_id_async(
+            exploration_id, strict=False)
+        banned_usernames_future = (
+            config_domain.BANNED_USERNAMES.get_value_async())
+        moderator_request_forum_url_future = (
+            MODERATOR_REQUEST_FORUM_URL.get_value_async())
+        value_generators_js_future = VALUE_GENERATORS_JS.get_value_async()
+        futures_services.wait_all([
+            disabled_exploration_ids_future, exploration_rights_future,
+            exploration_future, banned_usernames_future,
+            moderator_request_forum_url_future, value_generators_js_future])
+
+        if exploration_id in disabled_exploration_ids_future.get_result():
             self.render_template(
                 'error/disabled_exploration.html', iframe_restriction=None)
             return
 
-        exploration = exp_services.get_exploration_by_id(
-            exploration_id, strict=False)
+        actor = rights_manager.Actor(self.user_id)
+        exploration_rights = exploration_rights_future.get_result()
+        exploration = exploration_future.get_result()
         if (exploration is None or
-                not rights_manager.Actor(self.user_id).can_view(
-                    rights_manager.ACTIVITY_TYPE_EXPLORATION, exploration_id)):
+                not actor.can_play_given_rights(exploration_rights)):
             self.redirect('/')
             return
 
         can_edit = (
             bool(self.user_id) and
-            self.username not in config_domain.BANNED_USERNAMES.value and
-            rights_manager.Actor(self.user_id).can_edit(
-                rights_manager.ACTIVITY_TYPE_EXPLORATION, exploration_id))
+            self.username not in banned_usernames_future.get_result() and
+            actor.can_edit_given_rights(exploration_rights))
 
-        value_generators_js = VALUE_GENERATORS_JS.value
+        value_generators_js = value_generators_js_future.get_result()
 
         interaction_ids = (
             interaction_registry.Registry.get_all_interaction_ids())
@@ -210,9 +227,9 @@ class ExplorationPage(EditorHandler):
         skin_templates = skins_services.Registry.get_skin_templates(
             skins_services.Registry.get_all_skin_ids())
 
+        # The rights model has already been fetched, so the rights checks
+        # below are served from the in-request datastore cache.
         self.values.update({
-            'GADGET_SPECS': gadget_registry.Registry.get_all_specs(),
-            'INTERACTION_SPECS': interaction_registry.Registry.get_all_specs(),
             'PANEL_SPECS': skins_services.Registry.get_all_specs()[
                 feconf.DEFAULT_SKIN_ID],
             'additional_angular_modules': additional_angular_modules,
@@ -244,7 +261,8 @@ class ExplorationPage(EditorHandler):
                 interaction_templates),
             'interaction_validators_html': jinja2.utils.Markup(
                 interaction_validators_html),
-            'moderator_request_forum_url': MODERATOR_REQUEST_FORUM_URL.value,
+            'moderator_request_forum_url': (
+                moderator_request_forum_url_future.get_result()),
             'nav_mode': feconf.NAV_MODE_CREATE,
             'value_generators_js': jinja2.utils.Markup(value_generators_js),
             'skin_js_urls': [
@@ -616,8 +634,9 @@ class ExplorationDownloadHandler(EditorHandler):
             self.response.headers['Content-Type'] = 'text/plain'
             self.response.headers['Content-Disposition'] = (
                 'attachment; filename=%s.zip' % str(filename))
-            self.response.write(
-                exp_services.export_to_zip_file(exploration_id, version))
+            for chunk in exp_services.export_to_zip_file_chunks(
+                    exploration_id, version=version):
+                self.response.write(chunk)
         elif output_format == feconf.OUTPUT_FORMAT_JSON:
                 self.render_json(exp_services.export_states_to_yaml(
                     exploration_id, version=version, width=width))
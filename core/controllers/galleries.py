@@ -17,7 +17,6 @@
 __author__ = 'sll@google.com (Sean Lip)'
 
 import json
-import logging
 
 from core.controllers import base
 from core.domain import config_domain
@@ -113,8 +112,6 @@ class GalleryHandler(base.BaseHandler):
             exp_services.get_exploration_summaries_matching_query(
                 query_string, cursor=search_cursor))
 
-        # TODO(msl): Store 'is_editable' in exploration summary to avoid O(n)
-        # individual lookups. Note that this will depend on user_id.
         explorations_list = [{
             'id': exp_summary.id,
             'title': exp_summary.title,
@@ -132,12 +129,6 @@ class GalleryHandler(base.BaseHandler):
             'ratings': exp_summary.ratings
         } for exp_summary in exp_summaries_list]
 
-        if len(explorations_list) == feconf.DEFAULT_QUERY_LIMIT:
-            logging.error(
-                '%s explorations were fetched to load the gallery page. '
-                'You may be running up against the default query limits.'
-                % feconf.DEFAULT_QUERY_LIMIT)
-
         preferred_language_codes = [feconf.DEFAULT_LANGUAGE_CODE]
         if self.user_id:
             user_settings = user_services.get_user_settings(self.user_id)
@@ -138,14 +138,17 @@ class MyExplorationsHandler(base.BaseHandler):
                 category in feconf.CATEGORIES_TO_COLORS else
                 feconf.DEFAULT_COLOR)
 
-        explorations_list = []
+        subscribed_summaries = [
+            exp_summary for exp_summary in subscribed_summaries
+            if exp_summary is not None]
+        feedback_thread_analytics_list = (
+            feedback_services.get_thread_analytics_multi([
+                exp_summary.id for exp_summary in subscribed_summaries]))
 
-        for exp_summary in subscribed_summaries:
-            if exp_summary is None:
-                continue
+        explorations_list = []
 
-            feedback_thread_analytics = feedback_services.get_thread_analytics(
-                exp_summary.id)
+        for exp_summary, feedback_thread_analytics in zip(
+                subscribed_summaries, feedback_thread_analytics_list):
             explorations_list.append({
                 'id': exp_summary.id,
                 'title': exp_summary.title,
@@ -181,15 +181,15 @@ class MyExplorationsHandlerTest(test_utils.GenericTestBase):
         self.assertEqual(
             response['explorations_list'][0]['num_total_threads'], 0)
 
-        def mock_get_thread_analytics(exploration_id):
-            return {
+        def mock_get_thread_analytics_multi(exploration_ids):
+            return [{
                 'num_open_threads': 2,
                 'num_total_threads': 3,
-            }
+            } for _ in exploration_ids]
 
         with self.swap(
-                feedback_services, 'get_thread_analytics',
-                mock_get_thread_analytics):
+                feedback_services, 'get_thread_analytics_multi',
+                mock_get_thread_analytics_multi):
             response = self.get_json(self.MY_EXPLORATIONS_DATA_URL)
             self.assertEqual(len(response['explorations_list']), 1)
             self.assertEqual(
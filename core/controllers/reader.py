@@ -22,20 +22,20 @@ from core.controllers import base
 from core.domain import collection_domain
 from core.domain import collection_services
 from core.domain import config_domain
-from core.domain import dependency_registry
 from core.domain import event_services
 from core.domain import exp_domain
 from core.domain import exp_services
 from core.domain import feedback_services
 from core.domain import fs_domain
-from core.domain import gadget_registry
 from core.domain import interaction_registry
+from core.domain import player_assets_registry
 from core.domain import rating_services
 from core.domain import recommendations_services
 from core.domain import rights_manager
-from core.domain import rte_component_registry
 from core.domain import rule_domain
 from core.domain import skins_services
+from core.platform import models
+futures_services = models.Registry.import_futures_services()
 import feconf
 import utils
 
@@ -175,7 +175,6 @@ class ExplorationPage(base.BaseHandler):
 
     PAGE_NAME_FOR_CSRF = 'player'
 
-    @require_playable
     def get(self, exploration_id):
         """Handles GET requests."""
         version_str = self.request.get('v')
@@ -185,71 +184,81 @@ class ExplorationPage(base.BaseHandler):
         # exploration is being played outside the context of a collection.
         collection_id = self.request.get('collection_id')
 
+        # Start all the independent reads, so that they run concurrently.
+        # This does the same checks as the require_playable decorator.
+        disabled_exploration_ids_future = (
+            base.DISABLED_EXPLORATIONS.get_value_async())
+        exploration_rights_future = (
+            rights_manager.get_exploration_rights_async(exploration_id))
+        exploration_future = exp_services.get_exploration_by_id_async(
+            exploration_id, version=version)
+        collection_future = (
+            collection_services.get_collection_by_id_async(collection_id)
+            if collection_id else None)
+        banned_usernames_future = (
+            config_domain.BANNED_USERNAMES.get_value_async())
+        sharing_options_future = SHARING_OPTIONS.get_value_async()
+        sharing_options_twitter_text_future = (
+            SHARING_OPTIONS_TWITTER_TEXT.get_value_async())
+        futures_services.wait_all([
+            disabled_exploration_ids_future, exploration_rights_future,
+            exploration_future, collection_future, banned_usernames_future,
+            sharing_options_future, sharing_options_twitter_text_future])
+
+        if exploration_id in disabled_exploration_ids_future.get_result():
+            self.render_template(
+                'error/disabled_exploration.html', iframe_restriction=None)
+            return
+
+        actor = rights_manager.Actor(self.user_id)
+        exploration_rights = exploration_rights_future.get_result()
+        if not actor.can_play_given_rights(exploration_rights):
+            raise self.PageNotFoundException
+
         try:
-            exploration = exp_services.get_exploration_by_id(
-                exploration_id, version=version)
+            exploration = exploration_future.get_result()
         except Exception as e:
             raise self.PageNotFoundException(e)
 
         collection_title = None
-        if collection_id:
+        if collection_future:
             try:
-                collection = collection_services.get_collection_by_id(
-                    collection_id)
-                collection_title = collection.title
+                collection_title = collection_future.get_result().title
             except Exception as e:
                 raise self.PageNotFoundException(e)
 
         version = exploration.version
 
-        if not rights_manager.Actor(self.user_id).can_view(
-                rights_manager.ACTIVITY_TYPE_EXPLORATION, exploration_id):
-            raise self.PageNotFoundException
-
         is_iframed = (self.request.get('iframed') == 'true')
 
-        # TODO(sll): Cache these computations.
-        gadget_types = exploration.get_gadget_types()
-        interaction_ids = exploration.get_interaction_ids()
-        dependency_ids = (
-            interaction_registry.Registry.get_deduplicated_dependency_ids(
-                interaction_ids))
-        dependencies_html, additional_angular_modules = (
-            dependency_registry.Registry.get_deps_html_and_angular_modules(
-                dependency_ids))
-
-        gadget_templates = (
-            gadget_registry.Registry.get_gadget_html(gadget_types))
-
-        interaction_templates = (
-            rte_component_registry.Registry.get_html_for_all_components() +
-            interaction_registry.Registry.get_interaction_html(
-                interaction_ids))
+        player_assets = player_assets_registry.Registry.get_player_assets(
+            exploration.get_interaction_ids(), exploration.get_gadget_types())
 
         self.values.update({
-            'GADGET_SPECS': gadget_registry.Registry.get_all_specs(),
-            'INTERACTION_SPECS': interaction_registry.Registry.get_all_specs(),
-            'SHARING_OPTIONS': SHARING_OPTIONS.value,
-            'SHARING_OPTIONS_TWITTER_TEXT': SHARING_OPTIONS_TWITTER_TEXT.value,
-            'additional_angular_modules': additional_angular_modules,
+            'SHARING_OPTIONS': sharing_options_future.get_result(),
+            'SHARING_OPTIONS_TWITTER_TEXT': (
+                sharing_options_twitter_text_future.get_result()),
+            'additional_angular_modules': (
+                player_assets['additional_angular_modules']),
             'can_edit': (
                 bool(self.username) and
-                self.username not in config_domain.BANNED_USERNAMES.value and
-                rights_manager.Actor(self.user_id).can_edit(
-                    rights_manager.ACTIVITY_TYPE_EXPLORATION, exploration_id)
+                self.username not in banned_usernames_future.get_result() and
+                actor.can_edit_given_rights(exploration_rights)
             ),
             'dependencies_html': jinja2.utils.Markup(
-                dependencies_html),
+                player_assets['dependencies_html']),
             'exploration_title': exploration.title,
             'exploration_version': version,
             'collection_id': collection_id,
             'collection_title': collection_title,
-            'gadget_templates': jinja2.utils.Markup(gadget_templates),
+            'gadget_templates': jinja2.utils.Markup(
+                player_assets['gadget_templates']),
             'iframed': is_iframed,
             'interaction_templates': jinja2.utils.Markup(
-                interaction_templates),
-            'is_private': rights_manager.is_exploration_private(
-                exploration_id),
+                player_assets['interaction_templates']),
+            'is_private': (
+                exploration_rights.status ==
+                rights_manager.ACTIVITY_STATUS_PRIVATE),
             # Note that this overwrites the value in base.py.
             'meta_name': exploration.title,
             # Note that this overwrites the value in base.py.
@@ -279,25 +288,34 @@ class ExplorationHandler(base.BaseHandler):
         version = self.request.get('v')
         version = int(version) if version else None
 
+        exploration_future = exp_services.get_exploration_by_id_async(
+            exploration_id, version=version)
+        exploration_rights_future = (
+            rights_manager.get_exploration_rights_async(exploration_id)
+            if self.user_id else None)
+        futures_services.wait_all(
+            [exploration_future, exploration_rights_future])
+
         try:
-            exploration = exp_services.get_exploration_by_id(
-                exploration_id, version=version)
+            exploration = exploration_future.get_result()
         except Exception as e:
             raise self.PageNotFoundException(e)
 
         self.values.update({
             'can_edit': (
                 self.user_id and
-                rights_manager.Actor(self.user_id).can_edit(
-                    rights_manager.ACTIVITY_TYPE_EXPLORATION, exploration_id)),
-            'exploration': exploration.to_player_dict(),
+                rights_manager.Actor(self.user_id).can_edit_given_rights(
+                    exploration_rights_future.get_result())),
             'info_card_image_url': utils.get_info_card_url_for_category(
                 exploration.category),
             'is_logged_in': bool(self.user_id),
             'session_id': utils.generate_new_session_id(),
             'version': exploration.version,
         })
-        self.render_json(self.values)
+        self.render_json(self.values, json_encoded_values={
+            'exploration': exp_services.get_exploration_player_json(
+                exploration)
+        })
 
 
 class AnswerSubmittedEventHandler(base.BaseHandler):
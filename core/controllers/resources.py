@@ -16,11 +16,13 @@
 
 __author__ = 'sll@google.com (Sean Lip)'
 
+import hashlib
 import logging
 import mimetypes
 import urllib
 
 from core.controllers import base
+from core.domain import extension_specs_services
 from core.domain import fs_domain
 from core.domain import obj_services
 from core.domain import value_generators_domain
@@ -56,12 +58,50 @@ class ValueGeneratorHandler(base.BaseHandler):
             raise self.PageNotFoundException
 
 
+class ExtensionSpecsHandler(base.BaseHandler):
+    """Serves the specs of all RTE components, interactions and gadgets as a
+    JavaScript file."""
+
+    # The max-age, in seconds, of a specs file requested at its current
+    # version. Since the URL contains a hash of the contents, the file can be
+    # cached indefinitely.
+    _SPECS_FILE_MAX_AGE_SECS = 365 * 24 * 60 * 60
+
+    def get(self, version):
+        """Handles GET requests.
+
+        If the requested version is stale (e.g. because the page was rendered
+        by an instance running a different deployment), the current specs are
+        served but are not cached.
+        """
+        self.response.content_type = 'application/javascript; charset=utf-8'
+        if version == extension_specs_services.get_specs_version():
+            self.response.cache_control.public = True
+            self.response.cache_control.max_age = (
+                self._SPECS_FILE_MAX_AGE_SECS)
+        else:
+            self.response.cache_control.no_cache = True
+        self.response.write(extension_specs_services.get_specs_js())
+
+
 class ImageHandler(base.BaseHandler):
     """Handles image retrievals."""
 
+    # The max-age, in seconds, of an image requested at an explicit version.
+    # Such a response never changes, so it can be cached indefinitely.
+    _VERSIONED_IMAGE_MAX_AGE_SECS = 365 * 24 * 60 * 60
+    # The max-age, in seconds, of the latest version of an image. After this
+    # time, clients revalidate the image using its ETag.
+    _LATEST_IMAGE_MAX_AGE_SECS = 60 * 60
+
     def get(self, exploration_id, encoded_filepath):
         """Returns an image.
 
+        The version of the image may be specified using the optional 'v' query
+        parameter; if it is not, the latest version is returned. Responses
+        carry an ETag derived from the image content, and conditional requests
+        whose If-None-Match header matches it receive a 304 response.
+
         Args:
             exploration_id: the id of the exploration.
             encoded_filepath: a string representing the image filepath. This
@@ -70,14 +110,27 @@ class ImageHandler(base.BaseHandler):
         try:
             filepath = urllib.unquote(encoded_filepath)
             file_format = filepath[(filepath.rfind('.') + 1):]
-            # If the following is not cast to str, an error occurs in the wsgi
-            # library because unicode gets used.
-            self.response.headers['Content-Type'] = str(
-                'image/%s' % file_format)
+            version = self.request.get('v')
+            version = int(version) if version else None
 
             fs = fs_domain.AbstractFileSystem(
                 fs_domain.ExplorationFileSystem(exploration_id))
-            raw = fs.get(filepath)
-            self.response.write(raw)
+            raw = fs.get(filepath, version=version)
         except:
             raise self.PageNotFoundException
+
+        # If the following is not cast to str, an error occurs in the wsgi
+        # library because unicode gets used.
+        self.response.headers['Content-Type'] = str('image/%s' % file_format)
+        self.response.cache_control.public = True
+        self.response.cache_control.max_age = (
+            self._LATEST_IMAGE_MAX_AGE_SECS if version is None
+            else self._VERSIONED_IMAGE_MAX_AGE_SECS)
+        etag = hashlib.md5(raw).hexdigest()
+        self.response.headers['ETag'] = str('"%s"' % etag)
+
+        if etag in self.request.if_none_match:
+            self.response.status = 304
+            return
+
+        self.response.write(raw)
@@ -16,14 +16,46 @@
 
 __author__ = 'Sean Lip'
 
+import hashlib
 import os
 
+from core.controllers import resources
 from core.domain import exp_services
+from core.domain import extension_specs_services
 from core.domain import rights_manager
 from core.tests import test_utils
 import feconf
 
 
+class ExtensionSpecsHandlerTest(test_utils.GenericTestBase):
+
+    def test_pages_reference_versioned_specs_file(self):
+        specs_url = extension_specs_services.get_specs_url()
+        response = self.testapp.get(feconf.GALLERY_URL)
+        self.assertEqual(response.status_int, 200)
+        response.mustcontain(specs_url)
+
+    def test_current_specs_file_is_cached(self):
+        response = self.testapp.get(
+            extension_specs_services.get_specs_url())
+        self.assertEqual(response.status_int, 200)
+        self.assertEqual(
+            response.body, extension_specs_services.get_specs_js())
+        response.mustcontain(
+            'GLOBALS.RTE_COMPONENT_SPECS', 'GLOBALS.INTERACTION_SPECS',
+            'GLOBALS.GADGET_SPECS')
+        self.assertIn('public', response.headers['Cache-Control'])
+        self.assertIn('max-age', response.headers['Cache-Control'])
+
+    def test_stale_specs_file_is_not_cached(self):
+        response = self.testapp.get(
+            '%s/stale_version.js' % feconf.EXTENSION_SPECS_URL_PREFIX)
+        self.assertEqual(response.status_int, 200)
+        self.assertEqual(
+            response.body, extension_specs_services.get_specs_js())
+        self.assertIn('no-cache', response.headers['Cache-Control'])
+
+
 class ImageHandlerTest(test_utils.GenericTestBase):
 
     IMAGE_UPLOAD_URL_PREFIX = '/createhandler/imageupload'
@@ -64,6 +96,47 @@ class ImageHandlerTest(test_utils.GenericTestBase):
         self.assertEqual(response.content_type, 'image/png')
         self.assertEqual(response.body, raw_image)
 
+    def test_image_download_is_cacheable(self):
+        """Test that downloaded images can be cached and revalidated."""
+        self.login(self.EDITOR_EMAIL)
+        response = self.testapp.get('/create/0')
+        csrf_token = self.get_csrf_token_from_response(response)
+
+        with open(os.path.join(feconf.TESTS_DATA_DIR, 'img.png'),
+                  mode='rb') as f:
+            raw_image = f.read()
+        response_dict = self.post_json(
+            '%s/0' % self.IMAGE_UPLOAD_URL_PREFIX,
+            {'filename': 'test.png'},
+            csrf_token=csrf_token,
+            upload_files=(('image', 'unused_filename', raw_image),)
+        )
+        image_url = str('%s/0/%s' % (
+            self.IMAGE_VIEW_URL_PREFIX, response_dict['filepath']))
+
+        self.logout()
+
+        response = self.testapp.get(image_url)
+        self.assertIn('public', response.headers['Cache-Control'])
+        etag = response.headers['ETag']
+        self.assertEqual(etag, '"%s"' % hashlib.md5(raw_image).hexdigest())
+
+        response = self.testapp.get(
+            image_url, headers={'If-None-Match': etag}, status=304)
+        self.assertEqual(response.body, '')
+
+        response = self.testapp.get(
+            image_url, headers={'If-None-Match': '"other_etag"'})
+        self.assertEqual(response.body, raw_image)
+
+        response = self.testapp.get('%s?v=1' % image_url)
+        self.assertEqual(response.body, raw_image)
+        self.assertIn(
+            'max-age=%s' % resources.ImageHandler._VERSIONED_IMAGE_MAX_AGE_SECS,
+            response.headers['Cache-Control'])
+
+        self.testapp.get('%s?v=2' % image_url, status=404)
+
     def test_upload_empty_image(self):
         """Test upload of an empty image."""
 
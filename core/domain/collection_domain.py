@@ -168,6 +168,9 @@ class CollectionNode(object):
         self.exploration_id = exploration_id
         self.prerequisite_skills = prerequisite_skills
         self.acquired_skills = acquired_skills
+        # The collection that this node belongs to, if any. Its compiled skill
+        # graph is cleared whenever the skills of this node are updated.
+        self._collection = None
 
     def to_dict(self):
         return {
@@ -190,11 +193,20 @@ class CollectionNode(object):
         """
         return set(self.prerequisite_skills) | set(self.acquired_skills)
 
+    def _clear_collection_skill_graph(self):
+        # Nodes that were pickled before this attribute was introduced do not
+        # have it.
+        collection = getattr(self, '_collection', None)
+        if collection is not None:
+            collection.clear_skill_graph()
+
     def update_prerequisite_skills(self, prerequisite_skills):
         self.prerequisite_skills = copy.deepcopy(prerequisite_skills)
+        self._clear_collection_skill_graph()
 
     def update_acquired_skills(self, acquired_skills):
         self.acquired_skills = copy.deepcopy(acquired_skills)
+        self._clear_collection_skill_graph()
 
     def validate(self):
         """Validates various properties of the collection node."""
@@ -249,6 +261,79 @@ class CollectionNode(object):
         return cls(exploration_id, [], [])
 
 
+class CollectionSkillGraph(object):
+    """A compiled representation of the skills of the nodes of a collection.
+
+    Each skill is interned to an integer id, and the prerequisite and acquired
+    skills of each node are stored as bitmasks over these ids, so that checking
+    whether a node's prerequisites are satisfied is a single bitwise operation.
+    """
+
+    def __init__(self, nodes):
+        skill_ids = {}
+
+        def _get_skills_mask(skills):
+            mask = 0
+            for skill in skills:
+                if skill not in skill_ids:
+                    skill_ids[skill] = len(skill_ids)
+                mask |= 1 << skill_ids[skill]
+            return mask
+
+        # A list of (exploration_id, prerequisite_skills_mask) pairs, in the
+        # order in which the nodes were added to the collection.
+        self._prerequisite_masks = []
+        # A dict mapping each exploration id to its acquired skills mask.
+        self._acquired_masks = {}
+        for node in nodes:
+            self._prerequisite_masks.append(
+                (node.exploration_id,
+                 _get_skills_mask(node.prerequisite_skills)))
+            self._acquired_masks[node.exploration_id] = _get_skills_mask(
+                node.acquired_skills)
+
+    def get_next_exploration_ids(self, completed_exploration_ids):
+        """Returns a list of the ids of the explorations that have not been
+        completed, and whose prerequisite skills have all been acquired by
+        completing the given explorations. Completed explorations that are not
+        part of the collection grant no skills.
+        """
+        completed_exploration_ids = set(completed_exploration_ids)
+        acquired_mask = 0
+        for exploration_id in completed_exploration_ids:
+            acquired_mask |= self._acquired_masks.get(exploration_id, 0)
+
+        return [
+            exploration_id
+            for (exploration_id, prerequisite_mask) in self._prerequisite_masks
+            if (exploration_id not in completed_exploration_ids and
+                not prerequisite_mask & ~acquired_mask)]
+
+    def get_reachable_exploration_ids(self):
+        """Returns the set of ids of the explorations that can be completed
+        by starting from the explorations with no prerequisite skills, and
+        then repeatedly completing the next explorations.
+        """
+        reachable_exploration_ids = set()
+        acquired_mask = 0
+        remaining_masks = self._prerequisite_masks
+        while True:
+            next_exploration_ids = [
+                exploration_id
+                for (exploration_id, prerequisite_mask) in remaining_masks
+                if not prerequisite_mask & ~acquired_mask]
+            if not next_exploration_ids:
+                return reachable_exploration_ids
+
+            for exploration_id in next_exploration_ids:
+                reachable_exploration_ids.add(exploration_id)
+                acquired_mask |= self._acquired_masks[exploration_id]
+            remaining_masks = [
+                (exploration_id, prerequisite_mask)
+                for (exploration_id, prerequisite_mask) in remaining_masks
+                if exploration_id not in reachable_exploration_ids]
+
+
 class Collection(object):
     """Domain object for an Oppia collection."""
 
@@ -275,9 +360,15 @@ class Collection(object):
         self.objective = objective
         self.schema_version = schema_version
         self.nodes = nodes
+        for node in self.nodes:
+            node._collection = self
         self.version = version
         self.created_on = created_on
         self.last_updated = last_updated
+        # The compiled skill graph of the nodes. This is computed lazily by
+        # get_skill_graph(), and cleared whenever a node is added or deleted
+        # or the skills of a node are updated.
+        self._skill_graph = None
 
     def to_dict(self):
         return {
@@ -302,17 +393,14 @@ class Collection(object):
     def from_dict(
             cls, collection_dict, collection_version=0,
             collection_created_on=None, collection_last_updated=None):
-        collection = cls(
+        return cls(
             collection_dict['id'], collection_dict['title'],
             collection_dict['category'], collection_dict['objective'],
-            collection_dict['schema_version'], [], collection_version,
-            collection_created_on, collection_last_updated)
-
-        for node_dict in collection_dict['nodes']:
-            collection.nodes.append(
-                CollectionNode.from_dict(node_dict))
-
-        return collection
+            collection_dict['schema_version'], [
+                CollectionNode.from_dict(node_dict)
+                for node_dict in collection_dict['nodes']],
+            collection_version, collection_created_on,
+            collection_last_updated)
 
     def to_yaml(self):
         collection_dict = self.to_dict()
@@ -377,19 +465,28 @@ class Collection(object):
         returned. The order of the exploration IDs is given by the order in
         which each exploration was added to the collection.
         """
-        acquired_skills = set()
-        for completed_exp_id in completed_exploration_ids:
-            acquired_skills.update(
-                self.get_node(completed_exp_id).acquired_skills)
+        return self.get_skill_graph().get_next_exploration_ids(
+            completed_exploration_ids)
 
-        next_exp_ids = []
-        for node in self.nodes:
-            if node.exploration_id in completed_exploration_ids:
-                continue
-            prereq_skills = set(node.prerequisite_skills)
-            if prereq_skills <= acquired_skills:
-                next_exp_ids.append(node.exploration_id)
-        return next_exp_ids
+    def get_skill_graph(self):
+        """Returns the CollectionSkillGraph of the current nodes.
+
+        The graph is compiled once and kept on this object (and hence cached
+        along with it in memcache) until add_node(), delete_node() or the
+        skill setters of a node clear it. Code that modifies the nodes list or
+        the skills of a node directly must call clear_skill_graph().
+        """
+        # Collections that were pickled before this attribute was introduced
+        # do not have it.
+        if getattr(self, '_skill_graph', None) is None:
+            self._skill_graph = CollectionSkillGraph(self.nodes)
+        return self._skill_graph
+
+    def clear_skill_graph(self):
+        """Clears the compiled skill graph, so that it is recompiled from the
+        current nodes the next time that it is needed.
+        """
+        self._skill_graph = None
 
     @classmethod
     def is_demo_collection_id(cls, collection_id):
@@ -430,7 +527,10 @@ class Collection(object):
             raise ValueError(
                 'Exploration is already part of this collection: %s' %
                 exploration_id)
-        self.nodes.append(CollectionNode.create_default_node(exploration_id))
+        collection_node = CollectionNode.create_default_node(exploration_id)
+        collection_node._collection = self
+        self.nodes.append(collection_node)
+        self.clear_skill_graph()
 
     def delete_node(self, exploration_id):
         node_index = self._find_node(exploration_id)
@@ -439,6 +539,7 @@ class Collection(object):
                 'Exploration is not part of this collection: %s' %
                 exploration_id)
         del self.nodes[node_index]
+        self.clear_skill_graph()
 
     def validate(self, strict=True):
         """Validates all properties of this collection and its constituents."""
@@ -506,13 +607,8 @@ class Collection(object):
             # in the collection must be reachable when starting from the
             # explorations with no prerequisite skills and playing through all
             # subsequent explorations provided by get_next_exploration_ids.
-            completed_exp_ids = set(self.init_exploration_ids)
-            next_exp_ids = self.get_next_exploration_ids(
-                list(completed_exp_ids))
-            while next_exp_ids:
-                completed_exp_ids.update(set(next_exp_ids))
-                next_exp_ids = self.get_next_exploration_ids(
-                    list(completed_exp_ids))
+            completed_exp_ids = (
+                self.get_skill_graph().get_reachable_exploration_ids())
 
             if len(completed_exp_ids) != len(self.nodes):
                 unreachable_ids = set(all_exp_ids) - completed_exp_ids
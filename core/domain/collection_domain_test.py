@@ -340,6 +340,66 @@ class ExplorationGraphUnitTests(test_utils.GenericTestBase):
         self.assertEqual(
             collection.init_exploration_ids, ['exp_id_0', 'exp_id_2'])
 
+    def test_skill_graph(self):
+        """The compiled skill graph should be reused until a node is added
+        or deleted, or the skills of a node are updated.
+        """
+        collection = collection_domain.Collection.create_default_collection(
+            'collection_id', 'A title', 'A category', 'An objective')
+        collection.add_node('exp_id_0')
+        collection.add_node('exp_id_1')
+        collection.add_node('exp_id_2')
+        collection.get_node('exp_id_0').update_acquired_skills(['skill0a'])
+        collection.get_node('exp_id_1').update_prerequisite_skills(
+            ['skill0a'])
+        collection.get_node('exp_id_2').update_prerequisite_skills(
+            ['skill1a'])
+
+        skill_graph = collection.get_skill_graph()
+        self.assertIs(collection.get_skill_graph(), skill_graph)
+        self.assertEqual(
+            skill_graph.get_reachable_exploration_ids(),
+            set(['exp_id_0', 'exp_id_1']))
+        self.assertEqual(
+            skill_graph.get_next_exploration_ids(['exp_id_0', 'fake_exp_id']),
+            ['exp_id_1'])
+
+        collection.get_node('exp_id_1').update_acquired_skills(['skill1a'])
+        new_skill_graph = collection.get_skill_graph()
+        self.assertIsNot(new_skill_graph, skill_graph)
+        self.assertEqual(
+            new_skill_graph.get_reachable_exploration_ids(),
+            set(['exp_id_0', 'exp_id_1', 'exp_id_2']))
+
+        collection.delete_node('exp_id_2')
+        self.assertIsNot(collection.get_skill_graph(), new_skill_graph)
+        self.assertEqual(
+            collection.get_skill_graph().get_reachable_exploration_ids(),
+            set(['exp_id_0', 'exp_id_1']))
+
+    def test_validation_of_long_collection(self):
+        """A collection whose explorations form a long chain of skills
+        should be validated.
+        """
+        num_nodes = 300
+        collection = collection_domain.Collection.create_default_collection(
+            'collection_id', 'A title', 'A category', 'An objective')
+        for ind in range(num_nodes):
+            collection.add_node('exp_id_%s' % ind)
+            collection_node = collection.get_node('exp_id_%s' % ind)
+            collection_node.update_acquired_skills(['skill%s' % ind])
+            if ind > 0:
+                collection_node.update_prerequisite_skills(
+                    ['skill%s' % (ind - 1)])
+        collection.validate()
+
+        collection.get_node('exp_id_0').update_acquired_skills([])
+        with self.assertRaisesRegexp(
+                utils.ValidationError,
+                'Some explorations are unreachable from the initial '
+                'explorations'):
+            collection.validate()
+
     def test_next_explorations(self):
         """Explorations should be suggested based on prerequisite and
         acquired skills, as well as which explorations have already been played
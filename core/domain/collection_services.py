@@ -34,8 +34,10 @@ from core.domain import exp_services
 from core.domain import rights_manager
 from core.domain import user_services
 from core.platform import models
-(collection_models, user_models) = models.Registry.import_models([
-    models.NAMES.collection, models.NAMES.user])
+(collection_models, exp_models, user_models) = (
+    models.Registry.import_models([
+        models.NAMES.collection, models.NAMES.exploration, models.NAMES.user]))
+futures_services = models.Registry.import_futures_services()
 memcache_services = models.Registry.import_memcache_services()
 search_services = models.Registry.import_search_services()
 import feconf
@@ -85,6 +87,13 @@ def _get_collection_memcache_key(collection_id, version=None):
         return 'collection:%s' % collection_id
 
 
+def _get_collection_page_data_memcache_key(collection_id):
+    """Returns the memcache key for the learner-independent data of the page
+    of a collection.
+    """
+    return 'collection-page-data:%s' % collection_id
+
+
 def get_collection_from_model(collection_model, run_conversion=True):
     """Returns a Collection domain object given a collection model loaded
     from the datastore.
@@ -145,14 +154,57 @@ def get_collection_by_id(collection_id, strict=True, version=None):
     if memcached_collection is not None:
         return memcached_collection
     else:
-        collection_model = collection_models.CollectionModel.get(
+        return _get_collection_from_datastore(collection_id, strict, version)
+
+
+@futures_services.tasklet
+def get_collection_by_id_async(collection_id, strict=True, version=None):
+    """Like get_collection_by_id(), but returns a future whose result is the
+    collection.
+
+    The memcache lookup, and the datastore read that follows it on a cache
+    miss, are issued concurrently with other pending reads.
+    """
+    collection_memcache_key = _get_collection_memcache_key(
+        collection_id, version=version)
+    memcached_items = yield memcache_services.get_multi_async(
+        [collection_memcache_key])
+    collection = memcached_items.get(collection_memcache_key)
+
+    if collection is None:
+        collection_model = yield collection_models.CollectionModel.get_async(
             collection_id, strict=strict, version=version)
-        if collection_model:
-            collection = get_collection_from_model(collection_model)
-            memcache_services.set_multi({collection_memcache_key: collection})
-            return collection
-        else:
-            return None
+        collection = _get_collection_from_model_and_memcache_it(
+            collection_id, version, collection_model)
+    raise futures_services.Return(collection)
+
+
+def _get_collection_from_datastore(collection_id, strict, version):
+    """Loads a collection from the datastore and adds it to memcache.
+
+    Returns None if the collection does not exist and strict is False.
+    """
+    return _get_collection_from_model_and_memcache_it(
+        collection_id, version, collection_models.CollectionModel.get(
+            collection_id, strict=strict, version=version))
+
+
+def _get_collection_from_model_and_memcache_it(
+        collection_id, version, collection_model):
+    """Returns the collection domain object for the given model, which was
+    loaded for the given collection id and version, after adding it to
+    memcache. Returns None if the model is None.
+    """
+    if collection_model:
+        collection = get_collection_from_model(collection_model)
+        # Compile the skill graph, so that it is cached with the collection.
+        collection.get_skill_graph()
+        memcache_services.set_multi({
+            _get_collection_memcache_key(
+                collection_id, version=version): collection})
+        return collection
+    else:
+        return None
 
 
 def get_collection_summary_by_id(collection_id):
@@ -300,6 +352,86 @@ def get_next_exploration_ids_to_complete_by_user(user_id, collection_id):
         return collection.init_exploration_ids
 
 
+def get_collection_page_data(collection_id, user_id):
+    """Loads the data needed to show a collection to a learner, who may be
+    None if the learner is not logged in.
+
+    The collection rights and the learner's progress are fetched concurrently
+    with the collection and the summaries of its explorations. The part of the
+    data that is the same for every learner is cached in memcache, so that it
+    is only recomputed when the collection changes or the cache expires.
+
+    Returns a dict with the following keys:
+        'collection': the Collection domain object.
+        'collection_rights': the ActivityRights domain object of the
+            collection, or None if it does not exist.
+        'collection_dict': the dict representation of the collection, in
+            which each node has an additional 'exploration' dict with the id
+            and the title of its exploration. The title is '' if the
+            exploration does not exist.
+        'completed_exploration_ids': the ids of the explorations that the
+            learner has completed within the context of the collection.
+
+    Raises an EntityNotFoundError if the collection does not exist.
+    """
+    collection_rights_future = (
+        collection_models.CollectionRightsModel.get_multi_async(
+            [collection_id]))
+    progress_model_future = (
+        user_models.CollectionProgressModel.get_async(user_id, collection_id)
+        if user_id else None)
+
+    collection_memcache_key = _get_collection_memcache_key(collection_id)
+    page_data_memcache_key = _get_collection_page_data_memcache_key(
+        collection_id)
+    memcached_values = memcache_services.get_multi(
+        [collection_memcache_key, page_data_memcache_key])
+
+    collection = memcached_values.get(collection_memcache_key)
+    if collection is None:
+        collection = _get_collection_from_datastore(collection_id, True, None)
+
+    # The cached page data is only used if it was computed from the current
+    # version of the collection.
+    page_data = memcached_values.get(page_data_memcache_key)
+    if page_data is None or page_data['version'] != collection.version:
+        exp_summary_models = exp_models.ExpSummaryModel.get_multi(
+            collection.exploration_ids)
+        exp_titles_dict = {
+            exp_id: exp_summary_model.title if exp_summary_model else ''
+            for (exp_id, exp_summary_model) in zip(
+                collection.exploration_ids, exp_summary_models)
+        }
+
+        collection_dict = collection.to_dict()
+        for collection_node in collection_dict['nodes']:
+            collection_node['exploration'] = {
+                'id': collection_node['exploration_id'],
+                'title': exp_titles_dict[collection_node['exploration_id']]
+            }
+
+        page_data = {
+            'version': collection.version,
+            'collection_dict': collection_dict,
+        }
+        memcache_services.set_multi(
+            {page_data_memcache_key: page_data},
+            timeout_secs=feconf.COLLECTION_PAGE_DATA_MEMCACHE_TIMEOUT_SECS)
+
+    progress_model = (
+        progress_model_future.get_result() if progress_model_future
+        else None)
+
+    return {
+        'collection': collection,
+        'collection_rights': rights_manager.get_collection_rights_from_model(
+            collection_rights_future.get_result()[0]),
+        'collection_dict': page_data['collection_dict'],
+        'completed_exploration_ids': (
+            progress_model.completed_explorations if progress_model else []),
+    }
+
+
 def record_played_exploration_in_collection_context(
         user_id, collection_id, exploration_id):
     progress_model = user_models.CollectionProgressModel.get_or_create(
@@ -576,6 +708,20 @@ def get_collection_snapshots_metadata(collection_id):
         collection_id, version_nums)
 
 
+def _get_last_updated_by_human_ms(collection_id):
+    """Return the last time, in milliseconds, when the given collection was
+    updated by a human.
+    """
+    collection_model = collection_models.CollectionModel.get(collection_id)
+    if collection_model.last_human_commit_msec is not None:
+        return collection_model.last_human_commit_msec
+
+    # The collection has not been committed to by a human since this was
+    # first tracked, so search its history instead.
+    snapshot_metadata = collection_model.get_last_human_commit_metadata()
+    return snapshot_metadata['created_on_ms'] if snapshot_metadata else 0
+
+
 def _get_contributor_ids_for_collection(col_id):
     """Returns list of ids of contributors to a collection."""
     contributor_ids = []
@@ -854,14 +1000,7 @@ def _get_search_rank(collection_id):
         if rights.status == rights_manager.ACTIVITY_STATUS_PUBLICIZED
         else 0)
 
-    # Iterate backwards through the collection history metadata until we find
-    # the most recent snapshot that was committed by a human.
-    last_human_update_ms = 0
-    snapshots_metadata = get_collection_snapshots_metadata(collection_id)
-    for snapshot_metadata in reversed(snapshots_metadata):
-        if snapshot_metadata['committer_id'] != feconf.MIGRATION_BOT_USER_ID:
-            last_human_update_ms = snapshot_metadata['created_on_ms']
-            break
+    last_human_update_ms = _get_last_updated_by_human_ms(collection_id)
 
     _TIME_NOW_MS = utils.get_current_time_in_millisecs()
     _MS_IN_ONE_DAY = 24 * 60 * 60 * 1000
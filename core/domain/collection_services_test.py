@@ -23,6 +23,7 @@ import os
 from core.domain import collection_domain
 from core.domain import collection_services
 from core.domain import event_services
+from core.domain import exp_services
 from core.domain import rating_services
 from core.domain import rights_manager
 from core.domain import user_services
@@ -294,6 +295,45 @@ class CollectionProgressUnitTests(CollectionServicesUnitTests):
         self.assertEqual(completion_model.completed_explorations, [
             self.EXP_ID_0, self.EXP_ID_2, self.EXP_ID_1])
 
+    def test_get_collection_page_data(self):
+        self._record_completion(self.OWNER_ID, self.COL_ID_0, self.EXP_ID_1)
+
+        page_data = collection_services.get_collection_page_data(
+            self.COL_ID_0, self.OWNER_ID)
+        self.assertEqual(page_data['collection'].id, self.COL_ID_0)
+        self.assertEqual(page_data['collection_rights'].id, self.COL_ID_0)
+        self.assertEqual(
+            page_data['completed_exploration_ids'], [self.EXP_ID_1])
+        self.assertEqual([
+            collection_node['exploration']
+            for collection_node in page_data['collection_dict']['nodes']
+        ], [{
+            'id': exp_id,
+            'title': exp_services.get_exploration_by_id(exp_id).title,
+        } for exp_id in [self.EXP_ID_0, self.EXP_ID_1, self.EXP_ID_2]])
+
+        # Logged-out learners have made no progress.
+        page_data = collection_services.get_collection_page_data(
+            self.COL_ID_0, None)
+        self.assertEqual(page_data['completed_exploration_ids'], [])
+        self.assertEqual(len(page_data['collection_dict']['nodes']), 3)
+
+        # The cached data is not used once the collection has changed.
+        collection_services.update_collection(
+            self.OWNER_ID, self.COL_ID_0, [{
+                'cmd': collection_domain.CMD_DELETE_COLLECTION_NODE,
+                'exploration_id': self.EXP_ID_2
+            }], 'Deleted an exploration')
+        page_data = collection_services.get_collection_page_data(
+            self.COL_ID_0, None)
+        self.assertEqual([
+            collection_node['exploration_id']
+            for collection_node in page_data['collection_dict']['nodes']
+        ], [self.EXP_ID_0, self.EXP_ID_1])
+
+        with self.assertRaises(Exception):
+            collection_services.get_collection_page_data('Fake', None)
+
 
 class CollectionSummaryQueriesUnitTests(CollectionServicesUnitTests):
     """Tests collection query methods which operate on CollectionSummary
@@ -19,6 +19,7 @@ __author__ = 'Sean Lip'
 
 from core.domain import user_services
 from core.platform import models
+futures_services = models.Registry.import_futures_services()
 (config_models,) = models.Registry.import_models([models.NAMES.config])
 memcache_services = models.Registry.import_memcache_services()
 import schema_utils
@@ -91,6 +92,23 @@ class ConfigProperty(object):
         if self.name in memcached_items:
             return memcached_items[self.name]
 
+        return self._get_value_from_datastore()
+
+    @futures_services.tasklet
+    def get_value_async(self):
+        """Like value, but returns a future whose result is the value. The
+        memcache lookup is issued concurrently with other pending reads.
+        """
+        memcached_items = yield memcache_services.get_multi_async(
+            [self.name])
+        if self.name in memcached_items:
+            raise futures_services.Return(memcached_items[self.name])
+        raise futures_services.Return(self._get_value_from_datastore())
+
+    def _get_value_from_datastore(self):
+        """Get the value from the datastore and add it to memcache, or use
+        the default if it is not in the datastore.
+        """
         datastore_item = config_models.ConfigPropertyModel.get(
             self.name, strict=False)
         if datastore_item is not None:
@@ -126,6 +144,9 @@ class ComputedProperty(ConfigProperty):
         self.refresh_default_value()
         return self.default_value
 
+    def get_value_async(self):
+        return futures_services.make_completed_future(self.value)
+
 
 class Registry(object):
     """Registry of all configuration properties."""
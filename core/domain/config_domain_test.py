@@ -19,6 +19,7 @@
 __author__ = 'Sean Lip'
 
 from core.domain import config_domain
+from core.domain import config_services
 from core.tests import test_utils
 import schema_utils_test
 
@@ -31,3 +32,14 @@ class ConfigPropertyRegistryTests(test_utils.GenericTestBase):
             schema = config_domain.Registry.get_config_property(
                 property_name).schema
             schema_utils_test.validate_schema(schema)
+
+    def test_get_value_async(self):
+        self.assertEqual(
+            config_domain.BANNED_USERNAMES.get_value_async().get_result(),
+            config_domain.BANNED_USERNAMES.value)
+
+        config_services.set_property(
+            'committer_id', config_domain.BANNED_USERNAMES.name, ['banned'])
+        self.assertEqual(
+            config_domain.BANNED_USERNAMES.get_value_async().get_result(),
+            ['banned'])
@@ -29,13 +29,20 @@ import utils
 class Registry(object):
     """Registry of all JS/CSS library dependencies."""
 
+    # Dict mapping dependency ids to their HTML templates. Populated lazily.
+    _dependency_html = {}
+
     @classmethod
     def get_dependency_html(cls, dependency_id):
         """Returns the HTML template needed to inject this dependency in the
         client webpage.
         """
-        return utils.get_file_contents(os.path.join(
-            feconf.DEPENDENCIES_TEMPLATES_DIR, '%s.html' % dependency_id))
+        if dependency_id not in cls._dependency_html:
+            cls._dependency_html[dependency_id] = utils.get_file_contents(
+                os.path.join(
+                    feconf.DEPENDENCIES_TEMPLATES_DIR,
+                    '%s.html' % dependency_id))
+        return cls._dependency_html[dependency_id]
 
     @classmethod
     def get_angular_modules(cls, dependency_id):
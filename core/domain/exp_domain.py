@@ -304,9 +304,11 @@ class ExplorationCommitLogEntry(object):
         }
 
 
-class Content(object):
+class Content(utils.SlottedObject):
     """Value object representing non-interactive content."""
 
+    __slots__ = ('type', 'value')
+
     def to_dict(self):
         return {'type': self.type, 'value': self.value}
 
@@ -341,9 +343,11 @@ class Content(object):
         return html_cleaner.clean(jinja_utils.parse_string(self.value, params))
 
 
-class RuleSpec(object):
+class RuleSpec(utils.SlottedObject):
     """Value object representing a rule specification."""
 
+    __slots__ = ('rule_type', 'inputs')
+
     def to_dict(self):
         return {
             'rule_type': self.rule_type,
@@ -435,11 +439,13 @@ class RuleSpec(object):
                 param_obj.normalize(param_value)
 
 
-class Outcome(object):
+class Outcome(utils.SlottedObject):
     """Value object representing an outcome of an interaction. An outcome
     consists of a destination state, feedback to show the user, and any
     parameter changes.
     """
+    __slots__ = ('dest', 'feedback', 'param_changes')
+
     def to_dict(self):
         return {
             'dest': self.dest,
@@ -499,13 +505,15 @@ class Outcome(object):
             param_change.validate()
 
 
-class AnswerGroup(object):
+class AnswerGroup(utils.SlottedObject):
     """Value object for an answer group. Answer groups represent a set of rules
     dictating whether a shared feedback should be shared with the user. These
     rules are ORed together. Answer groups may also support fuzzy/implicit
     rules that involve soft matching of answers to a set of training data
     and/or example answers dictated by the creator.
     """
+    __slots__ = ('rule_specs', 'outcome')
+
     def to_dict(self):
         return {
             'rule_specs': [rule_spec.to_dict()
@@ -629,9 +637,13 @@ class Fallback(object):
         self.outcome.validate()
 
 
-class InteractionInstance(object):
+class InteractionInstance(utils.SlottedObject):
     """Value object for an instance of an interaction."""
 
+    __slots__ = (
+        'id', 'customization_args', 'answer_groups', 'default_outcome',
+        'confirmed_unclassified_answers', 'fallbacks')
+
     # The default interaction used for a new state.
     _DEFAULT_INTERACTION_ID = None
 
@@ -1020,9 +1032,11 @@ class SkinInstance(object):
         return sorted(state_names)
 
 
-class State(object):
+class State(utils.SlottedObject):
     """Domain object for a state."""
 
+    __slots__ = ('content', 'param_changes', 'interaction')
+
     NULL_INTERACTION_DICT = {
         'id': None,
         'customization_args': {},
@@ -1211,6 +1225,77 @@ class State(object):
                 default_dest_state_name))
 
 
+class StateGraph(object):
+    """An index of the transitions between the states of an exploration.
+
+    The index holds forward and reverse adjacency lists, so that graph
+    traversals take time linear in the number of states and outcomes. It is a
+    snapshot: it must be rebuilt after the destination of any outcome, or the
+    set of states, changes.
+    """
+
+    def __init__(self, states):
+        """Builds the index for the given dict of states, keyed by name."""
+        # Dict mapping each state name to the list of destinations of its
+        # outcomes (including fallbacks). Terminal states have no outgoing
+        # transitions.
+        self._dests = {}
+        # Dict mapping each destination state name to the set of names of the
+        # states that lead to it through a non-fallback outcome.
+        self._non_fallback_sources = collections.defaultdict(set)
+        # Dict mapping each destination state name to a list of (state_name,
+        # outcome) pairs, one for each outcome that leads to it.
+        self._incoming_outcomes = collections.defaultdict(list)
+
+        for (state_name, state) in states.iteritems():
+            interaction = state.interaction
+            non_fallback_outcomes = interaction.get_all_non_fallback_outcomes()
+            for outcome in non_fallback_outcomes:
+                self._non_fallback_sources[outcome.dest].add(state_name)
+
+            all_outcomes = non_fallback_outcomes + [
+                fallback.outcome for fallback in interaction.fallbacks]
+            for outcome in all_outcomes:
+                self._incoming_outcomes[outcome.dest].append(
+                    (state_name, outcome))
+            self._dests[state_name] = (
+                [] if interaction.is_terminal
+                else [outcome.dest for outcome in all_outcomes])
+
+    def get_reachable_state_names(self, init_state_name):
+        """Returns the set of names of states that can be reached from the
+        given state, including the state itself.
+        """
+        reachable_state_names = set([init_state_name])
+        queue = collections.deque([init_state_name])
+        while queue:
+            for dest in self._dests.get(queue.popleft(), []):
+                if dest not in reachable_state_names:
+                    reachable_state_names.add(dest)
+                    queue.append(dest)
+        return reachable_state_names
+
+    def get_state_names_leading_to(self, target_state_names):
+        """Returns the set of names of states from which one of the given
+        states can be reached without using fallbacks, including the given
+        states themselves.
+        """
+        source_state_names = set(target_state_names)
+        queue = collections.deque(target_state_names)
+        while queue:
+            for source in self._non_fallback_sources.get(queue.popleft(), []):
+                if source not in source_state_names:
+                    source_state_names.add(source)
+                    queue.append(source)
+        return source_state_names
+
+    def get_incoming_outcomes(self, state_name):
+        """Returns a list of (source_state_name, outcome) pairs, one for each
+        outcome whose destination is the given state.
+        """
+        return self._incoming_outcomes.get(state_name, [])
+
+
 class Exploration(object):
     """Domain object for an Oppia exploration."""
 
@@ -1359,10 +1444,18 @@ class Exploration(object):
     def _require_valid_state_name(cls, name):
         utils.require_valid_name(name, 'a state name')
 
-    def validate(self, strict=False):
+    def validate(self, strict=False, changed_state_names=None,
+                 state_graph_changed=True):
         """Validates the exploration before it is committed to storage.
 
         If strict is True, performs advanced validation.
+
+        If changed_state_names is given, the exploration is assumed to have
+        passed validation with the same strictness before the states with
+        these names were changed, and only these states are validated
+        individually. In that case, the checks on the state graph that are
+        done in strict mode are skipped unless state_graph_changed is True.
+        By default, every state is validated.
         """
         if not isinstance(self.title, basestring):
             raise utils.ValidationError(
@@ -1433,9 +1526,18 @@ class Exploration(object):
                 'Expected states to be a dict, received %s' % self.states)
         if not self.states:
             raise utils.ValidationError('This exploration has no states.')
-        for state_name in self.states:
+
+        if changed_state_names is None:
+            states_to_validate = self.states
+        else:
+            states_to_validate = {
+                state_name: self.states[state_name]
+                for state_name in changed_state_names
+                if state_name in self.states}
+
+        for state_name in states_to_validate:
             self._require_valid_state_name(state_name)
-            self.states[state_name].validate(
+            states_to_validate[state_name].validate(
                 self.param_specs,
                 allow_null_interaction=not strict)
 
@@ -1490,7 +1592,7 @@ class Exploration(object):
         # link to this one?
 
         # Check that all state param changes are valid.
-        for state_name, state in self.states.iteritems():
+        for state_name, state in states_to_validate.iteritems():
             for param_change in state.param_changes:
                 param_change.validate()
                 if param_change.name not in self.param_specs:
@@ -1506,8 +1608,8 @@ class Exploration(object):
                         'state \'%s\'.' % (param_change.name, state_name))
 
         # Check that all answer groups, outcomes, and param_changes are valid.
-        all_state_names = self.states.keys()
-        for state in self.states.values():
+        all_state_names = set(self.states.keys())
+        for state in states_to_validate.values():
             interaction = state.interaction
 
             # Check the default destination, if any
@@ -1532,7 +1634,7 @@ class Exploration(object):
                             % param_change.name)
 
         # Check that all fallbacks are valid.
-        for state in self.states.values():
+        for state in states_to_validate.values():
             interaction = state.interaction
 
             for fallback in interaction.fallbacks:
@@ -1567,15 +1669,18 @@ class Exploration(object):
         if strict:
             warnings_list = []
 
-            try:
-                self._verify_all_states_reachable()
-            except utils.ValidationError as e:
-                warnings_list.append(unicode(e))
+            if changed_state_names is None or state_graph_changed:
+                state_graph = self.get_state_graph()
 
-            try:
-                self._verify_no_dead_ends()
-            except utils.ValidationError as e:
-                warnings_list.append(unicode(e))
+                try:
+                    self._verify_all_states_reachable(state_graph)
+                except utils.ValidationError as e:
+                    warnings_list.append(unicode(e))
+
+                try:
+                    self._verify_no_dead_ends(state_graph)
+                except utils.ValidationError as e:
+                    warnings_list.append(unicode(e))
 
             if not self.objective:
                 warnings_list.append(
@@ -1594,76 +1699,48 @@ class Exploration(object):
                     'Please fix the following issues before saving this '
                     'exploration: %s' % warning_str)
 
-    def _verify_all_states_reachable(self):
-        """Verifies that all states are reachable from the initial state."""
-        # This queue stores state names.
-        processed_queue = []
-        curr_queue = [self.init_state_name]
-
-        while curr_queue:
-            curr_state_name = curr_queue[0]
-            curr_queue = curr_queue[1:]
+    def _verify_all_states_reachable(self, state_graph=None):
+        """Verifies that all states are reachable from the initial state.
 
-            if curr_state_name in processed_queue:
-                continue
-
-            processed_queue.append(curr_state_name)
-
-            curr_state = self.states[curr_state_name]
-
-            if not curr_state.interaction.is_terminal:
-                all_outcomes = curr_state.interaction.get_all_outcomes()
-                for outcome in all_outcomes:
-                    dest_state = outcome.dest
-                    if (dest_state not in curr_queue and
-                            dest_state not in processed_queue):
-                        curr_queue.append(dest_state)
+        If state_graph is not given, it is built from the current states.
+        """
+        if state_graph is None:
+            state_graph = self.get_state_graph()
 
-        if len(self.states) != len(processed_queue):
-            unseen_states = list(
-                set(self.states.keys()) - set(processed_queue))
+        unseen_states = list(
+            set(self.states.keys()) -
+            state_graph.get_reachable_state_names(self.init_state_name))
+        if unseen_states:
             raise utils.ValidationError(
                 'The following states are not reachable from the initial '
                 'state: %s' % ', '.join(unseen_states))
 
-    def _verify_no_dead_ends(self):
+    def _verify_no_dead_ends(self, state_graph=None):
         """Verifies that all states can reach a terminal state without using
         fallbacks.
-        """
-        # This queue stores state names.
-        processed_queue = []
-        curr_queue = []
-
-        for (state_name, state) in self.states.iteritems():
-            if state.interaction.is_terminal:
-                curr_queue.append(state_name)
-
-        while curr_queue:
-            curr_state_name = curr_queue[0]
-            curr_queue = curr_queue[1:]
-
-            if curr_state_name in processed_queue:
-                continue
-
-            processed_queue.append(curr_state_name)
-
-            for (state_name, state) in self.states.iteritems():
-                if (state_name not in curr_queue
-                        and state_name not in processed_queue):
-                    all_outcomes = (
-                        state.interaction.get_all_non_fallback_outcomes())
-                    for outcome in all_outcomes:
-                        if outcome.dest == curr_state_name:
-                            curr_queue.append(state_name)
-                            break
 
-        if len(self.states) != len(processed_queue):
-            dead_end_states = list(
-                set(self.states.keys()) - set(processed_queue))
+        If state_graph is not given, it is built from the current states.
+        """
+        if state_graph is None:
+            state_graph = self.get_state_graph()
+
+        terminal_state_names = [
+            state_name for (state_name, state) in self.states.iteritems()
+            if state.interaction.is_terminal]
+        dead_end_states = list(
+            set(self.states.keys()) -
+            state_graph.get_state_names_leading_to(terminal_state_names))
+        if dead_end_states:
             raise utils.ValidationError(
                 'It is impossible to complete the exploration from the '
                 'following states: %s' % ', '.join(dead_end_states))
 
+    def get_state_graph(self):
+        """Returns a StateGraph indexing the transitions between the current
+        states of this exploration.
+        """
+        return StateGraph(self.states)
+
     # Derived attributes of an exploration,
     @property
     def init_state(self):
@@ -1756,21 +1833,16 @@ class Exploration(object):
 
         self._require_valid_state_name(new_state_name)
 
-        self.states[new_state_name] = copy.deepcopy(
-            self.states[old_state_name])
-        del self.states[old_state_name]
+        self.states[new_state_name] = self.states.pop(old_state_name)
 
         if self.init_state_name == old_state_name:
             self.update_init_state_name(new_state_name)
 
         # Find all destinations in the exploration which equal the renamed
         # state, and change the name appropriately.
-        for other_state_name in self.states:
-            other_state = self.states[other_state_name]
-            other_outcomes = other_state.interaction.get_all_outcomes()
-            for outcome in other_outcomes:
-                if outcome.dest == old_state_name:
-                    outcome.dest = new_state_name
+        for (_, outcome) in self.get_state_graph().get_incoming_outcomes(
+                old_state_name):
+            outcome.dest = new_state_name
 
     def delete_state(self, state_name):
         """Deletes the given state."""
@@ -1783,12 +1855,9 @@ class Exploration(object):
 
         # Find all destinations in the exploration which equal the deleted
         # state, and change them to loop back to their containing state.
-        for other_state_name in self.states:
-            other_state = self.states[other_state_name]
-            all_outcomes = other_state.interaction.get_all_outcomes()
-            for outcome in all_outcomes:
-                if outcome.dest == state_name:
-                    outcome.dest = other_state_name
+        for (other_state_name, outcome) in (
+                self.get_state_graph().get_incoming_outcomes(state_name)):
+            outcome.dest = other_state_name
 
         del self.states[state_name]
 
@@ -2441,10 +2510,13 @@ class Exploration(object):
         return utils.yaml_from_dict(exp_dict)
 
     def to_dict(self):
-        """Returns a copy of the exploration as a dictionary. It includes all
-        necessary information to represent the exploration.
+        """Returns the exploration as a dictionary. It includes all necessary
+        information to represent the exploration.
+
+        The dict is built afresh, but its leaf values (e.g. customization args)
+        may be shared with this exploration, so they should not be mutated.
         """
-        return copy.deepcopy({
+        return {
             'id': self.id,
             'title': self.title,
             'category': self.category,
@@ -2461,7 +2533,7 @@ class Exploration(object):
                 'skin_customizations'],
             'states': {state_name: state.to_dict()
                        for (state_name, state) in self.states.iteritems()}
-        })
+        }
 
     def to_player_dict(self):
         """Returns a copy of the exploration suitable for inclusion in the
@@ -2496,9 +2568,15 @@ class Exploration(object):
             state.interaction.id for state in self.states.itervalues()]))
 
 
-class ExplorationSummary(object):
+class ExplorationSummary(utils.SlottedObject):
     """Domain object for an Oppia exploration summary."""
 
+    __slots__ = (
+        'id', 'title', 'category', 'objective', 'language_code', 'tags',
+        'ratings', 'status', 'community_owned', 'owner_ids', 'editor_ids',
+        'viewer_ids', 'contributor_ids', 'version',
+        'exploration_model_created_on', 'exploration_model_last_updated')
+
     def __init__(self, exploration_id, title, category, objective,
                  language_code, tags, ratings, status,
                  community_owned, owner_ids, editor_ids,
@@ -2510,13 +2588,6 @@ class ExplorationSummary(object):
         that the keys need to be strings in order for this dict to be
         JSON-serializable.
         """
-
-        def _get_thumbnail_image_url(category):
-            return '/images/gallery/exploration_background_%s_small.png' % (
-                feconf.CATEGORIES_TO_COLORS[category] if
-                category in feconf.CATEGORIES_TO_COLORS else
-                feconf.DEFAULT_COLOR)
-
         self.id = exploration_id
         self.title = title
         self.category = category
@@ -2533,4 +2604,10 @@ class ExplorationSummary(object):
         self.version = version
         self.exploration_model_created_on = exploration_model_created_on
         self.exploration_model_last_updated = exploration_model_last_updated
-        self.thumbnail_image_url = _get_thumbnail_image_url(category)
+
+    @property
+    def thumbnail_image_url(self):
+        return '/images/gallery/exploration_background_%s_small.png' % (
+            feconf.CATEGORIES_TO_COLORS[self.category] if
+            self.category in feconf.CATEGORIES_TO_COLORS else
+            feconf.DEFAULT_COLOR)
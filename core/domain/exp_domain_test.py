@@ -18,7 +18,9 @@
 
 __author__ = 'Sean Lip'
 
+import datetime
 import os
+import pickle
 
 from core.domain import exp_domain
 from core.domain import exp_services
@@ -2020,6 +2022,111 @@ class StateOperationsUnitTests(test_utils.GenericTestBase):
         exploration.delete_state('END')
         self.assertNotIn('END', exploration.states)
 
+    def test_state_graph(self):
+        """Test the index of transitions between states."""
+        exploration = exp_domain.Exploration.create_default_exploration(
+            'eid', 'Title', 'Category')
+        init_state_name = exploration.init_state_name
+        exploration.add_states(['A', 'B', 'End', 'Island'])
+        for (state_name, dest) in [
+                (init_state_name, 'A'), ('A', 'B'), ('B', 'End'),
+                ('Island', 'A')]:
+            exploration.states[state_name].update_interaction_id('TextInput')
+            exploration.states[
+                state_name].interaction.default_outcome.dest = dest
+        exploration.states['End'].update_interaction_id('EndExploration')
+        exploration.states['End'].interaction.default_outcome = None
+
+        state_graph = exploration.get_state_graph()
+        self.assertEqual(
+            state_graph.get_reachable_state_names(init_state_name),
+            set([init_state_name, 'A', 'B', 'End']))
+        self.assertEqual(
+            state_graph.get_state_names_leading_to(['End']),
+            set([init_state_name, 'A', 'B', 'End', 'Island']))
+        self.assertEqual(
+            state_graph.get_state_names_leading_to(['Island']),
+            set(['Island']))
+        self.assertEqual(
+            sorted([
+                source for (source, _) in
+                state_graph.get_incoming_outcomes('A')]),
+            sorted([init_state_name, 'Island']))
+        self.assertEqual(state_graph.get_incoming_outcomes('Island'), [])
+
+        exploration.objective = 'Objective'
+        with self.assertRaisesRegexp(
+                utils.ValidationError,
+                'The following states are not reachable from the initial '
+                'state: Island'):
+            exploration.validate(strict=True)
+
+        exploration.delete_state('Island')
+        exploration.validate(strict=True)
+
+    def test_incremental_validation(self):
+        """Test validation of only the states that have changed."""
+        exploration = exp_domain.Exploration.create_default_exploration(
+            'eid', 'Title', 'Category')
+        exploration.objective = 'Objective'
+        exploration.add_states(['Invalid', 'Unreachable'])
+        exploration.states[
+            'Invalid'].interaction.default_outcome.dest = 'Fake state'
+
+        exploration.validate(changed_state_names=['Unreachable'])
+        with self.assertRaisesRegexp(
+                utils.ValidationError, 'Fake state is not a valid state'):
+            exploration.validate(changed_state_names=['Invalid'])
+        with self.assertRaisesRegexp(
+                utils.ValidationError, 'Fake state is not a valid state'):
+            exploration.validate()
+
+        exploration.delete_state('Invalid')
+        init_state = exploration.states[exploration.init_state_name]
+        init_state.update_interaction_id('EndExploration')
+        init_state.interaction.default_outcome = None
+        exploration.states['Unreachable'].update_interaction_id('TextInput')
+
+        exploration.validate(
+            strict=True, changed_state_names=[exploration.init_state_name],
+            state_graph_changed=False)
+        with self.assertRaisesRegexp(
+                utils.ValidationError, 'not reachable from the initial state'):
+            exploration.validate(
+                strict=True, changed_state_names=[exploration.init_state_name],
+                state_graph_changed=True)
+
+    def test_validation_of_long_exploration(self):
+        """Test strict validation of an exploration with many states."""
+        num_states = 300
+        exploration = exp_domain.Exploration.create_default_exploration(
+            'eid', 'Title', 'Category')
+        exploration.objective = 'Objective'
+        state_names = [exploration.init_state_name] + [
+            'State %s' % ind for ind in range(1, num_states)]
+        exploration.add_states(state_names[1:])
+        for ind, state_name in enumerate(state_names[:-1]):
+            interaction = exploration.states[state_name].interaction
+            exploration.states[state_name].update_interaction_id('TextInput')
+            interaction.default_outcome.dest = state_names[ind + 1]
+        end_state = exploration.states[state_names[-1]]
+        end_state.update_interaction_id('EndExploration')
+        end_state.interaction.default_outcome = None
+        exploration.validate(strict=True)
+
+        # Make the middle state loop back to the initial state, so that the
+        # second half of the exploration becomes unreachable, and the first
+        # half becomes a dead end.
+        exploration.states[
+            state_names[num_states / 2]].interaction.default_outcome.dest = (
+                state_names[0])
+        with self.assertRaisesRegexp(
+                utils.ValidationError, 'State %s' % (num_states - 1)):
+            exploration._verify_all_states_reachable()
+        with self.assertRaisesRegexp(
+                utils.ValidationError, 'State %s' % (num_states / 2)):
+            exploration._verify_no_dead_ends()
+
 
 class GadgetOperationsUnitTests(test_utils.GenericTestBase):
     """Test methods operating on gadgets."""
@@ -2256,3 +2363,45 @@ class GadgetVisibilityInStatesUnitTests(test_utils.GenericTestBase):
 
         self.assertEqual(len(affected_gadget_instances), 1)
         self.assertEqual(affected_gadget_instances[0].name, 'ATestGadget')
+
+
+class ExplorationSummaryUnitTests(test_utils.GenericTestBase):
+    """Tests for exploration summary domain objects."""
+
+    def test_pickling_round_trip(self):
+        exp_summary = exp_domain.ExplorationSummary(
+            'exp_id', 'title', 'Algebra', 'objective', 'en', ['tag'],
+            feconf.get_empty_ratings(), 'public', False, ['owner_id'], [],
+            [], ['owner_id'], 2, datetime.datetime(2015, 3, 14),
+            datetime.datetime(2015, 3, 15))
+        self.assertFalse(hasattr(exp_summary, '__dict__'))
+
+        for protocol in [0, pickle.HIGHEST_PROTOCOL]:
+            unpickled_summary = pickle.loads(
+                pickle.dumps(exp_summary, protocol))
+            for attribute_name in exp_domain.ExplorationSummary.__slots__:
+                self.assertEqual(
+                    getattr(unpickled_summary, attribute_name),
+                    getattr(exp_summary, attribute_name))
+            self.assertEqual(
+                unpickled_summary.thumbnail_image_url,
+                exp_summary.thumbnail_image_url)
+
+
+class StatePicklingUnitTests(test_utils.GenericTestBase):
+    """Tests for pickling the domain objects that make up states."""
+
+    def test_pickling_round_trip(self):
+        exploration = exp_domain.Exploration.from_yaml(
+            'exp_id', SAMPLE_YAML_CONTENT)
+        state = exploration.states[exploration.init_state_name]
+        self.assertFalse(hasattr(state, '__dict__'))
+        self.assertFalse(hasattr(state.interaction, '__dict__'))
+        self.assertFalse(
+            hasattr(state.interaction.default_outcome, '__dict__'))
+
+        for protocol in [0, pickle.HIGHEST_PROTOCOL]:
+            unpickled_exploration = pickle.loads(
+                pickle.dumps(exploration, protocol))
+            self.assertEqual(
+                unpickled_exploration.to_dict(), exploration.to_dict())
@@ -21,8 +21,9 @@ __author__ = 'Frederik Creemers'
 from core import jobs
 from core.domain import exp_services
 from core.platform import models
-(base_models, exp_models,) = models.Registry.import_models([
-    models.NAMES.base_model, models.NAMES.exploration])
+(base_models, exp_models, job_models,) = models.Registry.import_models([
+    models.NAMES.base_model, models.NAMES.exploration, models.NAMES.job])
+import feconf
 
 
 class SearchRankerRealtimeModel(
@@ -58,19 +59,53 @@ class SearchRankerMRJobManager(
         jobs.BaseMapReduceJobManagerForContinuousComputations):
     """Manager for a MapReduce job that iterates through all explorations and
     recomputes their search rankings.
+
+    Each run only re-indexes the explorations whose rank may have changed
+    since the last completed run of this job. The map phase picks these out
+    using the exploration summaries, and the reduce phase indexes them in
+    batches.
     """
+    # The name of the mapper param that holds the time, in milliseconds, at
+    # which the last completed run of this job was queued. It is the empty
+    # string if there is no such run.
+    _MAPPER_PARAM_KEY_LAST_RUN_QUEUED_MSEC = 'last_run_queued_msec'
+    # The number of distinct reduce keys that the explorations to re-index
+    # are spread over.
+    _NUM_REDUCE_KEYS = 10
+
     @classmethod
     def _get_continuous_computation_class(cls):
         return SearchRanker
 
     @classmethod
     def entity_classes_to_map_over(cls):
-        return [exp_models.ExplorationModel]
+        return [exp_models.ExpSummaryModel]
+
+    @classmethod
+    def enqueue(cls, job_id, additional_job_params=None):
+        job_params = dict(additional_job_params or {})
+        last_completed_job = job_models.JobModel.get_latest_completed_job(
+            cls.__name__)
+        job_params[cls._MAPPER_PARAM_KEY_LAST_RUN_QUEUED_MSEC] = (
+            str(last_completed_job.time_queued_msec) if last_completed_job
+            else '')
+        super(SearchRankerMRJobManager, cls).enqueue(
+            job_id, additional_job_params=job_params)
 
     @staticmethod
     def map(item):
-        exp_services.index_explorations_given_ids([item.id])
+        if item.deleted or item.status == feconf.ACTIVITY_STATUS_PRIVATE:
+            return
+
+        last_run_queued_msec = SearchRankerMRJobManager.get_mapper_param(
+            SearchRankerMRJobManager._MAPPER_PARAM_KEY_LAST_RUN_QUEUED_MSEC)
+        if exp_services.does_search_rank_need_update(
+                item, float(last_run_queued_msec) if last_run_queued_msec
+                else None):
+            yield (
+                str(hash(item.id) % SearchRankerMRJobManager._NUM_REDUCE_KEYS),
+                item.id)
 
     @staticmethod
-    def reduce(key, stringified_values):
-        pass
+    def reduce(key, exp_ids):
+        exp_services.index_explorations_given_ids(exp_ids)
@@ -0,0 +1,105 @@
+# coding: utf-8
+#
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for continuous computations relating to explorations."""
+
+from core import jobs_registry
+from core.domain import exp_jobs_continuous
+from core.domain import exp_services
+from core.domain import rating_services
+from core.domain import rights_manager
+from core.platform import models
+search_services = models.Registry.import_search_services()
+from core.tests import test_utils
+
+
+class ModifiedSearchRanker(exp_jobs_continuous.SearchRanker):
+    """A modified SearchRanker that does not start a new batch job when the
+    previous one has finished.
+    """
+    @classmethod
+    def _get_batch_job_manager_class(cls):
+        return ModifiedSearchRankerMRJobManager
+
+    @classmethod
+    def _kickoff_batch_job_after_previous_one_ends(cls):
+        pass
+
+
+class ModifiedSearchRankerMRJobManager(
+        exp_jobs_continuous.SearchRankerMRJobManager):
+
+    @classmethod
+    def _get_continuous_computation_class(cls):
+        return ModifiedSearchRanker
+
+
+class SearchRankerUnitTests(test_utils.GenericTestBase):
+    """Tests for the search ranking continuous computation."""
+
+    ALL_CONTINUOUS_COMPUTATION_MANAGERS_FOR_TESTS = [ModifiedSearchRanker]
+
+    EXP_ID_1 = 'exp_id_1'
+    EXP_ID_2 = 'exp_id_2'
+    OWNER_ID = 'owner_id'
+    USER_ID = 'user_id'
+
+    def _run_batch_job_and_get_indexed_exp_ids(self):
+        """Runs a batch job of the computation, and returns a sorted list of
+        the ids of the explorations that it indexed.
+        """
+        indexed_exp_ids = []
+
+        def _mock_add_documents_to_index(docs, index):
+            self.assertEqual(index, exp_services.SEARCH_INDEX_EXPLORATIONS)
+            indexed_exp_ids.extend([doc['id'] for doc in docs])
+            return [doc['id'] for doc in docs]
+
+        with self.swap(
+                search_services, 'add_documents_to_index',
+                _mock_add_documents_to_index):
+            ModifiedSearchRanker.start_computation()
+            self.assertEqual(self.count_jobs_in_taskqueue(), 1)
+            self.process_and_flush_pending_tasks()
+            ModifiedSearchRanker.stop_computation(self.OWNER_ID)
+
+        return sorted(indexed_exp_ids)
+
+    def test_only_explorations_with_changed_rank_inputs_are_reindexed(self):
+        with self.swap(
+                jobs_registry, 'ALL_CONTINUOUS_COMPUTATION_MANAGERS',
+                self.ALL_CONTINUOUS_COMPUTATION_MANAGERS_FOR_TESTS):
+            for exp_id in [self.EXP_ID_1, self.EXP_ID_2]:
+                self.save_new_valid_exploration(exp_id, self.OWNER_ID)
+                rights_manager.publish_exploration(self.OWNER_ID, exp_id)
+            self.save_new_valid_exploration('private_exp_id', self.OWNER_ID)
+            self.process_and_flush_pending_tasks()
+
+            # The first run indexes all public explorations.
+            self.assertEqual(
+                self._run_batch_job_and_get_indexed_exp_ids(),
+                [self.EXP_ID_1, self.EXP_ID_2])
+
+            # A rating changes the rank of the rated exploration only.
+            rating_services.assign_rating_to_exploration(
+                self.USER_ID, self.EXP_ID_1, 5)
+            self.assertEqual(
+                self._run_batch_job_and_get_indexed_exp_ids(),
+                [self.EXP_ID_1])
+
+            # Nothing has changed since the last run.
+            self.assertEqual(
+                self._run_batch_job_and_get_indexed_exp_ids(), [])
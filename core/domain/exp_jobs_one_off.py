@@ -22,12 +22,13 @@ import ast
 import logging
 
 from core import jobs
-from core.domain import exp_domain
 from core.domain import exp_services
 from core.domain import rights_manager
 from core.platform import models
-(base_models, exp_models,) = models.Registry.import_models([
-    models.NAMES.base_model, models.NAMES.exploration])
+(base_models, collection_models, exp_models,) = (
+    models.Registry.import_models([
+        models.NAMES.base_model, models.NAMES.collection,
+        models.NAMES.exploration]))
 import feconf
 import utils
 
@@ -81,10 +82,9 @@ class ExpSummariesContributorsOneOffJob(jobs.BaseMapReduceJobManager):
 
     @staticmethod
     def reduce(exp_id, committer_id_list):
-        committer_ids = set(committer_id_list)
-        exp_summary_model = exp_models.ExpSummaryModel.get_by_id(exp_id)
-        exp_summary_model.contributor_ids = list(committer_ids)
-        exp_summary_model.put()
+        exp_summary = exp_services.get_exploration_summary_by_id(exp_id)
+        exp_summary.contributor_ids = list(set(committer_id_list))
+        exp_services.save_exploration_summary(exp_summary)
 
 
 class ExplorationFirstPublishedOneOffJob(jobs.BaseMapReduceJobManager):
@@ -114,9 +114,34 @@ class ExplorationFirstPublishedOneOffJob(jobs.BaseMapReduceJobManager):
             first_published_msec)
 
 
+class LastHumanCommitBackfillOneOffJob(jobs.BaseMapReduceJobManager):
+    """One-off job that records the details of the last commit that was not
+    made by the migration bot on explorations and collections which have not
+    been committed to by a human since these details were first tracked.
+    """
+
+    @classmethod
+    def entity_classes_to_map_over(cls):
+        return [exp_models.ExplorationModel, collection_models.CollectionModel]
+
+    @staticmethod
+    def map(item):
+        if (item.last_human_commit_version is None and
+                item.backfill_last_human_commit()):
+            yield (item.__class__.__name__, item.id)
+
+    @staticmethod
+    def reduce(model_class_name, backfilled_ids):
+        yield (model_class_name, len(backfilled_ids))
+
+
 class IndexAllExplorationsJobManager(jobs.BaseMapReduceJobManager):
     """One-off job that indexes all explorations"""
 
+    # The number of distinct reduce keys that the explorations are spread
+    # over. Each reducer indexes its explorations in batches.
+    _NUM_REDUCE_KEYS = 10
+
     @classmethod
     def entity_classes_to_map_over(cls):
         return [exp_models.ExplorationModel]
@@ -124,7 +149,14 @@ class IndexAllExplorationsJobManager(jobs.BaseMapReduceJobManager):
     @staticmethod
     def map(item):
         if not item.deleted:
-            exp_services.index_explorations_given_ids([item.id])
+            yield (
+                str(hash(item.id) %
+                    IndexAllExplorationsJobManager._NUM_REDUCE_KEYS),
+                item.id)
+
+    @staticmethod
+    def reduce(key, exp_ids):
+        exp_services.index_explorations_given_ids(exp_ids)
 
 
 class ExplorationValidityJobManager(jobs.BaseMapReduceJobManager):
@@ -164,49 +196,91 @@ class ExplorationMigrationJobManager(jobs.BaseMapReduceJobManager):
     an exploration in exp_services automatically performs schema updating. This
     job persists that conversion work, keeping explorations up-to-date and
     improving the load time of new explorations.
+
+    Each exploration is migrated directly from the mapped model, and the
+    summaries of the migrated explorations are updated in bulk by the reduce
+    phase. The output records how long the migrations took, and which
+    explorations could not be migrated.
     """
+    # The name of the mapper param that is True if the migrated explorations
+    # should only be validated, and not saved.
+    _MAPPER_PARAM_KEY_DRY_RUN = 'dry_run'
+    _DRY_RUN = False
+
+    # The output keys of explorations that were migrated, that were only
+    # migrated and validated during a dry run, and that failed to migrate.
+    _OUTPUT_KEY_MIGRATED = 'migrated'
+    _OUTPUT_KEY_VALIDATED = 'validated'
+    _OUTPUT_KEY_FAILED = 'failed'
 
     @classmethod
     def entity_classes_to_map_over(cls):
         return [exp_models.ExplorationModel]
 
+    @classmethod
+    def enqueue(cls, job_id, additional_job_params=None):
+        job_params = dict(additional_job_params or {})
+        job_params[cls._MAPPER_PARAM_KEY_DRY_RUN] = cls._DRY_RUN
+        super(ExplorationMigrationJobManager, cls).enqueue(
+            job_id, additional_job_params=job_params)
+
     @staticmethod
     def map(item):
         if item.deleted:
             return
 
-        # Do not upgrade explorations that fail non-strict validation.
-        old_exploration = exp_services.get_exploration_by_id(item.id)
+        # Explorations that already use the latest states schema version do
+        # not need to be migrated.
+        if (item.states_schema_version ==
+                feconf.CURRENT_EXPLORATION_STATES_SCHEMA_VERSION):
+            return
+
+        dry_run = ExplorationMigrationJobManager.get_mapper_param(
+            ExplorationMigrationJobManager._MAPPER_PARAM_KEY_DRY_RUN)
+        start_time_msec = utils.get_current_time_in_millisecs()
         try:
-            old_exploration.validate()
+            exploration = (
+                exp_services.migrate_exploration_model_to_latest_states_schema(
+                    item, dry_run=dry_run))
         except Exception as e:
             logging.error(
-                'Exploration %s failed non-strict validation: %s' %
-                (item.id, e))
+                'Exploration %s could not be migrated: %s' % (item.id, e))
+            yield (
+                ExplorationMigrationJobManager._OUTPUT_KEY_FAILED,
+                (item.id, unicode(e).encode('utf-8')))
             return
 
-        # If the exploration model being stored in the datastore is not the
-        # most up-to-date states schema version, then update it.
-        if (item.states_schema_version !=
-                feconf.CURRENT_EXPLORATION_STATES_SCHEMA_VERSION):
-            # Note: update_exploration does not need to apply a change list in
-            # order to perform a migration. See the related comment in
-            # exp_services.apply_change_list for more information.
-            commit_cmds = [{
-                'cmd': exp_domain.CMD_MIGRATE_STATES_SCHEMA_TO_LATEST_VERSION,
-                'from_version': str(item.states_schema_version),
-                'to_version': str(
-                    feconf.CURRENT_EXPLORATION_STATES_SCHEMA_VERSION)
-            }]
-            exp_services.update_exploration(
-                feconf.MIGRATION_BOT_USERNAME, item.id, commit_cmds,
-                'Update exploration states from schema version %d to %d.' % (
-                    item.states_schema_version,
-                    feconf.CURRENT_EXPLORATION_STATES_SCHEMA_VERSION))
+        yield (
+            ExplorationMigrationJobManager._OUTPUT_KEY_VALIDATED if dry_run
+            else ExplorationMigrationJobManager._OUTPUT_KEY_MIGRATED, (
+                item.id, exploration.version,
+                utils.get_current_time_in_millisecs() - start_time_msec))
 
     @staticmethod
-    def reduce(key, values):
-        yield (key, values)
+    def reduce(key, stringified_values):
+        values = [ast.literal_eval(v) for v in stringified_values]
+        if key == ExplorationMigrationJobManager._OUTPUT_KEY_FAILED:
+            yield (key, values)
+            return
+
+        if key == ExplorationMigrationJobManager._OUTPUT_KEY_MIGRATED:
+            exp_services.update_exploration_summary_versions({
+                exp_id: version for (exp_id, version, _) in values})
+
+        durations_msec = [duration_msec for (_, _, duration_msec) in values]
+        yield (key, {
+            'count': len(values),
+            'mean_msec': sum(durations_msec) / len(durations_msec),
+            'max_msec': max(durations_msec),
+        })
+
+
+class ExplorationMigrationDryRunJobManager(ExplorationMigrationJobManager):
+    """Like ExplorationMigrationJobManager, but only migrates and validates the
+    explorations, without saving them. This may be used to find out how long
+    a migration will take, and which explorations will fail it.
+    """
+    _DRY_RUN = True
 
 
 class InteractionAuditOneOffJob(jobs.BaseMapReduceJobManager):
@@ -29,9 +29,10 @@ from core.platform import models
 from core.tests import test_utils
 import feconf
 import utils
-(job_models, exp_models,) = models.Registry.import_models([
-   models.NAMES.job, models.NAMES.exploration])
+(base_models, job_models, exp_models,) = models.Registry.import_models([
+   models.NAMES.base_model, models.NAMES.job, models.NAMES.exploration])
 search_services = models.Registry.import_search_services()
+transaction_services = models.Registry.import_transaction_services()
 
 
 class ExpSummariesCreationOneOffJobTest(test_utils.GenericTestBase):
@@ -420,6 +421,86 @@ class ExpSummariesContributorsOneOffJobTest(test_utils.GenericTestBase):
             feconf.MIGRATION_BOT_USERNAME, exploration_summary.contributor_ids)
 
 
+class LastHumanCommitBackfillOneOffJobTest(test_utils.GenericTestBase):
+
+    EXP_ID = 'exp_id'
+
+    def setUp(self):
+        super(LastHumanCommitBackfillOneOffJobTest, self).setUp()
+
+        self.signup(self.OWNER_EMAIL, self.OWNER_USERNAME)
+        self.owner_id = self.get_user_id_from_email(self.OWNER_EMAIL)
+
+    def test_standard_operation(self):
+        self.save_new_valid_exploration(self.EXP_ID, self.owner_id)
+        v1_created_on_ms = exp_services.get_exploration_snapshots_metadata(
+            self.EXP_ID)[0]['created_on_ms']
+
+        # A commit by the migration bot does not change the details of the
+        # last human commit.
+        exploration_model = exp_models.ExplorationModel.get(self.EXP_ID)
+        exploration_model.title = 'New title'
+        exploration_model.commit(
+            feconf.MIGRATION_BOT_USER_ID, 'Changed title.', [])
+
+        exploration_model = exp_models.ExplorationModel.get(self.EXP_ID)
+        self.assertEqual(exploration_model.version, 2)
+        self.assertEqual(
+            exploration_model.last_human_committer_id, self.owner_id)
+        self.assertEqual(exploration_model.last_human_commit_version, 1)
+        self.assertIsNotNone(exploration_model.last_human_commit_msec)
+
+        # Simulate an exploration that was last committed to by a human
+        # before these details were tracked.
+        exploration_model.last_human_committer_id = None
+        exploration_model.last_human_commit_version = None
+        exploration_model.last_human_commit_msec = None
+        super(base_models.VersionedModel, exploration_model).put()
+        self.assertEqual(
+            exp_services._get_last_updated_by_human_ms(self.EXP_ID),
+            v1_created_on_ms)
+
+        job_id = exp_jobs_one_off.LastHumanCommitBackfillOneOffJob.create_new()
+        exp_jobs_one_off.LastHumanCommitBackfillOneOffJob.enqueue(job_id)
+        self.assertEqual(self.count_jobs_in_taskqueue(), 1)
+        self.process_and_flush_pending_tasks()
+
+        exploration_model = exp_models.ExplorationModel.get(self.EXP_ID)
+        self.assertEqual(exploration_model.version, 2)
+        self.assertEqual(
+            exploration_model.last_human_committer_id, self.owner_id)
+        self.assertEqual(exploration_model.last_human_commit_version, 1)
+        self.assertEqual(
+            exploration_model.last_human_commit_msec, v1_created_on_ms)
+        self.assertEqual(
+            exp_services._get_last_updated_by_human_ms(self.EXP_ID),
+            v1_created_on_ms)
+
+    def test_backfill_skips_models_committed_to_since_they_were_read(self):
+        self.save_new_valid_exploration(self.EXP_ID, self.owner_id)
+        exploration_model = exp_models.ExplorationModel.get(self.EXP_ID)
+        exploration_model.last_human_committer_id = None
+        exploration_model.last_human_commit_version = None
+        exploration_model.last_human_commit_msec = None
+        super(base_models.VersionedModel, exploration_model).put()
+
+        stale_exploration_model = exp_models.ExplorationModel.get(self.EXP_ID)
+        exploration_model.title = 'New title'
+        exploration_model.commit(
+            feconf.MIGRATION_BOT_USER_ID, 'Changed title.', [])
+
+        self.assertFalse(stale_exploration_model.backfill_last_human_commit())
+        exploration_model = exp_models.ExplorationModel.get(self.EXP_ID)
+        self.assertEqual(exploration_model.version, 2)
+        self.assertEqual(exploration_model.title, 'New title')
+        self.assertIsNone(exploration_model.last_human_commit_version)
+
+        self.assertTrue(exploration_model.backfill_last_human_commit())
+        exploration_model = exp_models.ExplorationModel.get(self.EXP_ID)
+        self.assertEqual(exploration_model.title, 'New title')
+        self.assertEqual(exploration_model.last_human_commit_version, 1)
+
+
 class OneOffReindexExplorationsJobTest(test_utils.GenericTestBase):
 
     EXP_ID = 'exp_id'
@@ -563,10 +644,104 @@ class ExplorationMigrationJobTest(test_utils.GenericTestBase):
         exp_jobs_one_off.ExplorationMigrationJobManager.enqueue(job_id)
 
         # This running without errors indicates the deleted exploration is
-        # being ignored, since otherwise exp_services.get_exploration_by_id
-        # (used within the job) will raise an error.
+        # being ignored, since otherwise committing the migrated model (within
+        # the job) will raise an error.
         self.process_and_flush_pending_tasks()
 
         # Ensure the exploration is still deleted.
         with self.assertRaisesRegexp(Exception, 'Entity .* not found'):
             exp_services.get_exploration_by_id(self.NEW_EXP_ID)
+
+    def _run_migration_job_and_get_output(self, job_class):
+        """Runs the given migration job, and returns a dict mapping the keys
+        of its output to the corresponding values.
+        """
+        job_id = job_class.create_new()
+        job_class.enqueue(job_id)
+        self.process_and_flush_pending_tasks()
+        return dict(job_class.get_output(job_id))
+
+    def test_migration_job_updates_exploration_summary_version(self):
+        self.save_new_exp_with_states_schema_v0(
+            self.NEW_EXP_ID, self.ALBERT_ID, self.EXP_TITLE)
+        exp_services.create_exploration_summary(self.NEW_EXP_ID, None)
+
+        output = self._run_migration_job_and_get_output(
+            exp_jobs_one_off.ExplorationMigrationJobManager)
+        self.assertEqual(output['migrated']['count'], 1)
+        self.assertNotIn('failed', output)
+
+        exploration_model = exp_models.ExplorationModel.get(self.NEW_EXP_ID)
+        self.assertEqual(exploration_model.version, 2)
+        self.assertEqual(
+            exploration_model.states_schema_version,
+            feconf.CURRENT_EXPLORATION_STATES_SCHEMA_VERSION)
+        self.assertEqual(
+            exp_services.get_exploration_summary_by_id(
+                self.NEW_EXP_ID).version, 2)
+
+    def test_dry_run_migration_job_does_not_save_explorations(self):
+        self.save_new_exp_with_states_schema_v0(
+            self.NEW_EXP_ID, self.ALBERT_ID, self.EXP_TITLE)
+
+        output = self._run_migration_job_and_get_output(
+            exp_jobs_one_off.ExplorationMigrationDryRunJobManager)
+        self.assertEqual(output['validated']['count'], 1)
+        self.assertNotIn('migrated', output)
+
+        exploration_model = exp_models.ExplorationModel.get(self.NEW_EXP_ID)
+        self.assertEqual(exploration_model.version, 1)
+        self.assertEqual(exploration_model.states_schema_version, 0)
+
+    def test_migration_job_reports_invalid_explorations(self):
+        self.save_new_exp_with_states_schema_v0(
+            self.NEW_EXP_ID, self.ALBERT_ID, self.EXP_TITLE)
+
+        def _mock_validate(unused_self, strict=False):
+            raise utils.ValidationError('Invalid exploration.')
+
+        with self.swap(exp_domain.Exploration, 'validate', _mock_validate):
+            output = self._run_migration_job_and_get_output(
+                exp_jobs_one_off.ExplorationMigrationJobManager)
+        self.assertEqual(
+            output['failed'], [[self.NEW_EXP_ID, 'Invalid exploration.']])
+        self.assertNotIn('migrated', output)
+
+        exploration_model = exp_models.ExplorationModel.get(self.NEW_EXP_ID)
+        self.assertEqual(exploration_model.version, 1)
+        self.assertEqual(exploration_model.states_schema_version, 0)
+
+    def test_migration_commit_succeeds_when_its_transaction_is_retried(self):
+        self.save_new_exp_with_states_schema_v0(
+            self.NEW_EXP_ID, self.ALBERT_ID, self.EXP_TITLE)
+        run_in_transaction = transaction_services.run_in_transaction
+        failed_attempts = []
+
+        def _run_in_transaction_after_a_failed_attempt(fn, *args, **kwargs):
+            """Simulates a retry of the first transaction, by rolling back its
+            first attempt after running it.
+            """
+            def _fail_after_running_fn():
+                fn(*args, **kwargs)
+                raise Exception('Transaction collision.')
+
+            if not failed_attempts:
+                failed_attempts.append(fn)
+                with self.assertRaisesRegexp(
+                        Exception, 'Transaction collision.'):
+                    run_in_transaction(_fail_after_running_fn)
+            return run_in_transaction(fn, *args, **kwargs)
+
+        exploration_model = exp_models.ExplorationModel.get(self.NEW_EXP_ID)
+        with self.swap(
+                transaction_services, 'run_in_transaction',
+                _run_in_transaction_after_a_failed_attempt):
+            exp_services.migrate_exploration_model_to_latest_states_schema(
+                exploration_model)
+        self.assertEqual(len(failed_attempts), 1)
+
+        exploration_model = exp_models.ExplorationModel.get(self.NEW_EXP_ID)
+        self.assertEqual(exploration_model.version, 2)
+        self.assertEqual(
+            exploration_model.states_schema_version,
+            feconf.CURRENT_EXPLORATION_STATES_SCHEMA_VERSION)
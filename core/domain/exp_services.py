@@ -26,10 +26,11 @@ __author__ = 'Sean Lip'
 
 import copy
 import datetime
+import hashlib
+import json
 import logging
 import os
 import pprint
-import StringIO
 import zipfile
 
 from core.domain import exp_domain
@@ -38,9 +39,11 @@ from core.domain import rights_manager
 from core.domain import user_services
 from core.platform import models
 import feconf
+futures_services = models.Registry.import_futures_services()
 memcache_services = models.Registry.import_memcache_services()
 search_services = models.Registry.import_search_services()
 taskqueue_services = models.Registry.import_taskqueue_services()
+transaction_services = models.Registry.import_transaction_services()
 (exp_models,) = models.Registry.import_models([models.NAMES.exploration])
 import utils
 
@@ -50,6 +53,31 @@ CMD_CREATE_NEW = 'create_new'
 # Name for the exploration search index.
 SEARCH_INDEX_EXPLORATIONS = 'explorations'
 
+# The memcache key for the generation of the cached search results.
+_SEARCH_RESULTS_GENERATION_MEMCACHE_KEY = 'exp-search-results-generation'
+
+# The prefix of the memcache keys for exploration summaries. Summaries are
+# pickled as a tuple of their attributes, so this must be changed whenever
+# the attributes of exp_domain.ExplorationSummary change.
+_EXP_SUMMARY_MEMCACHE_KEY_PREFIX = 'exp-summary-v1'
+
+# The state properties whose changes may change the transitions between the
+# states of an exploration.
+_STATE_PROPERTIES_AFFECTING_STATE_GRAPH = [
+    exp_domain.STATE_PROPERTY_INTERACTION_ID,
+    exp_domain.STATE_PROPERTY_INTERACTION_ANSWER_GROUPS,
+    exp_domain.STATE_PROPERTY_INTERACTION_DEFAULT_OUTCOME,
+    exp_domain.STATE_PROPERTY_INTERACTION_FALLBACKS,
+]
+# The commands that only affect the gadgets of an exploration. The gadgets are
+# always validated in full.
+_GADGET_CMDS = [
+    exp_domain.CMD_ADD_GADGET,
+    exp_domain.CMD_RENAME_GADGET,
+    exp_domain.CMD_DELETE_GADGET,
+    exp_domain.CMD_EDIT_GADGET_PROPERTY,
+]
+
 # Constants used to initialize EntityChangeListSummarizer
 _BASE_ENTITY_STATE = 'state'
 _BASE_ENTITY_GADGET = 'gadget'
@@ -102,6 +130,23 @@ def _get_exploration_memcache_key(exploration_id, version=None):
         return 'exploration:%s' % exploration_id
 
 
+def _get_exploration_player_json_memcache_key(exploration_id, version):
+    """Returns a memcache key for the JSON-encoded player dict of the given
+    version of an exploration.
+    """
+    return 'exploration-player-json:%s:%s' % (exploration_id, version)
+
+
+def _get_exploration_summary_memcache_key(exploration_id):
+    """Returns a memcache key for an exploration summary."""
+    return '%s:%s' % (_EXP_SUMMARY_MEMCACHE_KEY_PREFIX, exploration_id)
+
+
+def _delete_exploration_summaries_from_memcache(exp_ids):
+    memcache_services.delete_multi([
+        _get_exploration_summary_memcache_key(exp_id) for exp_id in exp_ids])
+
+
 def get_exploration_from_model(exploration_model, run_conversion=True):
     """Returns an Exploration domain object given an exploration model loaded
     from the datastore.
@@ -142,6 +187,23 @@ def get_exploration_from_model(exploration_model, run_conversion=True):
         last_updated=exploration_model.last_updated)
 
 
+def get_exploration_player_json(exploration):
+    """Returns the JSON encoding of exploration.to_player_dict(), suitable
+    for inclusion in a JSON response.
+
+    Since a version of an exploration never changes, the encoding is computed
+    once per (exploration id, version) and cached in memcache.
+    """
+    memcache_key = _get_exploration_player_json_memcache_key(
+        exploration.id, exploration.version)
+    player_json = memcache_services.get_multi([memcache_key]).get(memcache_key)
+    if player_json is None:
+        player_json = json.dumps(
+            exploration.to_player_dict(), cls=utils.JSONEncoderForHTML)
+        memcache_services.set_multi({memcache_key: player_json})
+    return player_json
+
+
 def get_exploration_summary_from_model(exp_summary_model):
     return exp_domain.ExplorationSummary(
         exp_summary_model.id, exp_summary_model.title,
@@ -166,29 +228,65 @@ def get_exploration_by_id(exploration_id, strict=True, version=None):
     if memcached_exploration is not None:
         return memcached_exploration
     else:
-        exploration_model = exp_models.ExplorationModel.get(
+        return _get_exploration_from_datastore(
+            exploration_id, strict, version)
+
+
+@futures_services.tasklet
+def get_exploration_by_id_async(exploration_id, strict=True, version=None):
+    """Like get_exploration_by_id(), but returns a future whose result is the
+    exploration.
+
+    The memcache lookup, and the datastore read that follows it on a cache
+    miss, are issued concurrently with other pending reads.
+    """
+    exploration_memcache_key = _get_exploration_memcache_key(
+        exploration_id, version=version)
+    memcached_items = yield memcache_services.get_multi_async(
+        [exploration_memcache_key])
+    exploration = memcached_items.get(exploration_memcache_key)
+
+    if exploration is None:
+        exploration_model = yield exp_models.ExplorationModel.get_async(
             exploration_id, strict=strict, version=version)
-        if exploration_model:
-            exploration = get_exploration_from_model(exploration_model)
-            memcache_services.set_multi({
-                exploration_memcache_key: exploration})
-            return exploration
-        else:
-            return None
+        exploration = _get_exploration_from_model_and_memcache_it(
+            exploration_id, version, exploration_model)
+    raise futures_services.Return(exploration)
 
 
-def get_exploration_summary_by_id(exploration_id):
-    """Returns a domain object representing an exploration summary."""
-    # TODO(msl): Maybe use memcache similarly to get_exploration_by_id.
-    exp_summary_model = exp_models.ExpSummaryModel.get(
-        exploration_id)
-    if exp_summary_model:
-        exp_summary = get_exploration_summary_from_model(exp_summary_model)
-        return exp_summary
+def _get_exploration_from_datastore(exploration_id, strict, version):
+    """Loads an exploration from the datastore and adds it to memcache.
+
+    Returns None if the exploration does not exist and strict is False.
+    """
+    return _get_exploration_from_model_and_memcache_it(
+        exploration_id, version, exp_models.ExplorationModel.get(
+            exploration_id, strict=strict, version=version))
+
+
+def _get_exploration_from_model_and_memcache_it(
+        exploration_id, version, exploration_model):
+    """Returns the exploration domain object for the given model, which was
+    loaded for the given exploration id and version, after adding it to
+    memcache. Returns None if the model is None.
+    """
+    if exploration_model:
+        exploration = get_exploration_from_model(exploration_model)
+        memcache_services.set_multi({
+            _get_exploration_memcache_key(
+                exploration_id, version=version): exploration})
+        return exploration
     else:
         return None
 
 
+def get_exploration_summary_by_id(exploration_id):
+    """Returns a domain object representing an exploration summary, or None
+    if there is no such summary.
+    """
+    return get_exploration_summaries_matching_ids([exploration_id])[0]
+
+
 def get_multiple_explorations_by_id(exp_ids, strict=True):
     """Returns a dict of domain objects representing explorations with the
     given ids as keys. If an exp_id is not present it is not included in the
@@ -296,10 +394,66 @@ def get_exploration_summaries_matching_ids(exp_ids):
     """Given a list of exploration ids, return a list with the corresponding
     summary domain objects (or None if the corresponding summary does not
     exist).
+
+    The summaries are read from memcache where possible. The remaining ones
+    are fetched from the datastore in a single batch, and added to memcache.
     """
+    memcache_keys = [
+        _get_exploration_summary_memcache_key(exp_id) for exp_id in exp_ids]
+    memcached_summaries = memcache_services.get_multi(memcache_keys)
+
+    uncached_exp_ids = [
+        exp_id for (exp_id, memcache_key) in zip(exp_ids, memcache_keys)
+        if memcache_key not in memcached_summaries]
+    if uncached_exp_ids:
+        uncached_summaries = [
+            get_exploration_summary_from_model(model)
+            for model in exp_models.ExpSummaryModel.get_multi(
+                uncached_exp_ids)
+            if model]
+        memcache_update = {
+            _get_exploration_summary_memcache_key(exp_summary.id): exp_summary
+            for exp_summary in uncached_summaries}
+        if memcache_update:
+            memcache_services.set_multi(memcache_update)
+        memcached_summaries.update(memcache_update)
+
     return [
-        (get_exploration_summary_from_model(model) if model else None)
-        for model in exp_models.ExpSummaryModel.get_multi(exp_ids)]
+        memcached_summaries.get(memcache_key) for memcache_key in memcache_keys]
+
+
+def _get_search_results_generation(increment=False):
+    """Returns the current generation of the cached search results, after
+    incrementing it if increment is True. Returns None if memcache is not
+    available.
+
+    The generation is part of the memcache keys of cached search results, so
+    incrementing it invalidates all of them. If the counter is evicted from
+    memcache, it restarts from the current time in milliseconds, so that it
+    does not return to a generation that has already been used.
+    """
+    return memcache_services.incr(
+        _SEARCH_RESULTS_GENERATION_MEMCACHE_KEY, delta=(1 if increment else 0),
+        initial_value=int(utils.get_current_time_in_millisecs()))
+
+
+def _invalidate_search_results_cache():
+    """Invalidates all the cached search results. This should be called
+    whenever an exploration summary or search document changes.
+    """
+    _get_search_results_generation(increment=True)
+
+
+def _get_search_results_memcache_key(query_string, cursor, generation):
+    """Returns the memcache key for the results of the given search query.
+
+    Queries that differ only in whitespace share a key. Note that the
+    category and language filters of a gallery search are part of its query
+    string.
+    """
+    normalized_query_string = u' '.join(query_string.split())
+    return 'exp-search-results:%s:%s' % (generation, hashlib.sha1(
+        json.dumps([normalized_query_string, cursor])).hexdigest())
 
 
 def get_exploration_summaries_matching_query(query_string, cursor=None):
@@ -310,26 +464,45 @@ def get_exploration_summaries_matching_query(query_string, cursor=None):
     at least that many, otherwise it returns all remaining results. (If this
     behaviour does not occur, an error will be logged.) The method also returns
     a search cursor.
+
+    The ids of the results and the search cursor are cached in memcache for a
+    short time, and are invalidated when any exploration summary or search
+    document changes.
     """
+    generation = _get_search_results_generation()
+    memcache_key = (
+        _get_search_results_memcache_key(query_string, cursor, generation)
+        if generation is not None else None)
+    if memcache_key is not None:
+        cached_results = memcache_services.get_multi(
+            [memcache_key]).get(memcache_key)
+        if cached_results is not None:
+            return ([
+                exp_summary for exp_summary in
+                get_exploration_summaries_matching_ids(
+                    cached_results['exp_ids'])
+                if exp_summary is not None
+            ], cached_results['search_cursor'])
+
     MAX_ITERATIONS = 10
-    summary_models = []
+    exp_summaries = []
     search_cursor = cursor
 
     for i in range(MAX_ITERATIONS):
-        remaining_to_fetch = feconf.GALLERY_PAGE_SIZE - len(summary_models)
+        remaining_to_fetch = feconf.GALLERY_PAGE_SIZE - len(exp_summaries)
 
         exp_ids, search_cursor = search_explorations(
             query_string, remaining_to_fetch, cursor=search_cursor)
 
         invalid_exp_ids = []
-        for ind, model in enumerate(
-                exp_models.ExpSummaryModel.get_multi(exp_ids)):
-            if model is not None:
-                summary_models.append(model)
+        for ind, exp_summary in enumerate(
+                get_exploration_summaries_matching_ids(exp_ids)):
+            if exp_summary is not None:
+                exp_summaries.append(exp_summary)
             else:
                 invalid_exp_ids.append(exp_ids[ind])
 
-        if len(summary_models) == feconf.GALLERY_PAGE_SIZE or (
+        if len(exp_summaries) == feconf.GALLERY_PAGE_SIZE or (
                 search_cursor is None):
             break
         else:
@@ -337,60 +510,137 @@ def get_exploration_summaries_matching_query(query_string, cursor=None):
                 'Search index contains stale exploration ids: %s' %
                 ', '.join(invalid_exp_ids))
 
-    if (len(summary_models) < feconf.GALLERY_PAGE_SIZE
+    if (len(exp_summaries) < feconf.GALLERY_PAGE_SIZE
             and search_cursor is not None):
         logging.error(
             'Could not fulfill search request for query string %s; at least '
             '%s retries were needed.' % (query_string, MAX_ITERATIONS))
 
-    return ([
-        get_exploration_summary_from_model(summary_model)
-        for summary_model in summary_models
-    ], search_cursor)
+    if memcache_key is not None:
+        memcache_services.set_multi({
+            memcache_key: {
+                'exp_ids': [exp_summary.id for exp_summary in exp_summaries],
+                'search_cursor': search_cursor,
+            }
+        }, timeout_secs=feconf.SEARCH_RESULTS_MEMCACHE_TIMEOUT_SECS)
+
+    return (exp_summaries, search_cursor)
+
+
+def iterate_non_private_exploration_summaries(
+        batch_size=feconf.SUMMARY_ITERATION_BATCH_SIZE):
+    """Yields all non-private exploration summary domain objects, ordered by
+    id. The summaries are fetched from the datastore batch_size at a time.
+    """
+    for exp_summary_model in exp_models.ExpSummaryModel.iterate_non_private(
+            batch_size=batch_size):
+        yield get_exploration_summary_from_model(exp_summary_model)
+
+
+def iterate_all_exploration_summaries(
+        batch_size=feconf.SUMMARY_ITERATION_BATCH_SIZE):
+    """Yields all exploration summary domain objects, ordered by id. The
+    summaries are fetched from the datastore batch_size at a time.
+    """
+    for exp_summary_model in exp_models.ExpSummaryModel.iterate_all(
+            batch_size=batch_size):
+        yield get_exploration_summary_from_model(exp_summary_model)
 
 
 def get_non_private_exploration_summaries():
     """Returns a dict with all non-private exploration summary domain objects,
     keyed by their id.
+
+    Note that this holds every summary in memory; callers that only need to
+    look at each summary once should use
+    iterate_non_private_exploration_summaries() instead.
     """
-    return _get_exploration_summary_dicts_from_models(
-        exp_models.ExpSummaryModel.get_non_private())
+    return {
+        exp_summary.id: exp_summary
+        for exp_summary in iterate_non_private_exploration_summaries()}
 
 
 def get_all_exploration_summaries():
     """Returns a dict with all exploration summary domain objects,
     keyed by their id.
+
+    Note that this holds every summary in memory; callers that only need to
+    look at each summary once should use iterate_all_exploration_summaries()
+    instead.
     """
-    return _get_exploration_summary_dicts_from_models(
-        exp_models.ExpSummaryModel.get_all())
+    return {
+        exp_summary.id: exp_summary
+        for exp_summary in iterate_all_exploration_summaries()}
 
 
 # Methods for exporting states and explorations to other formats.
-def export_to_zip_file(exploration_id, version=None):
-    """Returns a ZIP archive of the exploration."""
-    exploration = get_exploration_by_id(exploration_id, version=version)
-    yaml_repr = exploration.to_yaml()
+class _ZipChunkBuffer(object):
+    """A write-only file-like object for zipfile.ZipFile that holds only the
+    bytes written since its contents were last popped.
+    """
 
-    o = StringIO.StringIO()
-    with zipfile.ZipFile(o, mode='w', compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr('%s.yaml' % exploration.title, yaml_repr)
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
 
-        fs = fs_domain.AbstractFileSystem(
-            fs_domain.ExplorationFileSystem(exploration_id))
-        dir_list = fs.listdir('')
-        for filepath in dir_list:
-            # Currently, the version number of all files is 1, since they are
-            # not modifiable post-upload.
-            # TODO(sll): When allowing editing of files, implement versioning
-            # for them.
-            file_contents = fs.get(filepath, version=1)
+    def write(self, data):
+        self._chunks.append(data)
+        self._position += len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
 
+    def pop_contents(self):
+        """Returns the bytes written since the last call, and discards
+        them.
+        """
+        contents = ''.join(self._chunks)
+        self._chunks = []
+        return contents
+
+
+def export_to_zip_file_chunks(exploration_id, version=None):
+    """Yields a ZIP archive of the exploration as a sequence of bytestrings.
+
+    The assets of the exploration are fetched feconf.EXPORT_ASSETS_BATCH_SIZE
+    at a time, and each file is yielded as soon as it has been compressed, so
+    the whole archive is never held in memory.
+    """
+    exploration = get_exploration_by_id(exploration_id, version=version)
+    yaml_repr = exploration.to_yaml()
+
+    output = _ZipChunkBuffer()
+    zf = zipfile.ZipFile(output, mode='w', compression=zipfile.ZIP_DEFLATED)
+    zf.writestr('%s.yaml' % exploration.title, yaml_repr)
+    yield output.pop_contents()
+
+    fs = fs_domain.AbstractFileSystem(
+        fs_domain.ExplorationFileSystem(exploration_id))
+    dir_list = fs.listdir('')
+    for ind in xrange(0, len(dir_list), feconf.EXPORT_ASSETS_BATCH_SIZE):
+        filepaths = dir_list[ind:ind + feconf.EXPORT_ASSETS_BATCH_SIZE]
+        # The latest version of each file is exported. Currently, this is
+        # always version 1, since files are not modifiable post-upload.
+        # TODO(sll): When allowing editing of files, implement versioning
+        # for them.
+        for (filepath, file_contents) in zip(
+                filepaths, fs.get_multi(filepaths)):
             str_filepath = 'assets/%s' % filepath
             assert isinstance(str_filepath, str)
             unicode_filepath = str_filepath.decode('utf-8')
             zf.writestr(unicode_filepath, file_contents)
+            yield output.pop_contents()
+
+    zf.close()
+    yield output.pop_contents()
+
 
-    return o.getvalue()
+def export_to_zip_file(exploration_id, version=None):
+    """Returns a ZIP archive of the exploration."""
+    return ''.join(export_to_zip_file_chunks(exploration_id, version=version))
 
 
 def export_states_to_yaml(exploration_id, version=None, width=80):
@@ -754,19 +1004,85 @@ def get_summary_of_change_list(base_exploration, change_list):
     }
 
 
+def _get_validation_scope(change_list):
+    """Returns a pair (changed_state_names, state_graph_changed) describing
+    which parts of an exploration need to be validated again after the given
+    change list has been applied to a valid version of it.
+
+    changed_state_names is the set of the names (after the change list has
+    been applied) of the states that were added or edited. It is None if
+    every state needs to be validated, e.g. because the change list migrates
+    the states schema or edits the parameter specs, or because it is empty.
+    state_graph_changed is True if the transitions between states may have
+    changed.
+    """
+    if not change_list:
+        return (None, True)
+
+    changed_state_names = set()
+    state_graph_changed = False
+    for change_dict in change_list:
+        cmd = change_dict.get('cmd')
+        if cmd == exp_domain.CMD_ADD_STATE:
+            changed_state_names.add(change_dict['state_name'])
+            state_graph_changed = True
+        elif cmd == exp_domain.CMD_RENAME_STATE:
+            changed_state_names.discard(change_dict['old_state_name'])
+            changed_state_names.add(change_dict['new_state_name'])
+            state_graph_changed = True
+        elif cmd == exp_domain.CMD_DELETE_STATE:
+            changed_state_names.discard(change_dict['state_name'])
+            state_graph_changed = True
+        elif cmd == exp_domain.CMD_EDIT_STATE_PROPERTY:
+            changed_state_names.add(change_dict['state_name'])
+            if (change_dict['property_name'] in
+                    _STATE_PROPERTIES_AFFECTING_STATE_GRAPH):
+                state_graph_changed = True
+        elif cmd == exp_domain.CMD_EDIT_EXPLORATION_PROPERTY:
+            if change_dict['property_name'] == 'param_specs':
+                return (None, True)
+            elif change_dict['property_name'] == 'init_state_name':
+                state_graph_changed = True
+        elif cmd not in _GADGET_CMDS:
+            return (None, True)
+
+    return (changed_state_names, state_graph_changed)
+
+
 def _save_exploration(committer_id, exploration, commit_message, change_list):
     """Validates an exploration and commits it to persistent storage.
 
+    If a non-empty change list is given, the exploration is assumed to be the
+    result of applying it to the latest stored version, and only the parts of
+    the exploration that it touches are validated in detail.
+
     If successful, increments the version number of the incoming exploration
     domain object by 1.
     """
+    _commit_exploration(
+        committer_id, exploration, commit_message, change_list,
+        rights_manager.get_exploration_rights(exploration.id))
+    index_explorations_given_ids([exploration.id])
+
+
+def _commit_exploration(
+        committer_id, exploration, commit_message, change_list,
+        exploration_rights):
+    """Validates an exploration against the given rights object and commits
+    it to persistent storage, without updating its summary or its search
+    document. See _save_exploration() for details.
+
+    Returns the committed ExplorationModel.
+    """
     if change_list is None:
         change_list = []
-    exploration_rights = rights_manager.get_exploration_rights(exploration.id)
-    if exploration_rights.status != rights_manager.ACTIVITY_STATUS_PRIVATE:
-        exploration.validate(strict=True)
-    else:
-        exploration.validate()
+    changed_state_names, state_graph_changed = _get_validation_scope(
+        change_list)
+    is_private = (
+        exploration_rights.status == rights_manager.ACTIVITY_STATUS_PRIVATE)
+    exploration.validate(
+        strict=not is_private, changed_state_names=changed_state_names,
+        state_graph_changed=state_graph_changed)
 
     exploration_model = exp_models.ExplorationModel.get(
         exploration.id, strict=False)
@@ -804,9 +1120,9 @@ def _save_exploration(committer_id, exploration, commit_message, change_list):
 
     exploration_model.commit(committer_id, commit_message, change_list)
     memcache_services.delete(_get_exploration_memcache_key(exploration.id))
-    index_explorations_given_ids([exploration.id])
 
     exploration.version += 1
+    return exploration_model
 
 
 def _create_exploration(
@@ -882,6 +1198,15 @@ def delete_exploration(committer_id, exploration_id, force_deletion=False):
     exploration_memcache_key = _get_exploration_memcache_key(exploration_id)
     memcache_services.delete(exploration_memcache_key)
 
+    # The ids of deleted explorations may be reused (e.g. when demos are
+    # reloaded), so the cached data for their past versions is cleared too.
+    all_versions = range(1, exploration_model.version + 1)
+    memcache_services.delete_multi([
+        _get_exploration_player_json_memcache_key(exploration_id, version)
+        for version in all_versions] + [
+            _get_exploration_memcache_key(exploration_id, version=version)
+            for version in all_versions])
+
     #delete the exploration from search.
     delete_documents_from_search_index([exploration_id])
 
@@ -915,16 +1240,21 @@ def _get_last_updated_by_human_ms(exp_id):
     """Return the last time, in milliseconds, when the given exploration was
     updated by a human.
     """
-    # Iterate backwards through the exploration history metadata until we find
-    # the most recent snapshot that was committed by a human.
-    last_human_update_ms = 0
-    snapshots_metadata = get_exploration_snapshots_metadata(exp_id)
-    for snapshot_metadata in reversed(snapshots_metadata):
-        if snapshot_metadata['committer_id'] != feconf.MIGRATION_BOT_USER_ID:
-            last_human_update_ms = snapshot_metadata['created_on_ms']
-            break
+    return _get_last_updated_by_human_ms_from_model(
+        exp_models.ExplorationModel.get(exp_id))
+
 
-    return last_human_update_ms
+def _get_last_updated_by_human_ms_from_model(exploration_model):
+    """Like _get_last_updated_by_human_ms(), but takes the exploration model
+    instead of its id.
+    """
+    if exploration_model.last_human_commit_msec is not None:
+        return exploration_model.last_human_commit_msec
+
+    # The exploration has not been committed to by a human since this was
+    # first tracked, so search its history instead.
+    snapshot_metadata = exploration_model.get_last_human_commit_metadata()
+    return snapshot_metadata['created_on_ms'] if snapshot_metadata else 0
 
 
 def publish_exploration_and_update_user_profiles(committer_id, exp_id):
@@ -956,7 +1286,11 @@ def update_exploration(
         For published explorations, this must be present; for unpublished
         explorations, it should be equal to None.
     """
-    is_public = rights_manager.is_exploration_public(exploration_id)
+    # The rights, the exploration model and the summary model are each read
+    # once, and are reused by all the steps of the update below.
+    exploration_rights = rights_manager.get_exploration_rights(exploration_id)
+    is_public = (
+        exploration_rights.status == rights_manager.ACTIVITY_STATUS_PUBLIC)
 
     if is_public and not commit_message:
         raise ValueError(
@@ -964,15 +1298,129 @@ def update_exploration(
             'received none.')
 
     exploration = apply_change_list(exploration_id, change_list)
-    _save_exploration(committer_id, exploration, commit_message, change_list)
-    # Update summary of changed exploration.
-    update_exploration_summary(exploration.id, committer_id)
+    exp_summary_model_future = exp_models.ExpSummaryModel.get_multi_async(
+        [exploration_id], include_deleted=True)
+    exploration_model = _commit_exploration(
+        committer_id, exploration, commit_message, change_list,
+        exploration_rights)
+
+    # Update the summary and the search document of the changed exploration.
+    # These are written concurrently.
+    last_human_update_ms = _get_last_updated_by_human_ms_from_model(
+        exploration_model)
+    exp_summary = _compute_summary_of_exploration(
+        exploration, committer_id, exploration_rights,
+        exp_summary_model_future.get_result()[0], last_human_update_ms)
+    exp_summary_put_future = (
+        _get_exploration_summary_model(exp_summary).put_async())
+    if _should_index(exploration_rights):
+        search_services.add_documents_to_index([_exp_to_search_dict(
+            exploration, exploration_rights, _compute_search_rank(
+                exploration_rights, exp_summary.ratings,
+                last_human_update_ms))
+        ], SEARCH_INDEX_EXPLORATIONS)
+    exp_summary_put_future.get_result()
+    _delete_exploration_summaries_from_memcache([exploration_id])
+    _invalidate_search_results_cache()
 
-    if not rights_manager.is_exploration_private(exploration.id):
+    if exploration_rights.status != rights_manager.ACTIVITY_STATUS_PRIVATE:
         user_services.update_first_contribution_msec_if_not_set(
             committer_id, utils.get_current_time_in_millisecs())
 
 
+def migrate_exploration_model_to_latest_states_schema(
+        exploration_model, dry_run=False):
+    """Upgrades an exploration model that has already been loaded from the
+    datastore to the latest states schema version, and commits the result as
+    the migration bot. The model must not be deleted.
+
+    Unlike update_exploration(), this migrates and validates the states
+    exactly once, and does not touch the summary or the search document of
+    the exploration. A migration changes neither the fields of the search
+    document nor the last time that the exploration was updated by a human,
+    so the version is the only part of the summary that becomes stale; use
+    update_exploration_summary_versions() to update it in bulk.
+
+    If dry_run is True, the exploration is migrated and validated, but nothing
+    is written.
+
+    Returns the migrated Exploration domain object. Raises
+    utils.ValidationError if the migrated exploration is not valid, and
+    Exception if the stored exploration has been changed since the given
+    model was loaded.
+    """
+    from_version = exploration_model.states_schema_version
+    exploration = get_exploration_from_model(exploration_model)
+    exploration_rights = rights_manager.get_exploration_rights(exploration.id)
+    exploration.validate(strict=(
+        exploration_rights.status != rights_manager.ACTIVITY_STATUS_PRIVATE))
+    if dry_run:
+        return exploration
+
+    commit_cmds = [{
+        'cmd': exp_domain.CMD_MIGRATE_STATES_SCHEMA_TO_LATEST_VERSION,
+        'from_version': str(from_version),
+        'to_version': str(exploration.states_schema_version)
+    }]
+    commit_message = (
+        'Update exploration states from schema version %d to %d.' % (
+            from_version, exploration.states_schema_version))
+    exploration_model.states_schema_version = exploration.states_schema_version
+    exploration_model.states = {
+        state_name: state.to_dict()
+        for (state_name, state) in exploration.states.iteritems()}
+
+    expected_version = exploration_model.version
+
+    def _commit_if_unchanged():
+        # The given model may have been loaded some time ago, so make sure
+        # that the migration does not overwrite a newer version.
+        stored_model = exp_models.ExplorationModel.get(exploration_model.id)
+        if stored_model.version != expected_version:
+            raise Exception(
+                'Exploration %s was changed from version %s to version %s '
+                'before its migration was committed.' % (
+                    exploration_model.id, expected_version,
+                    stored_model.version))
+        # commit() increments the version of the model in memory, so it is
+        # reset in case this transaction is being retried.
+        exploration_model.version = expected_version
+        exploration_model.commit(
+            feconf.MIGRATION_BOT_USER_ID, commit_message, commit_cmds)
+
+    transaction_services.run_in_transaction(_commit_if_unchanged)
+    memcache_services.delete(_get_exploration_memcache_key(exploration.id))
+
+    exploration.version += 1
+    return exploration
+
+
+def update_exploration_summary_versions(exp_ids_to_versions):
+    """Sets the versions recorded in the summaries of the given explorations.
+
+    Args:
+    - exp_ids_to_versions: dict. Maps exploration ids to their new versions.
+        Summaries that are missing, or that already record the same or a
+        later version, are left unchanged.
+
+    The summaries are read and written in batches.
+    """
+    exp_ids = sorted(exp_ids_to_versions.keys())
+    for ind in xrange(0, len(exp_ids), feconf.DEFAULT_QUERY_LIMIT):
+        exp_summary_models = [
+            exp_summary_model for exp_summary_model in
+            exp_models.ExpSummaryModel.get_multi(
+                exp_ids[ind: ind + feconf.DEFAULT_QUERY_LIMIT])
+            if exp_summary_model and exp_summary_model.version <
+            exp_ids_to_versions[exp_summary_model.id]]
+        for exp_summary_model in exp_summary_models:
+            exp_summary_model.version = (
+                exp_ids_to_versions[exp_summary_model.id])
+        exp_models.ExpSummaryModel.put_multi(exp_summary_models)
+        _delete_exploration_summaries_from_memcache([
+            exp_summary_model.id for exp_summary_model in exp_summary_models])
+
+
 def create_exploration_summary(exploration_id, contributor_id_to_add):
     """Create summary of an exploration and store in datastore."""
     exploration = get_exploration_by_id(exploration_id)
@@ -997,6 +1445,25 @@ def compute_summary_of_exploration(exploration, contributor_id_to_add):
     """
     exp_rights = exp_models.ExplorationRightsModel.get_by_id(exploration.id)
     exp_summary_model = exp_models.ExpSummaryModel.get_by_id(exploration.id)
+    return _compute_summary_of_exploration(
+        exploration, contributor_id_to_add, exp_rights, exp_summary_model,
+        _get_last_updated_by_human_ms(exploration.id))
+
+
+def _compute_summary_of_exploration(
+        exploration, contributor_id_to_add, exp_rights, exp_summary_model,
+        last_human_update_ms):
+    """Like compute_summary_of_exploration(), but takes the data that the
+    summary is derived from instead of fetching it.
+
+    Args:
+    - exp_rights: the ExplorationRightsModel or the ActivityRights domain
+        object of the exploration.
+    - exp_summary_model: the existing ExpSummaryModel of the exploration,
+        or None if there is none.
+    - last_human_update_ms: the last time, in milliseconds, when the
+        exploration was updated by a human.
+    """
     if exp_summary_model:
         old_exp_summary = get_exploration_summary_from_model(exp_summary_model)
         ratings = old_exp_summary.ratings or feconf.get_empty_ratings()
@@ -1014,7 +1481,7 @@ def compute_summary_of_exploration(exploration, contributor_id_to_add):
                 contributor_ids.append(contributor_id_to_add)
 
     exploration_model_last_updated = datetime.datetime.fromtimestamp(
-        _get_last_updated_by_human_ms(exploration.id) / 1000.0)
+        last_human_update_ms / 1000.0)
     exploration_model_created_on = exploration.created_on
 
     exp_summary = exp_domain.ExplorationSummary(
@@ -1032,7 +1499,16 @@ def save_exploration_summary(exp_summary):
     """Save an exploration summary domain object as an ExpSummaryModel entity
     in the datastore.
     """
-    exp_summary_model = exp_models.ExpSummaryModel(
+    _get_exploration_summary_model(exp_summary).put()
+    _delete_exploration_summaries_from_memcache([exp_summary.id])
+    _invalidate_search_results_cache()
+
+
+def _get_exploration_summary_model(exp_summary):
+    """Returns an ExpSummaryModel entity, which is not yet saved, for the
+    given exploration summary domain object.
+    """
+    return exp_models.ExpSummaryModel(
         id=exp_summary.id,
         title=exp_summary.title,
         category=exp_summary.category,
@@ -1053,13 +1529,13 @@ def save_exploration_summary(exp_summary):
             exp_summary.exploration_model_created_on)
     )
 
-    exp_summary_model.put()
-
 
 def delete_exploration_summary(exploration_id, force_deletion=False):
     """Delete an exploration summary model."""
 
     exp_models.ExpSummaryModel.get(exploration_id).delete()
+    _delete_exploration_summaries_from_memcache([exploration_id])
+    _invalidate_search_results_cache()
 
 
 def revert_exploration(
@@ -1248,13 +1724,14 @@ def _exp_rights_to_search_dict(rights):
     return doc
 
 
-def _should_index(exp):
-    rights = rights_manager.get_exploration_rights(exp.id)
-    return rights.status != rights_manager.ACTIVITY_STATUS_PRIVATE
+def _should_index(exploration_rights):
+    return (
+        exploration_rights.status != rights_manager.ACTIVITY_STATUS_PRIVATE)
 
 
-def _get_search_rank(exp_id):
-    """Returns an integer determining the document's rank in search.
+def _compute_search_rank(exploration_rights, ratings, last_human_update_ms):
+    """Returns an integer determining the rank in search of an exploration
+    with the given rights, ratings and last update time.
 
     Featured explorations get a ranking bump, and so do explorations that
     have been more recently updated. Good ratings will increase the ranking
@@ -1266,40 +1743,88 @@ def _get_search_rank(exp_id):
     # negative ranks are disallowed in the Search API.
     _DEFAULT_RANK = 20
 
-    exploration = get_exploration_by_id(exp_id)
-    rights = rights_manager.get_exploration_rights(exp_id)
-    summary = get_exploration_summary_by_id(exp_id)
-    rank = _DEFAULT_RANK + (
-        _STATUS_PUBLICIZED_BONUS
-        if rights.status == rights_manager.ACTIVITY_STATUS_PUBLICIZED
-        else 0)
+    is_publicized = (
+        exploration_rights.status == rights_manager.ACTIVITY_STATUS_PUBLICIZED)
+    rank = _DEFAULT_RANK + (_STATUS_PUBLICIZED_BONUS if is_publicized else 0)
 
-    if summary.ratings:
+    if ratings:
         RATING_WEIGHTINGS = {'1': -5, '2': -2, '3': 2, '4': 5, '5': 10}
-        for rating_value in summary.ratings:
-            rank += (
-                summary.ratings[rating_value] *
-                RATING_WEIGHTINGS[rating_value])
+        for rating_value in ratings:
+            rank += ratings[rating_value] * RATING_WEIGHTINGS[rating_value]
 
-    last_human_update_ms = _get_last_updated_by_human_ms(exp_id)
+    rank += _get_recency_rank_bonus(
+        last_human_update_ms, utils.get_current_time_in_millisecs())
 
-    _TIME_NOW_MS = utils.get_current_time_in_millisecs()
+    # Ranks must be non-negative.
+    return max(rank, 0)
+
+
+def _get_recency_rank_bonus(last_human_update_ms, time_ms):
+    """Returns the bonus added, at time time_ms, to the search rank of an
+    exploration that was last updated by a human at last_human_update_ms.
+    """
     _MS_IN_ONE_DAY = 24 * 60 * 60 * 1000
-    time_delta_days = int(
-        (_TIME_NOW_MS - last_human_update_ms) / _MS_IN_ONE_DAY)
+    time_delta_days = int((time_ms - last_human_update_ms) / _MS_IN_ONE_DAY)
     if time_delta_days == 0:
-        rank += 80
+        return 80
     elif time_delta_days == 1:
-        rank += 50
+        return 50
     elif 2 <= time_delta_days <= 7:
-        rank += 35
+        return 35
+    else:
+        return 0
 
-    # Ranks must be non-negative.
-    return max(rank, 0)
+
+def _get_last_updated_by_human_ms_from_summary_model(
+        exp_id, exp_summary_model):
+    """Returns the last time, in milliseconds, when the given exploration was
+    updated by a human. This is read from the exploration's summary model if
+    it has one, and otherwise computed from the exploration's history.
+    """
+    if exp_summary_model and exp_summary_model.exploration_model_last_updated:
+        return utils.get_time_in_millisecs(
+            exp_summary_model.exploration_model_last_updated)
+    return _get_last_updated_by_human_ms(exp_id)
+
+
+def does_search_rank_need_update(exp_summary_model, since_msec):
+    """Returns whether the search rank of the exploration with the given
+    summary model may have changed after the time since_msec, in
+    milliseconds. If since_msec is None, this always returns True.
+
+    The rank depends only on the exploration's status, its ratings and how
+    recently it was last updated by a human (see _compute_search_rank()).
+    Changes to the first two are written to the summary model, so the rank
+    can only have changed if the summary model was updated after since_msec,
+    or if the recency bonus of the exploration has changed since then.
+    """
+    if (since_msec is None or
+            exp_summary_model.exploration_model_last_updated is None):
+        return True
+
+    if utils.get_time_in_millisecs(
+            exp_summary_model.last_updated) >= since_msec:
+        return True
+
+    last_human_update_ms = utils.get_time_in_millisecs(
+        exp_summary_model.exploration_model_last_updated)
+    return _get_recency_rank_bonus(
+        last_human_update_ms, since_msec) != _get_recency_rank_bonus(
+            last_human_update_ms, utils.get_current_time_in_millisecs())
+
+
+def _get_search_rank(exp_id):
+    """Returns an integer determining the document's rank in search.
+
+    See _compute_search_rank() for how the rank is determined.
+    """
+    rights = rights_manager.get_exploration_rights(exp_id)
+    summary = get_exploration_summary_by_id(exp_id)
+    return _compute_search_rank(
+        rights, summary.ratings, _get_last_updated_by_human_ms(exp_id))
 
 
-def _exp_to_search_dict(exp):
-    rights = rights_manager.get_exploration_rights(exp.id)
+def _exp_to_search_dict(exp, rights, rank):
     doc = {
         'id': exp.id,
         'language_code': exp.language_code,
@@ -1309,7 +1834,7 @@ def _exp_to_search_dict(exp):
         'blurb': exp.blurb,
         'objective': exp.objective,
         'author_notes': exp.author_notes,
-        'rank': _get_search_rank(exp.id),
+        'rank': rank,
     }
     doc.update(_exp_rights_to_search_dict(rights))
     return doc
@@ -1320,15 +1845,48 @@ def clear_search_index():
     many entries in the index.
     """
     search_services.clear_index(SEARCH_INDEX_EXPLORATIONS)
+    _invalidate_search_results_cache()
 
 
 def index_explorations_given_ids(exp_ids):
+    """Adds the search documents of the explorations with the given ids to
+    the search index, replacing any existing ones. Deleted and private
+    explorations are skipped.
+
+    The explorations are loaded and indexed in batches, so that each batch
+    is written using a single call to the search service.
+    """
+    for ind in xrange(0, len(exp_ids), search_services.MAX_DOCUMENTS_PER_PUT):
+        _index_exploration_batch(
+            exp_ids[ind: ind + search_services.MAX_DOCUMENTS_PER_PUT])
+
+
+def _index_exploration_batch(exp_ids):
     # We pass 'strict=False' so as not to index deleted explorations.
-    exploration_models = get_multiple_explorations_by_id(exp_ids, strict=False)
-    search_services.add_documents_to_index([
-        _exp_to_search_dict(exp) for exp in exploration_models.values()
-        if _should_index(exp)
-    ], SEARCH_INDEX_EXPLORATIONS)
+    explorations = get_multiple_explorations_by_id(exp_ids, strict=False)
+    exp_ids = explorations.keys()
+    exp_rights_list = [
+        rights_manager.get_exploration_rights_async(exp_id)
+        for exp_id in exp_ids]
+    exp_summary_models = exp_models.ExpSummaryModel.get_multi(exp_ids)
+
+    search_documents = []
+    for (exp_id, exp_rights_future, exp_summary_model) in zip(
+            exp_ids, exp_rights_list, exp_summary_models):
+        exp_rights = exp_rights_future.get_result()
+        if _should_index(exp_rights):
+            rank = _compute_search_rank(
+                exp_rights,
+                exp_summary_model.ratings if exp_summary_model else None,
+                _get_last_updated_by_human_ms_from_summary_model(
+                    exp_id, exp_summary_model))
+            search_documents.append(_exp_to_search_dict(
+                explorations[exp_id], exp_rights, rank))
+
+    if search_documents:
+        search_services.add_documents_to_index(
+            search_documents, SEARCH_INDEX_EXPLORATIONS)
+        _invalidate_search_results_cache()
 
 
 def patch_exploration_search_document(exp_id, update):
@@ -1339,6 +1897,7 @@ def patch_exploration_search_document(exp_id, update):
         exp_id, SEARCH_INDEX_EXPLORATIONS)
     doc.update(update)
     search_services.add_documents_to_index([doc], SEARCH_INDEX_EXPLORATIONS)
+    _invalidate_search_results_cache()
 
 
 def update_exploration_status_in_search(exp_id):
@@ -1353,6 +1912,7 @@ def update_exploration_status_in_search(exp_id):
 def delete_documents_from_search_index(exploration_ids):
     search_services.delete_documents_from_index(
         exploration_ids, SEARCH_INDEX_EXPLORATIONS)
+    _invalidate_search_results_cache()
 
 
 def search_explorations(query, limit, sort=None, cursor=None):
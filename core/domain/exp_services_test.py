@@ -16,8 +16,10 @@
 
 __author__ = 'Sean Lip'
 
+import collections
 import copy
 import datetime
+import json
 import os
 import StringIO
 import zipfile
@@ -41,6 +43,9 @@ from core.tests import test_utils
 import feconf
 import utils
 
+from google.appengine.api import apiproxy_stub_map
+from google.appengine.ext import ndb
+
 # TODO(msl): test ExpSummaryModel changes if explorations are updated,
 # reverted, deleted, created, rights changed
 
@@ -125,6 +130,33 @@ class ExplorationQueriesUnitTests(ExplorationServicesUnitTests):
                 }
             })
 
+    def test_get_exploration_player_json(self):
+        exploration = self.save_new_default_exploration(
+            self.EXP_ID, self.OWNER_ID, 'Title')
+        player_json = exp_services.get_exploration_player_json(exploration)
+        self.assertEqual(
+            json.loads(player_json), exploration.to_player_dict())
+
+        # The JSON is cached per version, so it is not recomputed.
+        def _raise_exception():
+            raise Exception('The player dict should not be recomputed.')
+
+        with self.swap(exploration, 'to_player_dict', _raise_exception):
+            self.assertEqual(
+                exp_services.get_exploration_player_json(exploration),
+                player_json)
+
+        # Deleting the exploration clears the cached JSON, since its id may
+        # be reused.
+        exp_services.delete_exploration(
+            self.OWNER_ID, self.EXP_ID, force_deletion=True)
+        new_exploration = self.save_new_default_exploration(
+            self.EXP_ID, self.OWNER_ID, 'New title')
+        self.assertEqual(
+            json.loads(
+                exp_services.get_exploration_player_json(new_exploration)
+            )['title'], 'New title')
+
 
 class ExplorationSummaryQueriesUnitTests(ExplorationServicesUnitTests):
     """Tests exploration query methods which operate on ExplorationSummary
@@ -234,6 +266,33 @@ class ExplorationSummaryQueriesUnitTests(ExplorationServicesUnitTests):
             exp_services.get_exploration_summaries_matching_query(''),
             ([], None))
 
+    def test_search_results_are_cached_until_a_summary_changes(self):
+        search_counter = test_utils.CallCounter(search_services.search)
+        with self.swap(search_services, 'search', search_counter):
+            (exp_summaries, _) = (
+                exp_services.get_exploration_summaries_matching_query(''))
+            self.assertEqual(search_counter.times_called, 1)
+
+            # Queries that differ only in whitespace share cached results.
+            (cached_exp_summaries, _) = (
+                exp_services.get_exploration_summaries_matching_query('  '))
+            self.assertEqual(search_counter.times_called, 1)
+            self.assertEqual(
+                self._summaries_to_ids(cached_exp_summaries),
+                self._summaries_to_ids(exp_summaries))
+
+            exp_services.update_exploration(
+                self.OWNER_ID, self.EXP_ID_0, [{
+                    'cmd': 'edit_exploration_property',
+                    'property_name': 'title',
+                    'new_value': 'A new title',
+                }], 'Change title')
+            (exp_summaries, _) = (
+                exp_services.get_exploration_summaries_matching_query(''))
+            self.assertEqual(search_counter.times_called, 2)
+            self.assertIn(
+                'A new title', [summary.title for summary in exp_summaries])
+
     def test_search_exploration_summaries(self):
         # Search within the 'Architecture' category.
         (exp_summaries, search_cursor) = (
@@ -356,6 +415,32 @@ class ExplorationCreateAndDeleteUnitTests(ExplorationServicesUnitTests):
         with self.assertRaises(Exception):
             exp_services.get_exploration_by_id('fake_exploration')
 
+    def test_async_retrieval_of_explorations(self):
+        """Test the get_exploration_by_id_async() method."""
+        with self.assertRaisesRegexp(Exception, 'Entity .* not found'):
+            exp_services.get_exploration_by_id_async('fake_eid').get_result()
+        self.assertIsNone(exp_services.get_exploration_by_id_async(
+            'fake_eid', strict=False).get_result())
+
+        exploration = self.save_new_default_exploration(
+            self.EXP_ID, self.OWNER_ID)
+
+        def _raise_on_synchronous_load(*args, **kwargs):
+            raise Exception('Unexpected synchronous datastore read.')
+
+        # The first call for each version loads the exploration from the
+        # datastore asynchronously, and the second one finds it in memcache.
+        with self.swap(
+                exp_services, '_get_exploration_from_datastore',
+                _raise_on_synchronous_load):
+            for version in [None, None, 1, 1]:
+                retrieved_exploration = (
+                    exp_services.get_exploration_by_id_async(
+                        self.EXP_ID, version=version).get_result())
+                self.assertEqual(exploration.id, retrieved_exploration.id)
+                self.assertEqual(
+                    exploration.title, retrieved_exploration.title)
+
     def test_retrieval_of_multiple_explorations(self):
         exps = {}
         chars = 'abcde'
@@ -749,6 +834,30 @@ title: A title
             zf.open('A title.yaml').read(), self.SAMPLE_YAML_CONTENT)
         self.assertEqual(zf.open('assets/abc.png').read(), raw_image)
 
+    def test_export_to_zip_file_chunks_in_asset_batches(self):
+        """Test that the ZIP archive is yielded in chunks, with the assets
+        fetched in batches.
+        """
+        self.save_new_valid_exploration(
+            self.EXP_ID, self.OWNER_ID, objective='The objective')
+        fs = fs_domain.AbstractFileSystem(
+            fs_domain.ExplorationFileSystem(self.EXP_ID))
+        fs.commit(self.OWNER_ID, 'abc.png', 'abc_contents')
+        fs.commit(self.OWNER_ID, 'def.png', 'def_contents')
+        fs.commit(self.OWNER_ID, 'ghi.png', 'ghi_contents')
+
+        with self.swap(feconf, 'EXPORT_ASSETS_BATCH_SIZE', 2):
+            chunks = list(exp_services.export_to_zip_file_chunks(self.EXP_ID))
+
+        # There is one chunk for the YAML file, one for each asset, and one
+        # for the central directory of the archive.
+        self.assertEqual(len(chunks), 5)
+        zf = zipfile.ZipFile(StringIO.StringIO(''.join(chunks)))
+        self.assertEqual(zf.namelist(), [
+            'A title.yaml', 'assets/abc.png', 'assets/def.png',
+            'assets/ghi.png'])
+        self.assertEqual(zf.open('assets/ghi.png').read(), 'ghi_contents')
+
     def test_export_by_versions(self):
         """Test export_to_zip_file() for different versions."""
         exploration = self.save_new_valid_exploration(
@@ -916,6 +1025,65 @@ def _get_change_list(state_name, property_name, new_value):
     }]
 
 
+class ValidationScopeUnitTests(test_utils.GenericTestBase):
+    """Test the computation of the parts of an exploration that need to be
+    validated after a change list is applied.
+    """
+
+    def test_empty_change_list_requires_full_validation(self):
+        self.assertEqual(
+            exp_services._get_validation_scope([]), (None, True))
+
+    def test_state_content_changes_do_not_affect_state_graph(self):
+        self.assertEqual(
+            exp_services._get_validation_scope(
+                _get_change_list('State A', 'content', []) + [{
+                    'cmd': 'edit_exploration_property',
+                    'property_name': 'title',
+                    'new_value': 'New title'
+                }]),
+            (set(['State A']), False))
+
+    def test_state_changes_are_tracked_across_renames_and_deletions(self):
+        self.assertEqual(
+            exp_services._get_validation_scope([{
+                'cmd': 'add_state',
+                'state_name': 'State A'
+            }, {
+                'cmd': 'rename_state',
+                'old_state_name': 'State A',
+                'new_state_name': 'State B'
+            }] + _get_change_list('State C', 'content', []) + [{
+                'cmd': 'delete_state',
+                'state_name': 'State C'
+            }]),
+            (set(['State B']), True))
+        self.assertEqual(
+            exp_services._get_validation_scope(
+                _get_change_list('State A', 'default_outcome', {})),
+            (set(['State A']), True))
+
+    def test_param_specs_changes_require_full_validation(self):
+        self.assertEqual(
+            exp_services._get_validation_scope(
+                _get_change_list('State A', 'content', []) + [{
+                    'cmd': 'edit_exploration_property',
+                    'property_name': 'param_specs',
+                    'new_value': {}
+                }]),
+            (None, True))
+
+    def test_migrations_require_full_validation(self):
+        self.assertEqual(
+            exp_services._get_validation_scope([{
+                'cmd': (
+                    exp_domain.CMD_MIGRATE_STATES_SCHEMA_TO_LATEST_VERSION),
+                'from_version': 1,
+                'to_version': 2
+            }]),
+            (None, True))
+
+
 class UpdateStateTests(ExplorationServicesUnitTests):
     """Test updating a single state."""
 
@@ -1314,6 +1482,55 @@ class CommitMessageHandlingTests(ExplorationServicesUnitTests):
             ), None)
 
 
+class UpdateExplorationDatastoreAccessTests(ExplorationServicesUnitTests):
+    """Test that update_exploration() reads each piece of data it needs from
+    the datastore only once.
+    """
+
+    def setUp(self):
+        super(UpdateExplorationDatastoreAccessTests, self).setUp()
+        exploration = self.save_new_valid_exploration(
+            self.EXP_ID, self.OWNER_ID, end_state_name='End')
+        self.init_state_name = exploration.init_state_name
+        rights_manager.publish_exploration(self.OWNER_ID, self.EXP_ID)
+
+        self.counting_enabled = False
+        self.datastore_call_counts = collections.Counter()
+
+        def _count_datastore_calls(service, call, unused_request,
+                                   unused_response):
+            if self.counting_enabled and service == 'datastore_v3':
+                self.datastore_call_counts[call] += 1
+
+        apiproxy_stub_map.apiproxy.GetPreCallHooks().Append(
+            'datastore_call_counter', _count_datastore_calls, 'datastore_v3')
+
+    def tearDown(self):
+        apiproxy_stub_map.apiproxy.GetPreCallHooks().Clear()
+        super(UpdateExplorationDatastoreAccessTests, self).tearDown()
+
+    def _get_datastore_get_count_of_update(self, sticky):
+        ndb.get_context().clear_cache()
+        self.datastore_call_counts.clear()
+        self.counting_enabled = True
+        exp_services.update_exploration(
+            self.OWNER_ID, self.EXP_ID, _get_change_list(
+                self.init_state_name,
+                exp_domain.STATE_PROPERTY_INTERACTION_STICKY, sticky),
+            'A message')
+        self.counting_enabled = False
+        return self.datastore_call_counts['Get']
+
+    def test_datastore_reads_do_not_grow_with_history_length(self):
+        first_get_count = self._get_datastore_get_count_of_update(True)
+        for ind in range(10):
+            self._get_datastore_get_count_of_update(ind % 2 == 0)
+        last_get_count = self._get_datastore_get_count_of_update(True)
+
+        self.assertEqual(first_get_count, last_get_count)
+        self.assertLessEqual(last_get_count, 6)
+
+
 class ExplorationSnapshotUnitTests(ExplorationServicesUnitTests):
     """Test methods relating to exploration snapshots."""
 
@@ -2041,6 +2258,30 @@ class ExplorationSearchTests(ExplorationServicesUnitTests):
         # The rank will be at least 0.
         self.assertEqual(exp_services._get_search_rank(self.EXP_ID), 0)
 
+    def test_does_search_rank_need_update(self):
+        self.save_new_valid_exploration(self.EXP_ID, self.OWNER_ID)
+        rights_manager.publish_exploration(self.OWNER_ID, self.EXP_ID)
+        exp_summary_model = exp_models.ExpSummaryModel.get(self.EXP_ID)
+        time_after_update_msec = utils.get_current_time_in_millisecs() + 1000
+        ms_in_two_days = 2 * 24 * 60 * 60 * 1000
+
+        self.assertTrue(exp_services.does_search_rank_need_update(
+            exp_summary_model, None))
+        self.assertTrue(exp_services.does_search_rank_need_update(
+            exp_summary_model, time_after_update_msec - 1000000))
+        with self.swap(
+                utils, 'get_current_time_in_millisecs',
+                lambda: time_after_update_msec):
+            self.assertFalse(exp_services.does_search_rank_need_update(
+                exp_summary_model, time_after_update_msec))
+
+        # The recency bonus of the exploration changes as time passes.
+        with self.swap(
+                utils, 'get_current_time_in_millisecs',
+                lambda: time_after_update_msec + ms_in_two_days):
+            self.assertTrue(exp_services.does_search_rank_need_update(
+                exp_summary_model, time_after_update_msec))
+
 
 class ExplorationSummaryTests(ExplorationServicesUnitTests):
     """Test exploration summaries."""
@@ -2110,6 +2351,37 @@ class ExplorationSummaryTests(ExplorationServicesUnitTests):
         exploration_summary = exp_services.get_exploration_summary_by_id(self.EXP_ID_1)
         self.assertEqual([self.ALBERT_ID], exploration_summary.contributor_ids)
 
+    def test_summaries_are_memcached_until_they_change(self):
+        self.save_new_default_exploration(self.EXP_ID, self.OWNER_ID)
+        exp_services.get_exploration_summaries_matching_ids([self.EXP_ID])
+
+        get_multi_counter = test_utils.CallCounter(
+            exp_models.ExpSummaryModel.get_multi)
+        with self.swap(
+                exp_models.ExpSummaryModel, 'get_multi', get_multi_counter):
+            exp_summary = exp_services.get_exploration_summary_by_id(
+                self.EXP_ID)
+            self.assertEqual(
+                exp_summary.status, rights_manager.ACTIVITY_STATUS_PRIVATE)
+            self.assertEqual(get_multi_counter.times_called, 0)
+
+            # Missing summaries are looked up in the datastore.
+            self.assertEqual(
+                exp_services.get_exploration_summaries_matching_ids(
+                    ['nonexistent_id', self.EXP_ID])[0], None)
+            self.assertEqual(get_multi_counter.times_called, 1)
+
+        # Rights changes update the summary, and replace the memcached copy.
+        rights_manager.publish_exploration(self.OWNER_ID, self.EXP_ID)
+        exp_summary = exp_services.get_exploration_summary_by_id(self.EXP_ID)
+        self.assertEqual(
+            exp_summary.status, rights_manager.ACTIVITY_STATUS_PUBLIC)
+        self.assertEqual(
+            exp_summary.thumbnail_image_url,
+            '/images/gallery/exploration_background_%s_small.png' % (
+                feconf.CATEGORIES_TO_COLORS.get(
+                    exp_summary.category, feconf.DEFAULT_COLOR)))
+
 
 class ExplorationSummaryGetTests(ExplorationServicesUnitTests):
     """Test exploration summaries get_* functions."""
@@ -2251,6 +2523,18 @@ class ExplorationSummaryGetTests(ExplorationServicesUnitTests):
                 self.assertEqual(getattr(actual_summaries[exp_id], prop),
                                  getattr(expected_summaries[exp_id], prop))
 
+    def test_iterate_summaries_in_batches(self):
+        exp_ids = [
+            summary.id for summary in
+            exp_services.iterate_all_exploration_summaries(batch_size=1)]
+        self.assertEqual(exp_ids, [self.EXP_ID_1, self.EXP_ID_2])
+
+        exp_ids = [
+            summary.id for summary in
+            exp_services.iterate_non_private_exploration_summaries(
+                batch_size=1)]
+        self.assertEqual(exp_ids, [self.EXP_ID_2])
+
 
 class ChangeListSummaryUnitTests(ExplorationServicesUnitTests):
     """Test change list summaries generate as expected for edge cases.
@@ -0,0 +1,80 @@
+# coding: utf-8
+#
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Services for serving the specs of interactions, gadgets and RTE components
+to the frontend.
+
+The specs only change when the code is redeployed, so they are serialized once
+per process into a JavaScript file whose URL contains a hash of its contents.
+Pages include that file with a <script> tag, and it can be cached forever.
+"""
+
+import hashlib
+import json
+
+from core.domain import gadget_registry
+from core.domain import interaction_registry
+from core.domain import rte_component_registry
+import feconf
+
+# The names of the GLOBALS properties that are set by the specs file, in the
+# order in which they are written to it.
+_SPECS_GLOBALS_NAMES = [
+    'RTE_COMPONENT_SPECS', 'INTERACTION_SPECS', 'GADGET_SPECS']
+
+# A dict containing the JavaScript source of the specs file and its version
+# hash. It is computed on first use.
+_specs_cache = {}
+
+
+def _get_specs_cache():
+    """Returns the cache of the specs file, computing it on first use.
+
+    The registries read the specs from the extension files, which only change
+    when the code is redeployed, so the cache is never recomputed.
+    """
+    if not _specs_cache:
+        registry_specs = [
+            rte_component_registry.Registry.get_all_specs(),
+            interaction_registry.Registry.get_all_specs(),
+            gadget_registry.Registry.get_all_specs(),
+        ]
+        specs_js = ''.join([
+            'GLOBALS.%s = %s;\n' % (name, json.dumps(specs, sort_keys=True))
+            for (name, specs) in zip(_SPECS_GLOBALS_NAMES, registry_specs)])
+        _specs_cache.update({
+            'specs_js': specs_js,
+            'version': hashlib.md5(specs_js).hexdigest(),
+        })
+    return _specs_cache
+
+
+def get_specs_js():
+    """Returns the JavaScript source that populates GLOBALS with the specs of
+    all RTE components, interactions and gadgets.
+    """
+    return _get_specs_cache()['specs_js']
+
+
+def get_specs_version():
+    """Returns a hash of the contents of the specs file."""
+    return _get_specs_cache()['version']
+
+
+def get_specs_url():
+    """Returns the versioned URL of the specs file."""
+    return '%s/%s.js' % (
+        feconf.EXTENSION_SPECS_URL_PREFIX, get_specs_version())
@@ -0,0 +1,45 @@
+# coding: utf-8
+#
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the extension specs services."""
+
+import hashlib
+import json
+
+from core.domain import extension_specs_services
+from core.domain import interaction_registry
+from core.tests import test_utils
+
+
+class ExtensionSpecsServicesTests(test_utils.GenericTestBase):
+    """Tests for the extension specs file."""
+
+    def test_specs_file_contains_the_registry_specs(self):
+        self.assertIn(
+            'GLOBALS.INTERACTION_SPECS = %s;\n' % json.dumps(
+                interaction_registry.Registry.get_all_specs(),
+                sort_keys=True),
+            extension_specs_services.get_specs_js())
+
+    def test_specs_url_is_unchanged_by_registry_refresh(self):
+        specs_url = extension_specs_services.get_specs_url()
+        specs_js = extension_specs_services.get_specs_js()
+        self.assertIn(
+            hashlib.md5(specs_js).hexdigest(), specs_url)
+
+        interaction_registry.Registry._refresh()
+        self.assertEqual(extension_specs_services.get_specs_url(), specs_url)
+        self.assertEqual(extension_specs_services.get_specs_js(), specs_js)
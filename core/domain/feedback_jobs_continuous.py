@@ -116,6 +116,48 @@ class FeedbackAnalyticsAggregator(jobs.BaseContinuousComputationManager):
                     _decrement_open_threads_count)
 
     # Public query methods.
+    @classmethod
+    def get_thread_analytics_multi(cls, exploration_ids):
+        """
+        Args:
+          - exploration_ids: ids of the explorations to get statistics for.
+
+        Returns a list of dicts, one per exploration id, in the same order as
+        the input list. Each dict has two keys: 'num_open_threads' and
+        'num_total_threads', representing the counts of open and all feedback
+        threads, respectively.
+
+        The realtime layer and the batch layer are each fetched with a single
+        get_multi() call, regardless of the number of explorations.
+        """
+        realtime_class = cls._get_realtime_datastore_class()
+        active_realtime_index = cls._get_active_realtime_index()
+        realtime_models = realtime_class.get_multi([
+            realtime_class.get_realtime_id(active_realtime_index, exp_id)
+            for exp_id in exploration_ids])
+        feedback_thread_analytics_models = (
+            feedback_models.FeedbackAnalyticsModel.get_multi(exploration_ids))
+
+        result = []
+        for realtime_model, feedback_thread_analytics_model in zip(
+                realtime_models, feedback_thread_analytics_models):
+            num_open_threads = 0
+            num_total_threads = 0
+            if realtime_model:
+                num_open_threads = realtime_model.num_open_threads
+                num_total_threads = realtime_model.num_total_threads
+            if feedback_thread_analytics_model:
+                num_open_threads += (
+                    feedback_thread_analytics_model.num_open_threads)
+                num_total_threads += (
+                    feedback_thread_analytics_model.num_total_threads)
+
+            result.append({
+                'num_open_threads': num_open_threads,
+                'num_total_threads': num_total_threads
+            })
+        return result
+
     @classmethod
     def get_thread_analytics(cls, exploration_id):
         """
@@ -126,26 +168,7 @@ class FeedbackAnalyticsAggregator(jobs.BaseContinuousComputationManager):
         'num_total_threads', representing the counts of open and all feedback
         threads, respectively.
         """
-        realtime_model = cls._get_realtime_datastore_class().get(
-            cls.get_active_realtime_layer_id(exploration_id), strict=False)
-        feedback_thread_analytics_model = (
-            feedback_models.FeedbackAnalyticsModel.get(
-                exploration_id, strict=False))
-
-        num_open_threads = 0
-        num_total_threads = 0
-        if realtime_model:
-            num_open_threads = realtime_model.num_open_threads
-            num_total_threads = realtime_model.num_total_threads
-        if feedback_thread_analytics_model:
-            num_open_threads += feedback_thread_analytics_model.num_open_threads
-            num_total_threads += (
-                feedback_thread_analytics_model.num_total_threads)
-
-        return {
-            'num_open_threads': num_open_threads,
-            'num_total_threads': num_total_threads
-        }
+        return cls.get_thread_analytics_multi([exploration_id])[0]
 
 
 class FeedbackAnalyticsMRJobManager(
@@ -181,6 +181,18 @@ class FeedbackAnalyticsAggregatorUnitTests(test_utils.GenericTestBase):
                 'num_open_threads': 2,
                 'num_total_threads': 2,
             })
+            self.assertEqual(
+                ModifiedFeedbackAnalyticsAggregator.get_thread_analytics_multi(
+                    [exp_id_2, 'nonexistent_eid', exp_id_1]), [{
+                    'num_open_threads': 2,
+                    'num_total_threads': 2,
+                }, {
+                    'num_open_threads': 0,
+                    'num_total_threads': 0,
+                }, {
+                    'num_open_threads': 2,
+                    'num_total_threads': 2,
+                }])
 
     def test_thread_closed_job_running(self):
         with self.swap(
@@ -651,3 +663,9 @@ class RealtimeFeedbackAnalyticsUnitTests(test_utils.GenericTestBase):
                 'num_open_threads': 2,
                 'num_total_threads': 2,
             })
+            self.assertEqual(
+                ModifiedFeedbackAnalyticsAggregator.get_thread_analytics_multi(
+                    [exp_id]), [{
+                    'num_open_threads': 2,
+                    'num_total_threads': 2,
+                }])
@@ -23,21 +23,25 @@ from core.domain import subscription_services
 from core.domain import user_services
 from core.platform import models
 (feedback_models,) = models.Registry.import_models([models.NAMES.feedback])
+transaction_services = models.Registry.import_transaction_services()
 import feconf
 import utils
 
 
 def get_threadlist(exploration_id):
+    threads = feedback_models.FeedbackThreadModel.get_threads(exploration_id)
+    original_author_usernames = _get_usernames(
+        [t.original_author_id for t in threads])
     return [{
         'last_updated': utils.get_time_in_millisecs(t.last_updated),
-        'original_author_username': user_services.get_username(
-            t.original_author_id) if t.original_author_id else None,
+        'original_author_username': original_author_username,
         'state_name': t.state_name,
         'status': t.status,
         'subject': t.subject,
         'summary': t.summary,
         'thread_id': t.id,
-    } for t in feedback_models.FeedbackThreadModel.get_threads(exploration_id)]
+    } for (t, original_author_username) in zip(
+        threads, original_author_usernames)]
 
 
 def create_thread(
@@ -58,30 +62,41 @@ def create_thread(
     # made there as well
     thread.status = feedback_models.STATUS_CHOICES_OPEN
     thread.subject = subject
+    thread.message_count = 0
     thread.put()
     create_message(
         thread.id, original_author_id,
         feedback_models.STATUS_CHOICES_OPEN, subject, text)
 
 
-def _get_message_dict(message_instance):
-    return {
-        'author_username': (
-            user_services.get_username(message_instance.author_id)
-            if message_instance.author_id else None),
-        'created_on': utils.get_time_in_millisecs(message_instance.created_on),
-        'exploration_id': message_instance.exploration_id,
-        'message_id': message_instance.message_id,
-        'text': message_instance.text,
-        'updated_status': message_instance.updated_status,
-        'updated_subject': message_instance.updated_subject,
-    }
+def _get_usernames(user_ids):
+    """Returns the usernames of the given users, resolving them in a single
+    batch. The entries for user ids that are None are None.
+    """
+    user_ids_to_fetch = list(set(
+        [user_id for user_id in user_ids if user_id]))
+    usernames = dict(zip(
+        user_ids_to_fetch, user_services.get_usernames(user_ids_to_fetch)))
+    return [usernames[user_id] if user_id else None for user_id in user_ids]
+
+
+def _get_message_dicts(message_instances):
+    author_usernames = _get_usernames(
+        [m.author_id for m in message_instances])
+    return [{
+        'author_username': author_username,
+        'created_on': utils.get_time_in_millisecs(m.created_on),
+        'exploration_id': m.exploration_id,
+        'message_id': m.message_id,
+        'text': m.text,
+        'updated_status': m.updated_status,
+        'updated_subject': m.updated_subject,
+    } for (m, author_username) in zip(message_instances, author_usernames)]
 
 
 def get_messages(thread_id):
-    return [
-        _get_message_dict(m)
-        for m in feedback_models.FeedbackMessageModel.get_messages(thread_id)]
+    return _get_message_dicts(
+        feedback_models.FeedbackMessageModel.get_messages(thread_id))
 
 
 def create_message(
@@ -89,6 +104,9 @@ def create_message(
     """Creates a new message for the thread and subscribes the author to the
     thread.
 
+    The message is created, and the thread's status, subject and message
+    count are updated, in a single transaction.
+
     Returns False if the message with the ID already exists.
     """
     from core.domain import event_services
@@ -96,12 +114,53 @@ def create_message(
     # in is valid.
     thread = feedback_models.FeedbackThreadModel.get(thread_id)
 
-    message_id = feedback_models.FeedbackMessageModel.get_message_count(
-        thread_id)
-    msg = feedback_models.FeedbackMessageModel.create(thread_id, message_id)
-    msg.thread_id = thread_id
-    msg.message_id = message_id
-    msg.author_id = author_id
+    # Threads created before message counts were stored on them need their
+    # messages to be counted. This query cannot be run in the transaction
+    # below.
+    legacy_message_count = (
+        feedback_models.FeedbackMessageModel.get_message_count(thread_id)
+        if thread.message_count is None else None)
+
+    def _create_message_transactional():
+        """Creates the message and updates the thread. Returns the message id
+        and the status of the thread before the update.
+        """
+        thread = feedback_models.FeedbackThreadModel.get(thread_id)
+        old_status = thread.status
+
+        message_id = (
+            thread.message_count if thread.message_count is not None
+            else legacy_message_count)
+        msg = feedback_models.FeedbackMessageModel.create(
+            thread_id, message_id)
+        msg.thread_id = thread_id
+        msg.message_id = message_id
+        msg.author_id = author_id
+        if updated_status:
+            msg.updated_status = updated_status
+        if updated_subject:
+            msg.updated_subject = updated_subject
+        msg.text = text
+        msg.put()
+
+        # We do a put() even if the status and subject are not updated, so
+        # that the last_updated time of the thread reflects the last time a
+        # message was added to it.
+        if message_id != 0 and (updated_status or updated_subject):
+            if updated_status and updated_status != thread.status:
+                thread.status = updated_status
+            if updated_subject and updated_subject != thread.subject:
+                thread.subject = updated_subject
+        thread.message_count = message_id + 1
+        thread.last_message_author_id = author_id
+        thread.last_message_created_on = msg.created_on
+        thread.put()
+
+        return message_id, old_status
+
+    message_id, old_status = transaction_services.run_in_transaction(
+        _create_message_transactional)
+
     if updated_status:
         if message_id == 0:
             # New thread.
@@ -110,23 +169,7 @@ def create_message(
         else:
             # Thread status changed.
             event_services.FeedbackThreadStatusChangedEventHandler.record(
-                thread.exploration_id, thread.status, updated_status)
-
-        msg.updated_status = updated_status
-    if updated_subject:
-        msg.updated_subject = updated_subject
-    msg.text = text
-    msg.put()
-
-    # We do a put() even if the status and subject are not updated, so that the
-    # last_updated time of the thread reflects the last time a message was
-    # added to it.
-    if message_id != 0 and (updated_status or updated_subject):
-        if updated_status and updated_status != thread.status:
-            thread.status = updated_status
-        if updated_subject and updated_subject != thread.subject:
-            thread.subject = updated_subject
-    thread.put()
+                thread.exploration_id, old_status, updated_status)
 
     if author_id:
         subscription_services.subscribe_to_thread(author_id, thread_id)
@@ -146,7 +189,7 @@ def get_next_page_of_all_feedback_messages(
         feedback_models.FeedbackMessageModel.get_all_messages(
             page_size, urlsafe_start_cursor))
 
-    result_dicts = [_get_message_dict(m) for m in results]
+    result_dicts = _get_message_dicts(results)
     return (result_dicts, new_urlsafe_start_cursor, more)
 
 
@@ -172,3 +215,12 @@ def get_thread_analytics(exploration_id):
     """
     return feedback_jobs_continuous.FeedbackAnalyticsAggregator.get_thread_analytics(
         exploration_id)
+
+
+def get_thread_analytics_multi(exploration_ids):
+    """Returns a list of dicts with feedback thread analytics for the given
+    explorations, in the same order as the input list. Each dict has the same
+    keys as the one returned by get_thread_analytics().
+    """
+    return feedback_jobs_continuous.FeedbackAnalyticsAggregator.get_thread_analytics_multi(
+        exploration_ids)
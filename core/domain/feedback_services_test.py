@@ -17,6 +17,7 @@
 __author__ = 'Sean Lip'
 
 from core.domain import feedback_services
+from core.domain import user_services
 from core.platform import models
 (feedback_models,) = models.Registry.import_models([models.NAMES.feedback])
 from core.tests import test_utils
@@ -52,6 +53,74 @@ class FeedbackServicesUnitTests(test_utils.GenericTestBase):
         self.assertEqual(
             datastore_id, '%s.%s' % (thread_id, message_id))
 
+    def test_thread_stores_message_count_and_last_message_details(self):
+        EXP_ID = '0'
+        feedback_services.create_thread(
+            EXP_ID, 'a_state_name', 'author_id', 'a subject', 'some text')
+        thread_id = feedback_services.get_threadlist(EXP_ID)[0]['thread_id']
+
+        message_count_counter = test_utils.CallCounter(
+            feedback_models.FeedbackMessageModel.get_message_count)
+        with self.swap(
+                feedback_models.FeedbackMessageModel, 'get_message_count',
+                message_count_counter):
+            feedback_services.create_message(
+                thread_id, None, feedback_models.STATUS_CHOICES_FIXED, None,
+                'another text')
+        self.assertEqual(message_count_counter.times_called, 0)
+
+        thread = feedback_models.FeedbackThreadModel.get(thread_id)
+        last_message = feedback_models.FeedbackMessageModel.get(thread_id, 1)
+        self.assertEqual(thread.message_count, 2)
+        self.assertEqual(thread.status, feedback_models.STATUS_CHOICES_FIXED)
+        self.assertIsNone(thread.last_message_author_id)
+        self.assertEqual(
+            thread.last_message_created_on, last_message.created_on)
+
+    def test_messages_can_be_added_to_threads_without_message_count(self):
+        EXP_ID = '0'
+        feedback_services.create_thread(
+            EXP_ID, 'a_state_name', None, 'a subject', 'some text')
+        thread_id = feedback_services.get_threadlist(EXP_ID)[0]['thread_id']
+        thread = feedback_models.FeedbackThreadModel.get(thread_id)
+        thread.message_count = None
+        thread.put()
+
+        feedback_services.create_message(
+            thread_id, 'author_id', None, None, 'another text')
+        self.assertEqual(
+            sorted([m['message_id'] for m in feedback_services.get_messages(
+                thread_id)]), [0, 1])
+        self.assertEqual(
+            feedback_models.FeedbackThreadModel.get(thread_id).message_count,
+            2)
+
+    def test_usernames_are_fetched_in_one_batch(self):
+        EXP_ID = '0'
+        for ind in range(3):
+            user_id = 'user_id_%s' % ind
+            user_services._create_user(user_id, '%s@example.com' % user_id)
+            user_services.set_username(user_id, 'username%s' % ind)
+            feedback_services.create_thread(
+                EXP_ID, 'a_state_name', user_id, 'a subject', 'some text')
+        feedback_services.create_thread(
+            EXP_ID, 'a_state_name', None, 'a subject', 'some text')
+
+        get_usernames_counter = test_utils.CallCounter(
+            user_services.get_usernames)
+        with self.swap(user_services, 'get_usernames', get_usernames_counter):
+            threadlist = feedback_services.get_threadlist(EXP_ID)
+            messages, _, _ = (
+                feedback_services.get_next_page_of_all_feedback_messages())
+        self.assertEqual(get_usernames_counter.times_called, 2)
+
+        self.assertEqual(
+            sorted([t['original_author_username'] for t in threadlist]),
+            [None, 'username0', 'username1', 'username2'])
+        self.assertEqual(
+            sorted([m['author_username'] for m in messages]),
+            [None, 'username0', 'username1', 'username2'])
+
     def test_create_message_fails_if_invalid_thread_id(self):
         with self.assertRaises(
                 feedback_models.FeedbackMessageModel.EntityNotFoundError):
@@ -25,6 +25,7 @@ from core.platform import models
 (file_models,) = models.Registry.import_models([
     models.NAMES.file
 ])
+memcache_services = models.Registry.import_memcache_services()
 import feconf
 import utils
 
@@ -92,6 +93,10 @@ class ExplorationFileSystem(object):
     def exploration_id(self):
         return self._exploration_id
 
+    def _get_memcache_key(self, filepath):
+        """Returns the memcache key for the latest version of a file."""
+        return 'file:%s:%s' % (self._exploration_id, filepath)
+
     def _get_file_metadata(self, filepath, version):
         """Return the desired file metadata.
 
@@ -135,6 +140,7 @@ class ExplorationFileSystem(object):
 
         data.commit(user_id, CHANGE_LIST_SAVE)
         metadata.commit(user_id, CHANGE_LIST_SAVE)
+        memcache_services.delete(self._get_memcache_key(filepath))
 
     def get(self, filepath, version=None, mode=None):
         """Gets a file as an unencoded stream of raw bytes.
@@ -142,15 +148,31 @@ class ExplorationFileSystem(object):
         If `version` is not supplied, the latest version is retrieved. If the
         file does not exist, None is returned.
 
+        The latest version of each file is cached in memcache, provided that
+        it is not too large.
+
         The 'mode' argument is unused. It is included so that this method
         signature matches that of other file systems.
         """
+        if version is None:
+            memcache_key = self._get_memcache_key(filepath)
+            memcached_file = memcache_services.get_multi(
+                [memcache_key]).get(memcache_key)
+            if memcached_file is not None:
+                return memcached_file
+
         metadata = self._get_file_metadata(filepath, version)
         if metadata:
             data = self._get_file_data(filepath, version)
             if data:
                 if version is None:
-                    version = data.version
+                    file_stream = FileStreamWithMetadata(
+                        data.content, data.version, metadata)
+                    if (len(data.content) <=
+                            feconf.MAX_MEMCACHED_FILE_SIZE_BYTES):
+                        memcache_services.set_multi({
+                            memcache_key: file_stream})
+                    return file_stream
                 return FileStreamWithMetadata(data.content, version, metadata)
             else:
                 logging.error(
@@ -160,6 +182,19 @@ class ExplorationFileSystem(object):
         else:
             return None
 
+    def get_multi(self, filepaths):
+        """Gets the latest versions of several files as raw bytestrings,
+        using a single batched datastore read.
+
+        Returns a list with one entry per filepath. The entry is None if the
+        corresponding file does not exist.
+        """
+        data_models = file_models.FileModel.get_models(
+            self._exploration_id,
+            ['assets/%s' % filepath for filepath in filepaths])
+        return [
+            data.content if data else None for data in data_models]
+
     def commit(self, user_id, filepath, raw_bytes):
         """Saves a raw bytestring as a file in the database."""
         self._save_file(user_id, filepath, raw_bytes)
@@ -175,6 +210,8 @@ class ExplorationFileSystem(object):
         if data:
             data.delete(user_id, '')
 
+        memcache_services.delete(self._get_memcache_key(filepath))
+
     def isfile(self, filepath):
         """Checks the existence of a file."""
         metadata = self._get_file_metadata(filepath, None)
@@ -199,13 +236,11 @@ class ExplorationFileSystem(object):
         if not prefix.endswith('/'):
             prefix += '/'
 
-        result = set()
-        metadata_models = file_models.FileMetadataModel.get_undeleted()
-        for metadata_model in metadata_models:
-            filepath = metadata_model.id
-            if filepath.startswith(prefix):
-                result.add('/'.join(filepath.split('/')[3:]))
-        return sorted(list(result))
+        metadata_models = (
+            file_models.FileMetadataModel.get_undeleted_with_id_prefix(prefix))
+        return sorted(list(set([
+            '/'.join(metadata_model.id.split('/')[3:])
+            for metadata_model in metadata_models])))
 
 
 class DiskBackedFileSystem(object):
@@ -237,6 +272,15 @@ class DiskBackedFileSystem(object):
             os.path.join(self._root, filepath), raw_bytes=True, mode=mode)
         return FileStreamWithMetadata(content, None, None)
 
+    def get_multi(self, filepaths):
+        """Returns a list of bytestrings with the contents of the given
+        files, with None entries for files that do not exist.
+        """
+        return [
+            self.get(filepath, mode='rb').read()
+            if self.isfile(filepath) else None
+            for filepath in filepaths]
+
     def commit(self, user_id, filepath, raw_bytes):
         raise NotImplementedError
 
@@ -287,6 +331,18 @@ class AbstractFileSystem(object):
                 % (filepath, version if version else 'latest'))
         return file_stream.read()
 
+    def get_multi(self, filepaths):
+        """Returns a list of bytestrings with the contents of the latest
+        versions of the given files.
+        """
+        for filepath in filepaths:
+            self._check_filepath(filepath)
+        contents = self._impl.get_multi(filepaths)
+        for (filepath, file_contents) in zip(filepaths, contents):
+            if file_contents is None:
+                raise IOError('File %s (version latest) not found.' % filepath)
+        return contents
+
     def commit(self, user_id, filepath, raw_bytes):
         """Replaces the contents of the file with the given bytestring."""
         raw_bytes = str(raw_bytes)
@@ -69,6 +69,10 @@ class ExplorationFileSystemUnitTests(test_utils.GenericTestBase):
 
         self.assertEqual(fs.listdir('fake_dir'), [])
 
+        fs.delete(self.user_id, 'abcd.png')
+        self.assertEqual(fs.listdir(''), [
+            'abc.png', 'abc/abcd.png', 'bcd/bcde.png'])
+
         new_fs = fs_domain.AbstractFileSystem(
             fs_domain.ExplorationFileSystem('eid2'))
         self.assertEqual(new_fs.listdir('assets'), [])
@@ -94,6 +98,24 @@ class ExplorationFileSystemUnitTests(test_utils.GenericTestBase):
         self.assertEqual(old_file_stream.version, 1)
         self.assertEqual(old_file_stream.metadata.size, len('file_contents'))
 
+    def test_latest_version_is_served_from_memcache(self):
+        fs = fs_domain.AbstractFileSystem(
+            fs_domain.ExplorationFileSystem('eid'))
+        fs.commit(self.user_id, 'abc.png', 'file_contents')
+        self.assertEqual(fs.get('abc.png'), 'file_contents')
+
+        def _raise_exception(*unused_args, **unused_kwargs):
+            raise Exception('The datastore should not be read.')
+
+        with self.swap(
+                fs_domain.file_models.FileModel, 'get_model',
+                _raise_exception):
+            self.assertEqual(fs.get('abc.png'), 'file_contents')
+            self.assertEqual(fs.open('abc.png').version, 1)
+
+        fs.delete(self.user_id, 'abc.png')
+        self.assertIsNone(fs.open('abc.png'))
+
     def test_independence_of_file_systems(self):
         fs = fs_domain.AbstractFileSystem(
             fs_domain.ExplorationFileSystem('eid'))
@@ -28,10 +28,14 @@ class Registry(object):
 
     # Dict mapping gadget types to instances of the gadgets.
     _gadgets = {}
+    # Dict mapping gadget types to their specs. Populated lazily, and cleared
+    # whenever the registry is refreshed.
+    _gadget_specs = {}
 
     @classmethod
     def _refresh(cls):
         cls._gadgets.clear()
+        cls._gadget_specs.clear()
 
         # Assemble all paths to the gadgets.
         EXTENSION_PATHS = [
@@ -95,8 +99,14 @@ class Registry(object):
 
     @classmethod
     def get_all_specs(cls):
-        """Returns a dict containing the full specs of each gadget."""
-        return {
-            gadget.type: gadget.to_dict()
-            for gadget in cls.get_all_gadgets()
-        }
+        """Returns a dict containing the full specs of each gadget.
+
+        The specs are computed once and then reused, so the returned dict must
+        not be mutated.
+        """
+        if not cls._gadget_specs:
+            cls._gadget_specs.update({
+                gadget.type: gadget.to_dict()
+                for gadget in cls.get_all_gadgets()
+            })
+        return cls._gadget_specs
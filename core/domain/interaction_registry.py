@@ -31,6 +31,9 @@ class Registry(object):
 
     # Dict mapping interaction ids to instances of the interactions.
     _interactions = {}
+    # Dict mapping interaction ids to their specs. Populated lazily, and
+    # cleared whenever the registry is refreshed.
+    _interaction_specs = {}
 
     @classmethod
     def get_all_interaction_ids(cls):
@@ -42,6 +45,7 @@ class Registry(object):
     @classmethod
     def _refresh(cls):
         cls._interactions.clear()
+        cls._interaction_specs.clear()
 
         all_interaction_ids = cls.get_all_interaction_ids()
 
@@ -117,8 +121,14 @@ class Registry(object):
 
     @classmethod
     def get_all_specs(cls):
-        """Returns a dict containing the full specs of each interaction."""
-        return {
-            interaction.id: interaction.to_dict()
-            for interaction in cls.get_all_interactions()
-        }
+        """Returns a dict containing the full specs of each interaction.
+
+        The specs are computed once and then reused, so the returned dict must
+        not be mutated.
+        """
+        if not cls._interaction_specs:
+            cls._interaction_specs.update({
+                interaction.id: interaction.to_dict()
+                for interaction in cls.get_all_interactions()
+            })
+        return cls._interaction_specs
@@ -55,9 +55,11 @@ class ParamSpec(object):
                 'parameters, not: %s' % self.obj_type)
 
 
-class ParamChange(object):
+class ParamChange(utils.SlottedObject):
     """Value object for a parameter change."""
 
+    __slots__ = ('_name', '_generator_id', '_customization_args')
+
     def __init__(self, name, generator_id, customization_args):
 
         # TODO(sll): Check that all required args for customization exist in
@@ -0,0 +1,133 @@
+# coding: utf-8
+#
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Registry for the extension assets needed by the exploration player page."""
+
+import logging
+
+from core.domain import dependency_registry
+from core.domain import exp_domain
+from core.domain import exp_services
+from core.domain import gadget_registry
+from core.domain import interaction_registry
+from core.domain import rte_component_registry
+import feconf
+import utils
+
+
+class Registry(object):
+    """Registry of precomputed player page assets.
+
+    The assets needed by a learner page depend only on the set of interaction
+    ids and gadget types used by the exploration, so they are computed once
+    per distinct set and held in process memory.
+    """
+
+    # Dict mapping (interaction_ids, gadget_types) keys to dicts of assets.
+    # Each element of the key is a sorted tuple of unique ids.
+    _player_assets = {}
+
+    @classmethod
+    def _get_key(cls, interaction_ids, gadget_types):
+        return (
+            tuple(sorted(set(interaction_ids))),
+            tuple(sorted(set(gadget_types))))
+
+    @classmethod
+    def _compute_player_assets(cls, interaction_ids, gadget_types):
+        dependency_ids = (
+            interaction_registry.Registry.get_deduplicated_dependency_ids(
+                interaction_ids))
+        dependencies_html, additional_angular_modules = (
+            dependency_registry.Registry.get_deps_html_and_angular_modules(
+                dependency_ids))
+
+        return {
+            'additional_angular_modules': additional_angular_modules,
+            'dependencies_html': dependencies_html,
+            'gadget_templates': gadget_registry.Registry.get_gadget_html(
+                gadget_types),
+            'interaction_templates': (
+                rte_component_registry.Registry.get_html_for_all_components()
+                + interaction_registry.Registry.get_interaction_html(
+                    interaction_ids)),
+        }
+
+    @classmethod
+    def get_player_assets(cls, interaction_ids, gadget_types):
+        """Returns the extension assets needed to play an exploration that
+        uses the given interaction ids and gadget types.
+
+        The return value is a dict with the following keys:
+            'additional_angular_modules': a list of additional Angular modules
+                that the main module of the player page should depend on.
+            'dependencies_html': the HTML needed to load the JS/CSS library
+                dependencies of the interactions.
+            'gadget_templates': the HTML bodies of the gadgets.
+            'interaction_templates': the HTML bodies of all RTE components and
+                of the interactions.
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        key = cls._get_key(interaction_ids, gadget_types)
+        if key not in cls._player_assets:
+            cls._player_assets[key] = cls._compute_player_assets(
+                key[0], key[1])
+        return cls._player_assets[key]
+
+    @classmethod
+    def _get_demo_extension_sets(cls):
+        """Returns a list of (interaction_ids, gadget_types) pairs, one for each
+        demo exploration that can be converted to the latest schema version.
+        """
+        extension_sets = []
+        for ind, (demo_path, title, category) in enumerate(
+                feconf.DEMO_EXPLORATIONS):
+            yaml_content, _ = exp_services.get_demo_exploration_components(
+                demo_path)
+            try:
+                exploration = exp_domain.Exploration.from_untitled_yaml(
+                    str(ind), title, category, yaml_content)
+            except utils.ExplorationConversionError as e:
+                logging.warning(
+                    'Player assets for demo exploration %s were not '
+                    'precomputed: %s' % (demo_path, e))
+                continue
+            extension_sets.append((
+                exploration.get_interaction_ids(),
+                exploration.get_gadget_types()))
+        return extension_sets
+
+    @classmethod
+    def warm_cache(cls):
+        """Reads the HTML of every interaction, gadget and RTE component from
+        disk, and precomputes the assets for each single extension and for the
+        combination of extensions used by each demo exploration, so that
+        subsequent page requests for these do no file I/O or HTML assembly.
+        """
+        all_interaction_ids = (
+            interaction_registry.Registry.get_all_interaction_ids())
+        for interaction_id in all_interaction_ids:
+            cls.get_player_assets([interaction_id], [])
+        for gadget_type in gadget_registry.Registry.get_all_gadget_types():
+            cls.get_player_assets([], [gadget_type])
+        for interaction_ids, gadget_types in cls._get_demo_extension_sets():
+            cls.get_player_assets(interaction_ids, gadget_types)
+
+    @classmethod
+    def clear(cls):
+        """Clears all precomputed assets."""
+        cls._player_assets.clear()
@@ -0,0 +1,76 @@
+# coding: utf-8
+#
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the player assets registry."""
+
+from core.domain import player_assets_registry
+from core.tests import test_utils
+import utils
+
+
+class PlayerAssetsRegistryTests(test_utils.GenericTestBase):
+    """Tests for the player assets registry."""
+
+    def setUp(self):
+        super(PlayerAssetsRegistryTests, self).setUp()
+        player_assets_registry.Registry.clear()
+
+    def test_assets_are_keyed_by_unique_sorted_ids(self):
+        assets = player_assets_registry.Registry.get_player_assets(
+            ['CodeRepl', 'Continue'], [])
+        self.assertIs(
+            player_assets_registry.Registry.get_player_assets(
+                ['Continue', 'CodeRepl', 'Continue'], []),
+            assets)
+        self.assertIsNot(
+            player_assets_registry.Registry.get_player_assets(
+                ['Continue'], []),
+            assets)
+
+    def test_assets_contain_extension_html(self):
+        assets = player_assets_registry.Registry.get_player_assets(
+            ['CodeRepl'], ['ScoreBar'])
+        self.assertIn('skulpt', assets['dependencies_html'])
+        self.assertIn('oppiaInteractiveCodeRepl', assets[
+            'interaction_templates'])
+        self.assertIn('oppiaGadgetScoreBar', assets['gadget_templates'])
+
+    def test_no_file_reads_after_warming_cache(self):
+        player_assets_registry.Registry.warm_cache()
+        player_assets_registry.Registry.clear()
+
+        def _raise_on_file_read(*args, **kwargs):
+            raise Exception('Unexpected file read.')
+
+        with self.swap(utils, 'get_file_contents', _raise_on_file_read):
+            player_assets_registry.Registry.get_player_assets(
+                ['CodeRepl', 'TextInput'], ['ScoreBar'])
+
+    def test_demo_exploration_assets_are_precomputed_by_warming_cache(self):
+        player_assets_registry.Registry.warm_cache()
+        extension_sets = (
+            player_assets_registry.Registry._get_demo_extension_sets())
+        self.assertGreater(len(extension_sets), 1)
+
+        def _raise_on_compute(*args, **kwargs):
+            raise Exception('Unexpected computation of player assets.')
+
+        with self.swap(
+                player_assets_registry.Registry, '_compute_player_assets',
+                classmethod(_raise_on_compute)):
+            for interaction_ids, gadget_types in extension_sets:
+                player_assets_registry.Registry.get_player_assets(
+                    interaction_ids, gadget_types)
@@ -75,8 +75,9 @@ class ExplorationRecommendationsMRJobManager(
 
     @staticmethod
     def map(item):
-        # Only process the exploration if it is not private
-        if item.status == rights_manager.ACTIVITY_STATUS_PRIVATE:
+        # Only process the exploration if it is not private or deleted.
+        if (item.deleted or
+                item.status == rights_manager.ACTIVITY_STATUS_PRIVATE):
             return
 
         # Note: There is a threshold so that bad recommendations will be
@@ -84,17 +85,14 @@ class ExplorationRecommendationsMRJobManager(
         SIMILARITY_SCORE_THRESHOLD = 3.0
 
         exp_summary_id = item.id
-        exp_summaries_dict = (
-            exp_services.get_non_private_exploration_summaries())
-
-        # Note: This is needed because the exp_summaries_dict is sometimes
-        # different from the summaries in the datastore, especially when
-        # new explorations are added.
-        if exp_summary_id not in exp_summaries_dict:
-            return
-
-        reference_exp_summary = exp_summaries_dict[exp_summary_id]
-        for compared_exp_id, compared_exp_summary in exp_summaries_dict.iteritems():
+        reference_exp_summary = exp_services.get_exploration_summary_from_model(
+            item)
+
+        # The other summaries are streamed in batches, so that memory use does
+        # not grow with the number of explorations.
+        for compared_exp_summary in (
+                exp_services.iterate_non_private_exploration_summaries()):
+            compared_exp_id = compared_exp_summary.id
             if compared_exp_id != exp_summary_id:
                 similarity_score = (
                     recommendations_services.get_item_similarity(
@@ -25,6 +25,7 @@ from core.domain import subscription_services
 from core.domain import user_services
 from core.platform import models
 current_user_services = models.Registry.import_current_user_services()
+futures_services = models.Registry.import_futures_services()
 (collection_models, exp_models,) = models.Registry.import_models([
     models.NAMES.collection, models.NAMES.exploration
 ])
@@ -252,6 +253,21 @@ def get_exploration_rights(exploration_id, strict=True):
     return _get_activity_rights_from_model(model, ACTIVITY_TYPE_EXPLORATION)
 
 
+@futures_services.tasklet
+def get_exploration_rights_async(exploration_id):
+    """Starts fetching the rights for this exploration, and returns a future
+    whose result is the rights object, or None if it does not exist.
+    """
+    exploration_rights_models = (
+        yield exp_models.ExplorationRightsModel.get_multi_async(
+            [exploration_id]))
+    exploration_rights_model = exploration_rights_models[0]
+    if exploration_rights_model is None:
+        raise futures_services.Return(None)
+    raise futures_services.Return(_get_activity_rights_from_model(
+        exploration_rights_model, ACTIVITY_TYPE_EXPLORATION))
+
+
 def is_exploration_private(exploration_id):
     exploration_rights = get_exploration_rights(exploration_id)
     return exploration_rights.status == ACTIVITY_STATUS_PRIVATE
@@ -294,6 +310,16 @@ def get_collection_rights(collection_id, strict=True):
     return _get_activity_rights_from_model(model, ACTIVITY_TYPE_COLLECTION)
 
 
+def get_collection_rights_from_model(collection_rights_model):
+    """Returns the rights domain object for the given CollectionRightsModel,
+    or None if the model is None.
+    """
+    if collection_rights_model is None:
+        return None
+    return _get_activity_rights_from_model(
+        collection_rights_model, ACTIVITY_TYPE_COLLECTION)
+
+
 def is_collection_private(collection_id):
     collection_rights = get_collection_rights(collection_id)
     return collection_rights.status == ACTIVITY_STATUS_PRIVATE
@@ -410,6 +436,14 @@ class Actor(object):
             return False
         return self._can_play(activity_rights)
 
+    def can_play_given_rights(self, activity_rights):
+        """Like can_play(), but takes the activity's rights object rather
+        than fetching it. The rights object may be None.
+        """
+        if activity_rights is None:
+            return False
+        return self._can_play(activity_rights)
+
     def can_view(self, activity_type, activity_id):
         """Whether the user can view the editor page for this activity."""
         return self.can_play(activity_type, activity_id)
@@ -422,6 +456,14 @@ class Actor(object):
             return False
         return self._can_edit(activity_rights)
 
+    def can_edit_given_rights(self, activity_rights):
+        """Like can_edit(), but takes the activity's rights object rather
+        than fetching it. The rights object may be None.
+        """
+        if activity_rights is None:
+            return False
+        return self._can_edit(activity_rights)
+
     def can_delete(self, activity_type, activity_id):
         activity_rights = _get_activity_rights(activity_type, activity_id)
         if activity_rights is None:
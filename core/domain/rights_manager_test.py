@@ -58,6 +58,27 @@ class ExplorationRightsTests(test_utils.GenericTestBase):
 
         self.assertIsNone(
             rights_manager.get_exploration_rights(NON_EXP_ID, strict=False))
+        self.assertIsNone(
+            rights_manager.get_exploration_rights_async(
+                NON_EXP_ID).get_result())
+
+    def test_get_exploration_rights_async(self):
+        exp = exp_domain.Exploration.create_default_exploration(
+            self.EXP_ID, 'A title', 'A category')
+        exp_services.save_new_exploration(self.user_id_a, exp)
+
+        exploration_rights = rights_manager.get_exploration_rights_async(
+            self.EXP_ID).get_result()
+        self.assertEqual(exploration_rights.id, self.EXP_ID)
+        self.assertEqual(exploration_rights.owner_ids, [self.user_id_a])
+        self.assertTrue(rights_manager.Actor(
+            self.user_id_a).can_edit_given_rights(exploration_rights))
+        self.assertFalse(rights_manager.Actor(
+            self.user_id_b).can_edit_given_rights(exploration_rights))
+        self.assertFalse(rights_manager.Actor(
+            self.user_id_b).can_play_given_rights(exploration_rights))
+        self.assertFalse(rights_manager.Actor(
+            self.user_id_b).can_play_given_rights(None))
 
     def test_demo_exploration(self):
         exp_services.load_demo('1')
@@ -28,11 +28,15 @@ class Registry(object):
     """Registry of all custom rich-text components."""
 
     _rte_components = {}
+    # Dict mapping RTE component ids to their specs. Populated lazily, and
+    # cleared whenever the registry is refreshed.
+    _rte_component_specs = {}
 
     @classmethod
     def _refresh(cls):
         """Repopulate the registry."""
         cls._rte_components.clear()
+        cls._rte_component_specs.clear()
 
         # Assemble all paths to the RTE components.
         EXTENSION_PATHS = [
@@ -90,8 +94,14 @@ class Registry(object):
 
     @classmethod
     def get_all_specs(cls):
-        """Returns a dict containing the full specs of each RTE component."""
-        return {
-            component.id: component.to_dict()
-            for component in cls.get_all_rte_components()
-        }
+        """Returns a dict containing the full specs of each RTE component.
+
+        The specs are computed once and then reused, so the returned dict must
+        not be mutated.
+        """
+        if not cls._rte_component_specs:
+            cls._rte_component_specs.update({
+                component.id: component.to_dict()
+                for component in cls.get_all_rte_components()
+            })
+        return cls._rte_component_specs
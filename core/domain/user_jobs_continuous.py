@@ -144,18 +144,17 @@ class RecentUpdatesMRJobManager(
                 continue
 
             # Find the last commit that is not due to an automatic migration.
-            latest_manual_commit_version = activity_model.version
-            metadata_obj = activity_model_cls.get_snapshots_metadata(
-                activity_model.id,
-                [latest_manual_commit_version],
-                allow_deleted=True)[0]
-            while metadata_obj['committer_id'] == feconf.MIGRATION_BOT_USER_ID:
-                latest_manual_commit_version -= 1
-                metadata_obj = (
-                    activity_model_cls.get_snapshots_metadata(
-                        activity_model.id,
-                        [latest_manual_commit_version],
-                        allow_deleted=True)[0])
+            # Activities that have not been committed to by a human since
+            # this was tracked on the model have their history searched.
+            if activity_model.last_human_commit_version is not None:
+                metadata_obj = activity_model_cls.get_snapshots_metadata(
+                    activity_model.id,
+                    [activity_model.last_human_commit_version],
+                    allow_deleted=True)[0]
+            else:
+                metadata_obj = activity_model.get_last_human_commit_metadata()
+                if metadata_obj is None:
+                    continue
 
             most_recent_commits.append({
                 'type': commit_type,
@@ -214,20 +213,43 @@ class RecentUpdatesMRJobManager(
         for recent_activity_commit_dict in most_recent_activity_commits:
             yield (reducer_key, recent_activity_commit_dict)
 
-        for feedback_thread_id in feedback_thread_ids_list:
-            last_message = (
-                feedback_models.FeedbackMessageModel.get_most_recent_message(
-                    feedback_thread_id))
+        # The threads, and the explorations that they are about, are each
+        # fetched in a single batch.
+        threads = [
+            thread for thread in
+            feedback_models.FeedbackThreadModel.get_multi(
+                feedback_thread_ids_list)
+            if thread is not None]
+        exploration_titles = {
+            exp_model.id: exp_model.title
+            for exp_model in exp_models.ExplorationModel.get_multi(
+                list(set([thread.exploration_id for thread in threads])),
+                include_deleted=True)
+            if exp_model is not None}
+
+        for thread in threads:
+            if thread.message_count is not None:
+                author_id = thread.last_message_author_id
+                last_updated_ms = utils.get_time_in_millisecs(
+                    thread.last_message_created_on)
+            else:
+                # Threads created before the details of their last message
+                # were stored on them need a query.
+                last_message = (
+                    feedback_models.FeedbackMessageModel
+                    .get_most_recent_message(thread.id))
+                author_id = last_message.author_id
+                last_updated_ms = utils.get_time_in_millisecs(
+                    last_message.created_on)
 
             yield (reducer_key, {
                 'type': feconf.UPDATE_TYPE_FEEDBACK_MESSAGE,
-                'activity_id': last_message.exploration_id,
-                'activity_title': exp_models.ExplorationModel.get_by_id(
-                    last_message.exploration_id).title,
-                'author_id': last_message.author_id,
-                'last_updated_ms': utils.get_time_in_millisecs(
-                    last_message.created_on),
-                'subject': last_message.get_thread_subject(),
+                'activity_id': thread.exploration_id,
+                'activity_title': exploration_titles.get(
+                    thread.exploration_id),
+                'author_id': author_id,
+                'last_updated_ms': last_updated_ms,
+                'subject': thread.subject,
             })
 
     @staticmethod
@@ -24,6 +24,7 @@ import re
 
 from core.platform import models
 current_user_services = models.Registry.import_current_user_services()
+memcache_services = models.Registry.import_memcache_services()
 (user_models,) = models.Registry.import_models([models.NAMES.user])
 import feconf
 import utils
@@ -272,9 +273,46 @@ def get_username(user_id):
         return get_user_settings(user_id, strict=True).username
 
 
+def _get_username_memcache_key(user_id):
+    """Returns the memcache key for the username of the given user."""
+    return 'username:%s' % user_id
+
+
 def get_usernames(user_ids):
-    users_settings = get_users_settings(user_ids)
-    return [us.username if us else None for us in users_settings]
+    """Returns a list with the usernames of the given users, in the same order.
+    The entry for a user is None if the user does not exist or has not chosen
+    a username yet.
+
+    Usernames are cached in memcache, and the remaining ones are fetched from
+    the datastore in a single batch.
+    """
+    usernames = {feconf.MIGRATION_BOT_USER_ID: feconf.MIGRATION_BOT_USERNAME}
+
+    uncached_user_ids = list(set(user_ids) - set(usernames.keys()))
+    memcache_keys = [
+        _get_username_memcache_key(user_id) for user_id in uncached_user_ids]
+    cached_usernames = memcache_services.get_multi(memcache_keys)
+    for (user_id, memcache_key) in zip(uncached_user_ids, memcache_keys):
+        if memcache_key in cached_usernames:
+            usernames[user_id] = cached_usernames[memcache_key]
+
+    uncached_user_ids = [
+        user_id for user_id in uncached_user_ids if user_id not in usernames]
+    if uncached_user_ids:
+        usernames_to_cache = {}
+        for (user_id, user_settings) in zip(
+                uncached_user_ids, get_users_settings(uncached_user_ids)):
+            usernames[user_id] = (
+                user_settings.username if user_settings else None)
+            # Only usernames that have been chosen are cached, because they
+            # cannot change afterwards.
+            if usernames[user_id]:
+                usernames_to_cache[_get_username_memcache_key(user_id)] = (
+                    usernames[user_id])
+        if usernames_to_cache:
+            memcache_services.set_multi(usernames_to_cache)
+
+    return [usernames[user_id] for user_id in user_ids]
 
 
 # NB: If we ever allow usernames to change, update the
@@ -289,6 +327,7 @@ def set_username(user_id, new_username):
             'a different one.' % new_username)
     user_settings.username = new_username
     _save_user_settings(user_settings)
+    memcache_services.delete(_get_username_memcache_key(user_id))
 
 
 def record_agreement_to_terms(user_id):
@@ -39,6 +39,33 @@ class UserServicesUnitTests(test_utils.GenericTestBase):
         user_services.set_username(user_id, username)
         self.assertEquals(username, user_services.get_username(user_id))
 
+    def test_get_usernames_uses_cache_and_is_updated_by_set_username(self):
+        user_services._create_user('user1', 'email1@email.com')
+        user_services._create_user('user2', 'email2@email.com')
+        user_services.set_username('user1', 'username1')
+
+        self.assertEqual(
+            user_services.get_usernames(
+                ['user1', 'user2', 'user1', 'fakeUser',
+                 feconf.MIGRATION_BOT_USER_ID]),
+            ['username1', None, 'username1', None,
+             feconf.MIGRATION_BOT_USERNAME])
+
+        # The username of user1 is now served from memcache.
+        get_users_settings_counter = test_utils.CallCounter(
+            user_services.get_users_settings)
+        with self.swap(
+                user_services, 'get_users_settings',
+                get_users_settings_counter):
+            self.assertEqual(
+                user_services.get_usernames(['user1']), ['username1'])
+        self.assertEqual(get_users_settings_counter.times_called, 0)
+
+        user_services.set_username('user2', 'username2')
+        self.assertEqual(
+            user_services.get_usernames(['user1', 'user2']),
+            ['username1', 'username2'])
+
     def test_get_username_for_nonexistent_user(self):
         with self.assertRaisesRegexp(Exception, 'User not found.'):
             user_services.get_username('fakeUser')
@@ -35,10 +35,12 @@ ONE_OFF_JOB_MANAGERS = [
     exp_jobs_one_off.ExplorationFirstPublishedOneOffJob,
     exp_jobs_one_off.ExpSummariesContributorsOneOffJob,
     exp_jobs_one_off.IndexAllExplorationsJobManager,
+    exp_jobs_one_off.LastHumanCommitBackfillOneOffJob,
     exp_jobs_one_off.ExpSummariesCreationOneOffJob,
     exp_jobs_one_off.ExplorationValidityJobManager,
     stats_jobs_one_off.StatisticsAudit,
-    exp_jobs_one_off.ExplorationMigrationJobManager]
+    exp_jobs_one_off.ExplorationMigrationJobManager,
+    exp_jobs_one_off.ExplorationMigrationDryRunJobManager]
 
 # List of all ContinuousComputation managers to show controls for on the
 # admin dashboard.
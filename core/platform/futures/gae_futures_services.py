@@ -0,0 +1,57 @@
+# coding: utf-8
+#
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provides a seam for issuing independent reads concurrently.
+
+Functions decorated with tasklet() return a future as soon as they are
+called. Inside them, yielding a future (or a list of futures) suspends the
+function until the results are available, and the datastore and memcache
+calls that are pending at that point are sent together. A handler can
+therefore start several reads, and then call wait_all() or get_result() to
+join them; its latency becomes that of the slowest read rather than the sum
+of all of them.
+"""
+
+from google.appengine.ext import ndb
+
+
+# Decorator for generator functions that should run asynchronously. For more
+# details, see
+#   https://developers.google.com/appengine/docs/python/ndb/async#tasklets
+tasklet = ndb.tasklet
+
+# The exception that a tasklet raises to return a value, since Python 2
+# generators cannot use 'return' with a value.
+Return = ndb.Return
+
+
+def make_completed_future(result):
+    """Returns a future whose result is already available. This is useful
+    when a value that is usually fetched asynchronously is known upfront.
+    """
+    future = ndb.Future()
+    future.set_result(result)
+    return future
+
+
+def wait_all(futures):
+    """Blocks until all the given futures are done. Entries that are None are
+    ignored.
+
+    This does not raise the exceptions of failed futures; these are raised
+    when get_result() is called on the corresponding futures.
+    """
+    ndb.Future.wait_all([future for future in futures if future is not None])
@@ -21,6 +21,7 @@ __author__ = 'Sean Lip'
 
 from core import counters
 from google.appengine.api import memcache
+from google.appengine.ext import ndb
 
 
 def get_multi(keys):
@@ -44,7 +45,25 @@ def get_multi(keys):
     return result
 
 
-def set_multi(key_value_mapping):
+@ndb.tasklet
+def get_multi_async(keys):
+    """Like get_multi(), but returns a future whose result is the dict of
+    key-value pairs. The lookups of all get_multi_async() calls that are
+    pending at the same time are batched into one memcache call.
+    """
+    assert isinstance(keys, list)
+    context = ndb.get_context()
+    values = yield [context.memcache_get(key) for key in keys]
+    result = {
+        key: value for (key, value) in zip(keys, values) if value is not None
+    }
+
+    counters.MEMCACHE_HIT.inc()
+
+    raise ndb.Return(result)
+
+
+def set_multi(key_value_mapping, timeout_secs=0):
     """Sets multiple keys' values at once.
 
     Args:
@@ -52,12 +71,15 @@ def set_multi(key_value_mapping):
           and the value is anything that is serializable using the Python
           pickle module. The combined size of each key and value must be
           < 1 MB. The total size of key_value_mapping should be at most 32 MB.
+      - timeout_secs: the number of seconds after which the values expire.
+          If this is 0, the values do not expire, although they may still be
+          evicted from memcache at any time.
 
     Returns:
       A list of the keys whose values were NOT set.
     """
     assert isinstance(key_value_mapping, dict)
-    unset_keys = memcache.set_multi(key_value_mapping)
+    unset_keys = memcache.set_multi(key_value_mapping, time=timeout_secs)
 
     if unset_keys:
         counters.MEMCACHE_SET_FAILURE.inc()
@@ -67,6 +89,22 @@ def set_multi(key_value_mapping):
     return unset_keys
 
 
+def incr(key, delta=1, initial_value=0):
+    """Atomically increments the integer value of a key in memcache.
+
+    Args:
+      - key: the key (string) whose value is to be incremented.
+      - delta: the (non-negative) amount by which to increment the value.
+      - initial_value: the value to which the key is set, before being
+          incremented, if it is not present in memcache.
+
+    Returns:
+      The new value of the key, or None if it could not be incremented.
+    """
+    assert isinstance(key, basestring)
+    return memcache.incr(key, delta=delta, initial_value=initial_value)
+
+
 def delete(key):
     """Deletes a key in memcache.
 
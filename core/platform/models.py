@@ -104,9 +104,18 @@ class _Gae(_Platform):
 
     @classmethod
     def import_search_services(cls):
+        if feconf.SEARCH_SERVICE == 'local':
+            from core.platform.search import local_search_services
+            return local_search_services
+
         from core.platform.search import gae_search_services
         return gae_search_services
 
+    @classmethod
+    def import_futures_services(cls):
+        from core.platform.futures import gae_futures_services
+        return gae_futures_services
+
     NAME = 'gae'
 
 
@@ -146,3 +155,7 @@ class Registry(object):
     @classmethod
     def import_search_services(cls):
         return cls._get().import_search_services()
+
+    @classmethod
+    def import_futures_services(cls):
+        return cls._get().import_futures_services()
@@ -27,6 +27,9 @@ import feconf
 from google.appengine.api import search as gae_search
 
 DEFAULT_NUM_RETRIES = 3
+# The maximum number of documents that the Search API accepts in a single
+# call to add_documents_to_index().
+MAX_DOCUMENTS_PER_PUT = 200
 
 
 class SearchFailureError(Exception):
@@ -0,0 +1,464 @@
+# coding: utf-8
+#
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS-IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Provides search services using an in-process inverted index.
+
+This has the same interface as gae_search_services, but keeps the indexes in
+the memory of the current process instead of calling the Search API. Select
+it by setting feconf.SEARCH_SERVICE to 'local'.
+
+Only the subset of the Search API query syntax that Oppia uses is supported:
+  - bare words and "quoted phrases", all of which must match a document. The
+    words of a phrase need not be adjacent.
+  - field restrictions of the form field:value, field=value and
+    field=("value1" OR "value2"). For the facet fields in FACET_FIELD_NAMES,
+    the value must be equal to the field's value; for other fields, all the
+    words of the value must occur in the field.
+"""
+
+import collections
+import copy
+import datetime
+import heapq
+import logging
+import numbers
+import re
+import uuid
+
+import feconf
+
+DEFAULT_NUM_RETRIES = 3
+# The maximum number of documents that the Search API accepts in a single
+# call to add_documents_to_index(). This is enforced here too, so that both
+# search services behave in the same way.
+MAX_DOCUMENTS_PER_PUT = 200
+
+# Fields whose values are matched as a whole in field restrictions, rather
+# than word by word.
+FACET_FIELD_NAMES = ['category', 'language_code', 'is']
+
+# Languages whose text is not delimited by spaces. Text in these languages is
+# split into individual characters.
+_CHARACTER_SPLIT_LANGUAGE_CODES = ['ja', 'zh']
+# Words that are not indexed, keyed by language code.
+_STOP_WORDS = {
+    'en': frozenset([
+        'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in',
+        'is', 'it', 'of', 'on', 'or', 'the', 'to', 'with']),
+}
+
+_WORD_REGEX = re.compile(r'\w+', re.UNICODE)
+_QUERY_TOKEN_REGEX = re.compile(
+    r'\s*(?:(?P<field>\w+)\s*[:=]\s*)?'
+    r'(?:"(?P<phrase>[^"]*)"|\((?P<group>[^()]*)\)|(?P<word>[^\s"()]+))',
+    re.UNICODE)
+_GROUP_VALUE_REGEX = re.compile(r'"([^"]*)"|([^\s"]+)', re.UNICODE)
+
+
+class SearchFailureError(Exception):
+    """This error is raised when a search operation fails."""
+    def __init__(self, original_exception=None):
+        super(SearchFailureError, self).__init__(
+            '%s: %s' % (type(original_exception), original_exception.message))
+        self.original_exception = original_exception
+
+
+class _QueryParseError(Exception):
+    pass
+
+
+class _Analyzer(object):
+    """Splits text in a given language into the words that are indexed."""
+
+    def __init__(self, split_into_characters, stop_words):
+        self._split_into_characters = split_into_characters
+        self._stop_words = stop_words
+
+    def get_words(self, text):
+        words = []
+        for word in _WORD_REGEX.findall(text.lower()):
+            if self._split_into_characters:
+                words.extend(list(word))
+            elif word not in self._stop_words:
+                words.append(word)
+        return words
+
+
+def _get_analyzer(language_code):
+    return _Analyzer(
+        language_code in _CHARACTER_SPLIT_LANGUAGE_CODES,
+        _STOP_WORDS.get(language_code, frozenset()))
+
+
+class _Index(object):
+    """An inverted index over the documents of a single search index.
+
+    Each document is indexed using the analyzer of its language, and the
+    postings are kept separately for each language so that a query can be
+    analyzed in the same way as the documents it is matched against.
+    """
+
+    def __init__(self):
+        # Maps each document id to the document dict.
+        self.documents = {}
+        # Maps each language code to the set of ids of documents in that
+        # language.
+        self.language_doc_ids = collections.defaultdict(set)
+        # Maps each language code to a dict that maps (field name, word)
+        # pairs to the set of ids of documents in that language whose field
+        # contains the word. The field name None stands for any field.
+        self.postings = collections.defaultdict(
+            lambda: collections.defaultdict(set))
+        # Maps each (facet field name, lowercased value) pair to the set of
+        # ids of documents with that value.
+        self.facets = collections.defaultdict(set)
+
+    def _get_posting_keys(self, doc):
+        """Returns the posting keys for a document dict, in the form of a
+        (language code, list of posting keys, list of facet keys) tuple.
+        """
+        language_code = doc['language_code']
+        analyzer = _get_analyzer(language_code)
+        posting_keys = set()
+        facet_keys = set()
+        for field_name, value in doc.iteritems():
+            if field_name in ['id', 'rank']:
+                continue
+            for item in (value if isinstance(value, list) else [value]):
+                if not isinstance(item, basestring):
+                    continue
+                if field_name in FACET_FIELD_NAMES:
+                    facet_keys.add((field_name, item.lower()))
+                for word in analyzer.get_words(item):
+                    posting_keys.add((None, word))
+                    posting_keys.add((field_name, word))
+        return language_code, posting_keys, facet_keys
+
+    def add(self, doc):
+        self.remove(doc['id'])
+        self.documents[doc['id']] = doc
+        language_code, posting_keys, facet_keys = self._get_posting_keys(doc)
+        self.language_doc_ids[language_code].add(doc['id'])
+        for key in posting_keys:
+            self.postings[language_code][key].add(doc['id'])
+        for key in facet_keys:
+            self.facets[key].add(doc['id'])
+
+    def remove(self, doc_id):
+        doc = self.documents.pop(doc_id, None)
+        if doc is None:
+            return
+        language_code, posting_keys, facet_keys = self._get_posting_keys(doc)
+        self.language_doc_ids[language_code].discard(doc_id)
+        language_postings = self.postings[language_code]
+        for key in posting_keys:
+            language_postings[key].discard(doc_id)
+            if not language_postings[key]:
+                del language_postings[key]
+        for key in facet_keys:
+            self.facets[key].discard(doc_id)
+            if not self.facets[key]:
+                del self.facets[key]
+
+    def _get_ids_matching_words(self, field_name, text):
+        """Returns the set of ids of documents whose field with the given
+        name (or any field, if field_name is None) contains all the words in
+        the given text. If the text has no indexed words in a language (e.g.
+        because it consists of stop words), all documents in that language
+        match it.
+        """
+        doc_ids = set()
+        for language_code, language_doc_ids in (
+                self.language_doc_ids.iteritems()):
+            words = _get_analyzer(language_code).get_words(text)
+            if not words:
+                doc_ids |= language_doc_ids
+                continue
+            language_postings = self.postings.get(language_code, {})
+            matching_ids = None
+            for word in words:
+                ids_with_word = language_postings.get((field_name, word), set())
+                matching_ids = (
+                    ids_with_word if matching_ids is None
+                    else matching_ids & ids_with_word)
+            doc_ids |= matching_ids
+        return doc_ids
+
+    def _get_ids_matching_term(self, field_name, values):
+        """Returns the set of ids of documents that match any of the given
+        values, which are restricted to the given field (if it is not None).
+        """
+        doc_ids = set()
+        for value in values:
+            if field_name in FACET_FIELD_NAMES:
+                doc_ids |= self.facets.get((field_name, value.lower()), set())
+            else:
+                doc_ids |= self._get_ids_matching_words(field_name, value)
+        return doc_ids
+
+    def get_matching_ids(self, query_string):
+        """Returns the set of ids of documents that match the given query.
+
+        Raises _QueryParseError if the query cannot be parsed.
+        """
+        matching_ids = set(self.documents.keys())
+        for field_name, values in _parse_query(query_string):
+            matching_ids &= self._get_ids_matching_term(field_name, values)
+        return matching_ids
+
+
+def _parse_query(query_string):
+    """Parses a query string into a list of (field_name, values) pairs, each
+    of which represents a term of the query. field_name is None for terms
+    that are not restricted to a field. A document matches a term if it
+    matches any of its values.
+
+    Raises _QueryParseError if the query cannot be parsed.
+    """
+    terms = []
+    position = 0
+    query_string = query_string.strip()
+    while position < len(query_string):
+        match = _QUERY_TOKEN_REGEX.match(query_string, position)
+        if match is None or match.end() == position:
+            raise _QueryParseError(query_string)
+        position = match.end()
+
+        field_name = match.group('field')
+        if match.group('group') is not None:
+            values = []
+            for phrase, word in _GROUP_VALUE_REGEX.findall(
+                    match.group('group')):
+                if word == 'OR':
+                    continue
+                if word in ['AND', 'NOT']:
+                    raise _QueryParseError(query_string)
+                values.append(phrase or word)
+            if not values:
+                raise _QueryParseError(query_string)
+        elif match.group('phrase') is not None:
+            values = [match.group('phrase')]
+        else:
+            word = match.group('word')
+            if field_name is None and word == 'AND':
+                continue
+            if field_name is None and word in ['OR', 'NOT']:
+                raise _QueryParseError(query_string)
+            values = [word]
+        terms.append((field_name, values))
+    return terms
+
+
+# Maps each index name to its _Index.
+_INDEXES = collections.defaultdict(_Index)
+
+
+def _validate_index_name(index):
+    if not isinstance(index, basestring):
+        raise ValueError(
+            'Index must be the unicode/str name of an index, got %s'
+            % type(index))
+
+
+def _normalize_value(key, value):
+    if isinstance(value, list):
+        for i in xrange(len(value)):
+            if isinstance(value[i], list):
+                raise ValueError(
+                    'All values of a multi-valued field must be numbers, '
+                    'strings, date or datetime instances, The %dth value for '
+                    'field %s has type %s.' % (i, key, type(value[i])))
+        return [_normalize_value(key, item) for item in value]
+
+    if isinstance(value, (basestring, numbers.Number, datetime.datetime)):
+        return value
+
+    if isinstance(value, datetime.date):
+        # The Search API returns date fields as datetime fields with time at
+        # midnight.
+        return datetime.datetime.combine(value, datetime.datetime.min.time())
+
+    raise ValueError(
+        'Value for document field %s should be a (unicode) string, numeric '
+        'type, datetime.date, datetime.datetime or list of such types, got %s'
+        % (key, type(value)))
+
+
+def _dict_to_search_document(d):
+    if not isinstance(d, dict):
+        raise ValueError('document should be a dictionary, got %s' % type(d))
+
+    doc = {
+        'id': d.get('id') or uuid.uuid4().hex,
+        'rank': d.get('rank'),
+        'language_code': (
+            d.get('language_code') or feconf.DEFAULT_LANGUAGE_CODE),
+    }
+    for key, value in d.iteritems():
+        if key not in doc:
+            doc[key] = _normalize_value(key, value)
+    return doc
+
+
+def add_documents_to_index(documents, index, retries=DEFAULT_NUM_RETRIES):
+    """Adds a document to an index.
+
+    See gae_search_services.add_documents_to_index() for details.
+    """
+    _validate_index_name(index)
+    if len(documents) > MAX_DOCUMENTS_PER_PUT:
+        raise ValueError(
+            'Cannot add more than %d documents to an index at once, got %d'
+            % (MAX_DOCUMENTS_PER_PUT, len(documents)))
+
+    search_documents = [_dict_to_search_document(d) for d in documents]
+    logging.debug(
+        'adding the following docs to index %s: %s', index, documents)
+    for doc in search_documents:
+        _INDEXES[index].add(doc)
+    return [doc['id'] for doc in search_documents]
+
+
+def delete_documents_from_index(
+        doc_ids, index, retries=DEFAULT_NUM_RETRIES):
+    """Deletes documents from an index.
+
+    See gae_search_services.delete_documents_from_index() for details.
+    """
+    _validate_index_name(index)
+    for i in xrange(len(doc_ids)):
+        if not isinstance(doc_ids[i], basestring):
+            raise ValueError('all doc_ids must be string, got %s at index %d' %
+                             (type(doc_ids[i]), i))
+
+    for doc_id in doc_ids:
+        _INDEXES[index].remove(doc_id)
+
+
+def clear_index(index_name):
+    """Clears an index completely.
+
+    Args:
+      - index_name: the name of the index to clear, a string.
+    """
+    _INDEXES.pop(index_name, None)
+
+
+def _get_sort_key_function(sort):
+    """Returns a function that maps a document dict to a key with which the
+    documents can be sorted in the order given by the sort string. Documents
+    that do not have a value for a sort field are placed after those that do.
+    """
+    sort_fields = []
+    for expression in sort.split():
+        if expression.startswith('+'):
+            is_descending = False
+        elif expression.startswith('-'):
+            is_descending = True
+        else:
+            raise ValueError(
+                'Fields in the sort expression must start with "+"'
+                ' or "-" to indicate sort direction.'
+                ' The field %s has no such indicator'
+                ' in expression "%s".' % (expression, sort))
+        sort_fields.append((expression[1:], is_descending))
+
+    def _get_sort_key(doc):
+        key = []
+        for field_name, is_descending in sort_fields:
+            value = doc.get(field_name)
+            if isinstance(value, list):
+                value = value[0] if value else None
+            if value is None:
+                key.append((True, None))
+            elif is_descending:
+                key.append((False, _DescendingValue(value)))
+            else:
+                key.append((False, value))
+        key.append(doc['id'])
+        return key
+
+    return _get_sort_key
+
+
+class _DescendingValue(object):
+    """Wraps a value so that it sorts in reverse order."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value > other.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def search(query_string, index, cursor=None, limit=feconf.GALLERY_PAGE_SIZE,
+           sort='', ids_only=False, retries=DEFAULT_NUM_RETRIES):
+    """Searches for documents in an index.
+
+    See gae_search_services.search() for details. When sort is empty, results
+    are ordered by descending rank. The cursor is the offset of the next page
+    of results.
+    """
+    _validate_index_name(index)
+    offset = int(cursor) if cursor else 0
+
+    # The sort expression is validated before the query is parsed, as the
+    # Search API does.
+    if sort:
+        sort_key_function = _get_sort_key_function(sort)
+    else:
+        sort_key_function = lambda doc: (-(doc['rank'] or 0), doc['id'])
+
+    search_index = _INDEXES.get(index, _Index())
+    try:
+        matching_ids = search_index.get_matching_ids(query_string)
+    except _QueryParseError:
+        logging.exception('Could not parse query string %s' % query_string)
+        return [], None
+
+    # Only the documents up to the end of the requested page are sorted.
+    result_docs = heapq.nsmallest(
+        offset + limit,
+        [search_index.documents[doc_id] for doc_id in matching_ids],
+        key=sort_key_function)[offset:]
+
+    result_cursor_str = None
+    if offset + limit < len(matching_ids):
+        result_cursor_str = str(offset + limit)
+
+    if ids_only:
+        return [doc['id'] for doc in result_docs], result_cursor_str
+    else:
+        return [copy.deepcopy(doc) for doc in result_docs], result_cursor_str
+
+
+def get_document_from_index(doc_id, index):
+    """Returns a document with a give doc_id(s) from the index.
+
+    args:
+      - doc_id: a doc_id as a string
+      - index: the name of an index, a string.
+
+    returns
+      - the requested document as a dict, or None if there is no document
+        with this id in the index.
+    """
+    _validate_index_name(index)
+    doc = _INDEXES.get(index, _Index()).documents.get(doc_id)
+    return copy.deepcopy(doc)
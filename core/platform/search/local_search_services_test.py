@@ -0,0 +1,141 @@
+# coding: utf-8
+#
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS-IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the in-process search services."""
+
+import datetime
+
+from core.platform.search import local_search_services
+from core.tests import test_utils
+
+
+class LocalSearchServicesTests(test_utils.GenericTestBase):
+    """Test adding, retrieving, searching and deleting documents."""
+
+    INDEX_NAME = 'index'
+
+    def setUp(self):
+        super(LocalSearchServicesTests, self).setUp()
+        local_search_services.clear_index(self.INDEX_NAME)
+        local_search_services.add_documents_to_index([{
+            'id': 'doc_en',
+            'title': 'The algebra of fractions',
+            'category': 'Algebra',
+            'language_code': 'en',
+            'tags': ['math', 'numbers'],
+            'is': 'featured',
+            'rank': 10,
+        }, {
+            'id': 'doc_fr',
+            'title': u'Les fractions',
+            'category': 'Mathematics',
+            'language_code': 'fr',
+            'rank': 30,
+        }, {
+            'id': 'doc_zh',
+            'title': u'分数入门',
+            'category': 'Mathematics',
+            'language_code': 'zh',
+            'rank': 20,
+        }], self.INDEX_NAME)
+
+    def tearDown(self):
+        local_search_services.clear_index(self.INDEX_NAME)
+        super(LocalSearchServicesTests, self).tearDown()
+
+    def _search_ids(self, query_string, **kwargs):
+        return local_search_services.search(
+            query_string, self.INDEX_NAME, ids_only=True, **kwargs)[0]
+
+    def test_get_document_from_index(self):
+        date = datetime.date(year=2015, month=3, day=14)
+        local_search_services.add_documents_to_index(
+            [{'id': 'doc', 'datefield': date}], self.INDEX_NAME)
+
+        doc = local_search_services.get_document_from_index(
+            'doc', self.INDEX_NAME)
+        self.assertEqual(doc['language_code'], 'en')
+        self.assertEqual(
+            doc['datefield'],
+            datetime.datetime.combine(date, datetime.datetime.min.time()))
+        self.assertIsNone(local_search_services.get_document_from_index(
+            'nonexistent_doc', self.INDEX_NAME))
+
+    def test_results_are_ordered_by_rank(self):
+        self.assertEqual(
+            self._search_ids(''), ['doc_fr', 'doc_zh', 'doc_en'])
+        self.assertEqual(
+            self._search_ids('', sort='+title'),
+            ['doc_fr', 'doc_en', 'doc_zh'])
+
+    def test_word_and_field_queries(self):
+        self.assertEqual(
+            self._search_ids('FRACTIONS'), ['doc_fr', 'doc_en'])
+        self.assertEqual(self._search_ids('algebra fractions'), ['doc_en'])
+        self.assertEqual(self._search_ids('tags:math'), ['doc_en'])
+        self.assertEqual(self._search_ids('title:math'), [])
+
+    def test_facet_queries(self):
+        self.assertEqual(
+            self._search_ids('category=("Algebra" OR "Mathematics")'),
+            ['doc_fr', 'doc_zh', 'doc_en'])
+        self.assertEqual(
+            self._search_ids(
+                'fractions category=("Mathematics") language_code=("fr")'),
+            ['doc_fr'])
+        self.assertEqual(self._search_ids('is:featured'), ['doc_en'])
+        # Facet fields are matched as a whole.
+        self.assertEqual(self._search_ids('category=Math'), [])
+
+    def test_language_specific_analysis(self):
+        # Stop words are not indexed for English.
+        self.assertEqual(self._search_ids('title:the'), ['doc_en'])
+        self.assertEqual(self._search_ids('of'), ['doc_en'])
+        # Chinese text is split into characters.
+        self.assertEqual(self._search_ids(u'分数'), ['doc_zh'])
+        self.assertEqual(self._search_ids(u'数'), ['doc_zh'])
+
+    def test_paging(self):
+        results, cursor = local_search_services.search(
+            '', self.INDEX_NAME, limit=2, ids_only=True)
+        self.assertEqual(results, ['doc_fr', 'doc_zh'])
+
+        results, cursor = local_search_services.search(
+            '', self.INDEX_NAME, limit=2, cursor=cursor, ids_only=True)
+        self.assertEqual(results, ['doc_en'])
+        self.assertIsNone(cursor)
+
+    def test_unparseable_query_returns_no_results(self):
+        self.assertEqual(
+            local_search_services.search('NOT', self.INDEX_NAME), ([], None))
+
+    def test_update_and_delete_documents(self):
+        local_search_services.add_documents_to_index([{
+            'id': 'doc_en', 'title': 'Geometry', 'language_code': 'en',
+        }], self.INDEX_NAME)
+        self.assertEqual(self._search_ids('fractions'), ['doc_fr'])
+        self.assertEqual(self._search_ids('geometry'), ['doc_en'])
+
+        local_search_services.delete_documents_from_index(
+            ['doc_en', 'doc_fr'], self.INDEX_NAME)
+        self.assertEqual(self._search_ids(''), ['doc_zh'])
+
+    def test_too_many_documents_are_rejected(self):
+        with self.assertRaisesRegexp(ValueError, 'Cannot add more than'):
+            local_search_services.add_documents_to_index(
+                [{'id': 'doc%d' % i} for i in range(
+                    local_search_services.MAX_DOCUMENTS_PER_PUT + 1)],
+                self.INDEX_NAME)
@@ -84,6 +84,23 @@ class BaseModel(ndb.Model):
                 (cls.__name__, entity_id))
         return entity
 
+    @classmethod
+    @ndb.tasklet
+    def get_async(cls, entity_id, strict=True):
+        """Starts fetching the entity with the given id, and returns a future
+        whose result is the entity that get() would return. If get() would
+        raise an exception, the future raises it instead.
+        """
+        entity = yield cls.get_by_id_async(entity_id)
+        if entity and entity.deleted:
+            entity = None
+
+        if strict and entity is None:
+            raise cls.EntityNotFoundError(
+                'Entity for class %s with id %s not found' %
+                (cls.__name__, entity_id))
+        raise ndb.Return(entity)
+
     def put(self):
         super(BaseModel, self).put()
 
@@ -95,13 +112,25 @@ class BaseModel(ndb.Model):
           - the instance is not found
           - the instance has been deleted, and `include_deleted` is True.
         """
+        return cls.get_multi_async(
+            entity_ids, include_deleted=include_deleted).get_result()
+
+    @classmethod
+    @ndb.tasklet
+    def get_multi_async(cls, entity_ids, include_deleted=False):
+        """Starts fetching the entities with the given ids, and returns a
+        future whose result is the list that get_multi() would return.
+
+        Fetches that are started before any of their results are needed are
+        sent to the datastore concurrently.
+        """
         entity_keys = [ndb.Key(cls, entity_id) for entity_id in entity_ids]
-        entities = ndb.get_multi(entity_keys)
+        entities = yield ndb.get_multi_async(entity_keys)
         if not include_deleted:
             for i in xrange(len(entities)):
                 if entities[i] and entities[i].deleted:
                     entities[i] = None
-        return entities
+        raise ndb.Return(entities)
 
     @classmethod
     def put_multi(cls, entities):
@@ -172,6 +201,44 @@ class BaseModel(ndb.Model):
             (result[1].urlsafe() if result[1] else None),
             result[2])
 
+    @classmethod
+    def _fetch_page_sorted_by_key(
+            cls, query, page_size, urlsafe_start_cursor):
+        """Returns a 3-tuple: a list of at most page_size entities matching
+        the query, ordered by key, followed by the urlsafe cursor for the next
+        page (or None) and a boolean indicating whether there are more results.
+
+        Ordering by key allows cursors to be used with queries that have IN
+        filters.
+        """
+        if urlsafe_start_cursor:
+            start_cursor = datastore_query.Cursor(urlsafe=urlsafe_start_cursor)
+        else:
+            start_cursor = None
+
+        result = query.order(cls.key).fetch_page(
+            page_size, start_cursor=start_cursor)
+        return (
+            result[0],
+            (result[1].urlsafe() if result[1] else None),
+            result[2])
+
+    @classmethod
+    def _iterate_sorted_by_key(cls, query, batch_size):
+        """Yields all entities matching the query, ordered by key.
+
+        Entities are fetched batch_size at a time using cursors, so the number
+        of results is not capped and only one batch is held in memory.
+        """
+        urlsafe_cursor = None
+        more = True
+        while more:
+            entities, urlsafe_cursor, more = cls._fetch_page_sorted_by_key(
+                query, batch_size, urlsafe_cursor)
+            for entity in entities:
+                yield entity
+            more = more and urlsafe_cursor is not None
+
 
 class VersionedModel(BaseModel):
     """Model that handles storage of the version history of model instances.
@@ -233,7 +300,13 @@ class VersionedModel(BaseModel):
 
     def _reconstitute_from_snapshot_id(self, snapshot_id):
         """Makes this instance into a reconstitution of the given snapshot."""
-        snapshot_model = self.SNAPSHOT_CONTENT_CLASS.get(snapshot_id)
+        return self._reconstitute_from_snapshot_model(
+            self.SNAPSHOT_CONTENT_CLASS.get(snapshot_id))
+
+    def _reconstitute_from_snapshot_model(self, snapshot_model):
+        """Makes this instance into a reconstitution of the given snapshot
+        content model.
+        """
         snapshot_dict = snapshot_model.content
         reconstituted_model = self._reconstitute(snapshot_dict)
         # TODO(sll): The 'created_on' and 'last_updated' values here will be
@@ -386,11 +459,25 @@ class VersionedModel(BaseModel):
         The snapshot content is used to populate this model instance. The
         snapshot metadata is not used.
         """
-        cls.get(model_instance_id)._require_not_marked_deleted()
+        return cls.get_version_async(
+            model_instance_id, version_number).get_result()
 
+    @classmethod
+    @ndb.tasklet
+    def get_version_async(cls, model_instance_id, version_number):
+        """Starts fetching the given version of a model instance, and returns
+        a future whose result is the model instance that get_version() would
+        return. The model and its snapshot content are fetched concurrently.
+        """
         snapshot_id = cls._get_snapshot_id(model_instance_id, version_number)
-        return cls(id=model_instance_id)._reconstitute_from_snapshot_id(
-            snapshot_id)
+        model_instance, snapshot_model = yield (
+            super(VersionedModel, cls).get_async(model_instance_id),
+            cls.SNAPSHOT_CONTENT_CLASS.get_async(snapshot_id))
+        model_instance._require_not_marked_deleted()
+
+        raise ndb.Return(
+            cls(id=model_instance_id)._reconstitute_from_snapshot_model(
+                snapshot_model))
 
     @classmethod
     def get(cls, entity_id, strict=True, version=None):
@@ -400,6 +487,75 @@ class VersionedModel(BaseModel):
         else:
             return cls.get_version(entity_id, version)
 
+    @classmethod
+    @ndb.tasklet
+    def get_async(cls, entity_id, strict=True, version=None):
+        """Starts fetching the entity with the given id (and version, if one
+        is given), and returns a future whose result is the entity that get()
+        would return.
+        """
+        if version is None:
+            entity = yield super(VersionedModel, cls).get_async(
+                entity_id, strict=strict)
+        else:
+            entity = yield cls.get_version_async(entity_id, version)
+        raise ndb.Return(entity)
+
+    def get_last_human_commit_metadata(self):
+        """Returns a dict representing the snapshot of the latest commit to
+        this model instance that was not made by the migration bot, or None if
+        there is no such commit.
+
+        The dict has the same keys as those returned by
+        get_snapshots_metadata(). The history is walked backwards from the
+        latest version one snapshot at a time, since at most a few of the
+        latest commits are expected to be automated.
+        """
+        for version_number in range(self.version, 0, -1):
+            snapshot_metadata = self.get_snapshots_metadata(
+                self.id, [version_number], allow_deleted=True)[0]
+            if (snapshot_metadata['committer_id'] !=
+                    feconf.MIGRATION_BOT_USER_ID):
+                return snapshot_metadata
+        return None
+
+    def backfill_last_human_commit(self):
+        """Records the details of the last commit to this model instance that
+        was not made by the migration bot, without creating a new version.
+
+        This is only for subclasses that declare last_human_committer_id,
+        last_human_commit_version and last_human_commit_msec properties, and
+        that leave these out of their snapshots.
+
+        The details are taken from the snapshot history up to the version of
+        this instance. They are then set, in a transaction, on the stored
+        instance, which is left unchanged if it has been committed to since
+        this instance was read or already records these details.
+
+        Returns True if the details were recorded, and False otherwise.
+        """
+        snapshot_metadata = self.get_last_human_commit_metadata()
+        if snapshot_metadata is None:
+            return False
+
+        def _backfill_if_unchanged():
+            stored_instance = self.get_by_id(self.id)
+            if (stored_instance is None or
+                    stored_instance.version != self.version or
+                    stored_instance.last_human_commit_version is not None):
+                return False
+
+            stored_instance.last_human_committer_id = (
+                snapshot_metadata['committer_id'])
+            stored_instance.last_human_commit_version = (
+                snapshot_metadata['version_number'])
+            stored_instance.last_human_commit_msec = (
+                snapshot_metadata['created_on_ms'])
+            super(VersionedModel, stored_instance).put()
+            return True
+
+        return transaction_services.run_in_transaction(_backfill_if_unchanged)
+
     @classmethod
     def get_snapshots_metadata(
             cls, model_instance_id, version_numbers, allow_deleted=False):
@@ -75,6 +75,38 @@ class BaseModelUnitTests(test_utils.GenericTestBase):
 
         self.assertEqual(result, [model1, None, None])
 
+    def test_get_multi_async(self):
+        model1 = base_models.BaseModel()
+        model2 = base_models.BaseModel()
+        model2.deleted = True
+
+        model1.put()
+        model2.put()
+
+        future1 = base_models.BaseModel.get_multi_async([model1.id, 'none'])
+        future2 = base_models.BaseModel.get_multi_async(
+            [model2.id], include_deleted=True)
+
+        self.assertEqual(future1.get_result(), [model1, None])
+        self.assertEqual(future2.get_result(), [model2])
+
+    def test_get_async(self):
+        model1 = base_models.BaseModel()
+        model2 = base_models.BaseModel()
+        model2.deleted = True
+
+        model1.put()
+        model2.put()
+
+        future1 = base_models.BaseModel.get_async(model1.id)
+        future2 = base_models.BaseModel.get_async(model2.id, strict=False)
+        future3 = base_models.BaseModel.get_async('none')
+
+        self.assertEqual(future1.get_result(), model1)
+        self.assertIsNone(future2.get_result())
+        with self.assertRaises(base_models.BaseModel.EntityNotFoundError):
+            future3.get_result()
+
     def test_get_new_id_method_returns_unique_ids(self):
         ids = set([])
         for _ in range(100):
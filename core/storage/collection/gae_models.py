@@ -23,6 +23,7 @@ import datetime
 import core.storage.base_model.gae_models as base_models
 import core.storage.user.gae_models as user_models
 import feconf
+import utils
 
 from google.appengine.ext import ndb
 
@@ -60,6 +61,15 @@ class CollectionModel(base_models.VersionedModel):
     # A dict representing all explorations belonging to this collection.
     nodes = ndb.JsonProperty(default={}, indexed=False)
 
+    # The id of the user who made the latest commit to this collection that
+    # was not made by the migration bot, the version number of that commit,
+    # and the time at which it was made, in milliseconds since the Epoch.
+    # These are None for collections that have not been committed to since
+    # they were introduced, until LastHumanCommitBackfillOneOffJob is run.
+    last_human_committer_id = ndb.StringProperty(indexed=False)
+    last_human_commit_version = ndb.IntegerProperty(indexed=False)
+    last_human_commit_msec = ndb.FloatProperty(indexed=False)
+
     @classmethod
     def get_collection_count(cls):
         """Returns the total number of collections."""
@@ -70,12 +80,29 @@ class CollectionModel(base_models.VersionedModel):
         super(CollectionModel, self).commit(
             committer_id, commit_message, commit_cmds)
 
+    def _compute_snapshot(self):
+        """Generates a snapshot of the collection. The details of the last
+        human commit are omitted, since they describe the history of the
+        collection rather than its content.
+        """
+        return self.to_dict(exclude=[
+            'created_on', 'last_updated', 'last_human_committer_id',
+            'last_human_commit_version', 'last_human_commit_msec'])
+
     def _trusted_commit(
             self, committer_id, commit_type, commit_message, commit_cmds):
         """Record the event to the commit log after the model commit.
 
         Note that this extends the superclass method.
         """
+        if committer_id != feconf.MIGRATION_BOT_USER_ID:
+            # The superclass method increments the version and saves this
+            # model.
+            self.last_human_committer_id = committer_id
+            self.last_human_commit_version = self.version + 1
+            self.last_human_commit_msec = (
+                utils.get_current_time_in_millisecs())
+
         super(CollectionModel, self)._trusted_commit(
             committer_id, commit_type, commit_message, commit_cmds)
 
@@ -23,6 +23,7 @@ import datetime
 import core.storage.base_model.gae_models as base_models
 import core.storage.user.gae_models as user_models
 import feconf
+import utils
 
 from google.appengine.ext import ndb
 
@@ -92,6 +93,15 @@ class ExplorationModel(base_models.VersionedModel):
     # TODO(sll): Remove this property from the model.
     default_skin = ndb.StringProperty(default=feconf.DEFAULT_SKIN_ID)
 
+    # The id of the user who made the latest commit to this exploration that
+    # was not made by the migration bot, the version number of that commit,
+    # and the time at which it was made, in milliseconds since the Epoch.
+    # These are None for explorations that have not been committed to since
+    # they were introduced, until LastHumanCommitBackfillOneOffJob is run.
+    last_human_committer_id = ndb.StringProperty(indexed=False)
+    last_human_commit_version = ndb.IntegerProperty(indexed=False)
+    last_human_commit_msec = ndb.FloatProperty(indexed=False)
+
     @classmethod
     def get_exploration_count(cls):
         """Returns the total number of explorations."""
@@ -102,12 +112,29 @@ class ExplorationModel(base_models.VersionedModel):
         super(ExplorationModel, self).commit(
             committer_id, commit_message, commit_cmds)
 
+    def _compute_snapshot(self):
+        """Generates a snapshot of the exploration. The details of the last
+        human commit are omitted, since they describe the history of the
+        exploration rather than its content.
+        """
+        return self.to_dict(exclude=[
+            'created_on', 'last_updated', 'last_human_committer_id',
+            'last_human_commit_version', 'last_human_commit_msec'])
+
     def _trusted_commit(
             self, committer_id, commit_type, commit_message, commit_cmds):
         """Record the event to the commit log after the model commit.
 
         Note that this extends the superclass method.
         """
+        if committer_id != feconf.MIGRATION_BOT_USER_ID:
+            # The superclass method increments the version and saves this
+            # model.
+            self.last_human_committer_id = committer_id
+            self.last_human_commit_version = self.version + 1
+            self.last_human_commit_msec = (
+                utils.get_current_time_in_millisecs())
+
         super(ExplorationModel, self)._trusted_commit(
             committer_id, commit_type, commit_message, commit_cmds)
 
@@ -364,6 +391,28 @@ class ExpSummaryModel(base_models.BaseModel):
             ExpSummaryModel.deleted == False
         ).fetch(feconf.DEFAULT_QUERY_LIMIT)
 
+    @classmethod
+    def _get_non_private_query(cls):
+        return ExpSummaryModel.query().filter(
+            ExpSummaryModel.status.IN([
+                feconf.ACTIVITY_STATUS_PUBLIC,
+                feconf.ACTIVITY_STATUS_PUBLICIZED])
+        ).filter(
+            ExpSummaryModel.deleted == False
+        )
+
+    @classmethod
+    def iterate_non_private(
+            cls, batch_size=feconf.SUMMARY_ITERATION_BATCH_SIZE):
+        """Yields all non-private exp summary models, ordered by id."""
+        return cls._iterate_sorted_by_key(
+            cls._get_non_private_query(), batch_size)
+
+    @classmethod
+    def iterate_all(cls, batch_size=feconf.SUMMARY_ITERATION_BATCH_SIZE):
+        """Yields all undeleted exp summary models, ordered by id."""
+        return cls._iterate_sorted_by_key(cls.get_all(), batch_size)
+
     @classmethod
     def get_private_at_least_viewable(cls, user_id):
         """Returns an iterable with private exp summaries that are at least
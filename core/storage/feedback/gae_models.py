@@ -64,6 +64,17 @@ class FeedbackThreadModel(base_models.BaseModel):
     subject = ndb.StringProperty(indexed=False)
     # Summary text of the thread.
     summary = ndb.TextProperty(indexed=False)
+    # The number of messages in the thread, including deleted ones. This is
+    # also the message id of the next message in the thread. It is None for
+    # threads created before this field was introduced.
+    message_count = ndb.IntegerProperty(indexed=False)
+    # ID of the user who posted the last message in the thread. This may be
+    # None if that message was given anonymously by a learner, or if
+    # message_count is None.
+    last_message_author_id = ndb.StringProperty(indexed=False)
+    # The time when the last message in the thread was created. This is None
+    # if message_count is None.
+    last_message_created_on = ndb.DateTimeProperty(indexed=False)
 
     @classmethod
     def generate_new_thread_id(cls, exploration_id):
@@ -149,9 +160,6 @@ class FeedbackMessageModel(base_models.BaseModel):
     def exploration_id(self):
         return self.id.split('.')[0]
 
-    def get_thread_subject(self):
-        return FeedbackThreadModel.get_by_id(self.thread_id).subject
-
     @classmethod
     def create(cls, thread_id, message_id):
         """Creates a new FeedbackMessageModel entry.
@@ -194,7 +202,9 @@ class FeedbackMessageModel(base_models.BaseModel):
     def get_message_count(cls, thread_id):
         """Returns the number of messages in the thread.
 
-        Includes the deleted entries.
+        Includes the deleted entries. This runs a query over the messages in
+        the thread, so FeedbackThreadModel.message_count should be used
+        instead whenever it is set.
         """
         return cls.get_all(include_deleted_entities=True).filter(
             cls.thread_id == thread_id).count()
@@ -21,7 +21,6 @@ __author__ = 'Sean Lip'
 import os
 
 import core.storage.base_model.gae_models as base_models
-import feconf
 import utils
 
 from google.appengine.ext import ndb
@@ -49,9 +48,18 @@ class FileMetadataModel(base_models.VersionedModel):
         raise NotImplementedError
 
     @classmethod
-    def get_undeleted(cls):
-        return cls.get_all().filter(cls.deleted == False).fetch(
-            feconf.DEFAULT_QUERY_LIMIT)
+    def get_undeleted_with_id_prefix(cls, id_prefix):
+        """Returns all undeleted models whose ids start with id_prefix.
+
+        Since model ids start with the exploration id, this is a key range
+        scan that only touches the files of a single exploration.
+        """
+        start_key = ndb.Key(cls, id_prefix)
+        end_key = ndb.Key(cls, u'%s\ufffd' % id_prefix)
+        return [
+            model for model in cls.query(
+                cls.key >= start_key, cls.key < end_key).fetch()
+            if not model.deleted]
 
     @classmethod
     def _construct_id(cls, exploration_id, filepath):
@@ -124,6 +132,15 @@ class FileModel(base_models.VersionedModel):
         model_id = cls._construct_id(exploration_id, filepath)
         return super(FileModel, cls).get(model_id, strict=strict)
 
+    @classmethod
+    def get_models(cls, exploration_id, filepaths):
+        """Returns a list of the models for the given filepaths, fetched in a
+        single batch. Missing or deleted files have None entries.
+        """
+        return cls.get_multi([
+            cls._construct_id(exploration_id, filepath)
+            for filepath in filepaths])
+
     def commit(self, committer_id, commit_cmds):
         return super(FileModel, self).commit(committer_id, '', commit_cmds)
 
@@ -106,6 +106,15 @@ class JobModel(base_models.BaseModel):
     def do_unfinished_jobs_exist(cls, job_type):
         return bool(cls.get_unfinished_jobs(job_type).count(limit=1))
 
+    @classmethod
+    def get_latest_completed_job(cls, job_type):
+        """Returns the most recently queued job of the given type that has
+        completed successfully, or None if there is no such job.
+        """
+        return cls.query().filter(cls.job_type == job_type).filter(
+            cls.status_code == STATUS_CODE_COMPLETED
+        ).order(-cls.time_queued_msec).get()
+
 
 # Allowed transitions: idle --> running --> stopping --> idle.
 CONTINUOUS_COMPUTATION_STATUS_CODE_IDLE = 'idle'
@@ -194,6 +194,17 @@ class CollectionProgressModel(base_models.BaseModel):
         return super(CollectionProgressModel, cls).get(
             instance_id, strict=False)
 
+    @classmethod
+    @ndb.tasklet
+    def get_async(cls, user_id, collection_id):
+        """Starts fetching the CollectionProgressModel for the given ids, and
+        returns a future whose result is the model, or None if it does not
+        exist.
+        """
+        instance_models = yield cls.get_multi_async(
+            [cls._generate_id(user_id, collection_id)])
+        raise ndb.Return(instance_models[0])
+
     @classmethod
     def get_or_create(cls, user_id, collection_id):
         """Gets the CollectionProgressModel for the given ids, or creates a new
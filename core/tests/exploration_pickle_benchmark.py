@@ -0,0 +1,134 @@
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for the memory use and memcache payload size of the demo
+explorations, and for the time taken to unpickle them.
+
+Explorations are pickled in the same way as by memcache. Run this script from
+the Oppia root directory, before and after a change to the exploration domain
+objects, and compare the results:
+
+    python core/tests/exploration_pickle_benchmark.py --iteration_count=20
+
+"""
+
+import argparse
+import cPickle
+import os
+import sys
+import time
+
+CURR_DIR = os.path.abspath(os.getcwd())
+sys.path.insert(0, CURR_DIR)
+
+from core.domain import exp_domain
+import feconf
+import utils
+
+
+PARSER = argparse.ArgumentParser()
+PARSER.add_argument(
+    '--iteration_count',
+    help='Number of times that all the explorations are unpickled. The '
+    'fastest of these runs is reported.',
+    default=20, type=int)
+
+
+def _get_demo_explorations():
+    """Returns a list of the demo explorations, as Exploration domain
+    objects. Demo explorations that cannot be converted to the latest schema
+    version are skipped.
+    """
+    explorations = []
+    for ind, (demo_path, title, category) in enumerate(
+            feconf.DEMO_EXPLORATIONS):
+        demo_filepath = os.path.join(
+            feconf.SAMPLE_EXPLORATIONS_DIR, demo_path)
+        if demo_filepath.endswith('yaml'):
+            yaml_content = utils.get_file_contents(demo_filepath)
+        else:
+            yaml_content, _ = utils.get_exploration_components_from_dir(
+                demo_filepath)
+        try:
+            explorations.append(exp_domain.Exploration.from_untitled_yaml(
+                str(ind), title, category, yaml_content))
+        except utils.ExplorationConversionError as e:
+            print 'Skipping %s: %s' % (demo_path, e)
+    return explorations
+
+
+def _get_domain_objects(exploration):
+    """Returns a list of the domain objects that make up the states of the
+    given exploration.
+    """
+    domain_objects = []
+    for state in exploration.states.itervalues():
+        interaction = state.interaction
+        outcomes = interaction.get_all_outcomes()
+        domain_objects.extend(
+            [state, interaction] + state.content + state.param_changes +
+            interaction.answer_groups + outcomes)
+        for answer_group in interaction.answer_groups:
+            domain_objects.extend(answer_group.rule_specs)
+        for outcome in outcomes:
+            domain_objects.extend(outcome.param_changes)
+    return domain_objects
+
+
+def _get_size_in_bytes(domain_object):
+    """Returns the size of the given domain object, including its __dict__
+    if it has one, but not including its attribute values.
+    """
+    size = sys.getsizeof(domain_object)
+    if hasattr(domain_object, '__dict__'):
+        size += sys.getsizeof(domain_object.__dict__)
+    return size
+
+
+def main():
+    """Runs the benchmark and prints the results."""
+    args = PARSER.parse_args()
+    explorations = _get_demo_explorations()
+
+    domain_objects = []
+    for exploration in explorations:
+        domain_objects.extend(_get_domain_objects(exploration))
+    pickled_explorations = [
+        cPickle.dumps(exploration, cPickle.HIGHEST_PROTOCOL)
+        for exploration in explorations]
+
+    # The fastest run is reported, since it is the least affected by other
+    # processes on the machine.
+    unpickle_secs = None
+    for _ in range(args.iteration_count):
+        start_time = time.time()
+        for pickled_exploration in pickled_explorations:
+            cPickle.loads(pickled_exploration)
+        run_secs = time.time() - start_time
+        if unpickle_secs is None or run_secs < unpickle_secs:
+            unpickle_secs = run_secs
+
+    print 'Loaded %d demo explorations, with %d state domain objects.' % (
+        len(explorations), len(domain_objects))
+    print 'Memory used by the state domain objects: %d bytes' % sum(
+        _get_size_in_bytes(domain_object) for domain_object in domain_objects)
+    print 'Pickled size of the explorations: %d bytes' % sum(
+        len(pickled_exploration)
+        for pickled_exploration in pickled_explorations)
+    print 'Time taken to unpickle the explorations: %.1f ms' % (
+        unpickle_secs * 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for gallery-style queries against the in-process search index.
+
+This indexes a synthetic catalogue of exploration documents using
+local_search_services, and reports the average latency of a few typical
+gallery queries.
+
+Run this script from the Oppia root directory:
+
+    python core/tests/search_benchmark.py --doc_count=20000
+
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+CURR_DIR = os.path.abspath(os.getcwd())
+sys.path.insert(0, CURR_DIR)
+
+from core.platform.search import local_search_services
+import feconf
+
+
+PARSER = argparse.ArgumentParser()
+PARSER.add_argument(
+    '--doc_count',
+    help='Number of documents in the synthetic catalogue.',
+    default=20000, type=int)
+PARSER.add_argument(
+    '--iteration_count',
+    help='Number of times that each query is run.',
+    default=20, type=int)
+
+_INDEX_NAME = 'benchmark'
+_WORDS = [
+    'algebra', 'fractions', 'geometry', 'history', 'music', 'numbers',
+    'programming', 'reading', 'science', 'shapes', 'spanish', 'stories',
+    'triangles', 'vocabulary', 'writing']
+_CATEGORIES = sorted(feconf.CATEGORIES_TO_COLORS.keys())
+_LANGUAGE_CODES = ['en', 'es', 'fr', 'hi']
+_QUERIES = [
+    '',
+    'fractions',
+    'algebra fractions',
+    'category=("%s" OR "%s")' % (_CATEGORIES[0], _CATEGORIES[1]),
+    'geometry language_code=("en" OR "fr")',
+    'is:featured',
+]
+
+
+def _get_random_doc(doc_id):
+    return {
+        'id': doc_id,
+        'title': ' '.join(random.sample(_WORDS, 3)),
+        'objective': ' '.join(random.sample(_WORDS, 6)),
+        'category': random.choice(_CATEGORIES),
+        'language_code': random.choice(_LANGUAGE_CODES),
+        'tags': random.sample(_WORDS, 2),
+        'rank': random.randint(0, 200),
+        'is': 'featured' if random.random() < 0.05 else '',
+    }
+
+
+def main():
+    """Runs the benchmark and prints the results."""
+    args = PARSER.parse_args()
+    random.seed(0)
+    docs = [_get_random_doc('exp%d' % ind) for ind in xrange(args.doc_count)]
+
+    start_time = time.time()
+    for ind in xrange(
+            0, len(docs), local_search_services.MAX_DOCUMENTS_PER_PUT):
+        local_search_services.add_documents_to_index(
+            docs[ind: ind + local_search_services.MAX_DOCUMENTS_PER_PUT],
+            _INDEX_NAME)
+    print 'Indexed %d documents in %.1f ms.' % (
+        len(docs), (time.time() - start_time) * 1000)
+
+    for query_string in _QUERIES:
+        start_time = time.time()
+        for _ in range(args.iteration_count):
+            local_search_services.search(
+                query_string, _INDEX_NAME, limit=feconf.GALLERY_PAGE_SIZE)
+        print '%-50s %.2f ms' % (
+            repr(query_string),
+            (time.time() - start_time) * 1000 / args.iteration_count)
+
+
+if __name__ == '__main__':
+    main()
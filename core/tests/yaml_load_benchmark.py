@@ -0,0 +1,89 @@
+# Copyright 2015 The Oppia Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark for parsing the YAML files of the demo explorations and
+collections.
+
+This compares utils.dict_from_yaml(), which uses the libyaml-based loader if
+it is available, with the pure-Python loader.
+
+Run this script from the Oppia root directory:
+
+    python core/tests/yaml_load_benchmark.py --iteration_count=3
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+CURR_DIR = os.path.abspath(os.getcwd())
+sys.path.insert(0, CURR_DIR)
+
+import feconf
+import utils
+import yaml
+
+
+PARSER = argparse.ArgumentParser()
+PARSER.add_argument(
+    '--iteration_count',
+    help='Number of times that all the YAML files are parsed.',
+    default=3, type=int)
+
+
+def _get_all_yaml_files():
+    """Returns a list of the contents of all demo YAML files."""
+    yaml_files = []
+    for root_dir in [
+            feconf.SAMPLE_EXPLORATIONS_DIR, feconf.SAMPLE_COLLECTIONS_DIR]:
+        for (dirpath, _, filenames) in os.walk(root_dir):
+            for filename in filenames:
+                if filename.endswith('.yaml'):
+                    with open(os.path.join(dirpath, filename)) as f:
+                        yaml_files.append(f.read())
+    return yaml_files
+
+
+def _time_secs(parse_function, yaml_files, iteration_count):
+    """Returns the average time, in seconds, taken to parse all the YAML
+    files using parse_function.
+    """
+    start_time = time.time()
+    for _ in range(iteration_count):
+        for yaml_content in yaml_files:
+            parse_function(yaml_content)
+    return (time.time() - start_time) / iteration_count
+
+
+def main():
+    """Runs the benchmark and prints the results."""
+    args = PARSER.parse_args()
+    yaml_files = _get_all_yaml_files()
+
+    pure_python_secs = _time_secs(
+        lambda yaml_content: yaml.load(yaml_content, Loader=yaml.SafeLoader),
+        yaml_files, args.iteration_count)
+    dict_from_yaml_secs = _time_secs(
+        utils.dict_from_yaml, yaml_files, args.iteration_count)
+
+    print 'Parsed %s YAML files (libyaml available: %s).' % (
+        len(yaml_files), hasattr(yaml, 'CSafeLoader'))
+    print 'Pure-Python loader: %.1f ms' % (pure_python_secs * 1000)
+    print 'utils.dict_from_yaml(): %.1f ms' % (dict_from_yaml_secs * 1000)
+
+
+if __name__ == '__main__':
+    main()
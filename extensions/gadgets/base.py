@@ -55,6 +55,10 @@ class BaseGadget(object):
     # feconf.DEPENDENCIES_TEMPLATES_DIR. Overridden in subclasses.
     _dependency_ids = []
 
+    # Memoized value of html_body. This is read from disk on first access and
+    # held for the lifetime of this instance.
+    _cached_html_body = None
+
     @property
     def type(self):
         return self.__class__.__name__
@@ -84,11 +88,14 @@ class BaseGadget(object):
         gadget. This contains everything needed to display the gadget
         once the necessary attributes are supplied.
         """
-        js_directives = utils.get_file_contents(os.path.join(
-            feconf.GADGETS_DIR, self.type, '%s.js' % self.type))
-        html_templates = utils.get_file_contents(os.path.join(
-            feconf.GADGETS_DIR, self.type, '%s.html' % self.type))
-        return '<script>%s</script>\n%s' % (js_directives, html_templates)
+        if self._cached_html_body is None:
+            js_directives = utils.get_file_contents(os.path.join(
+                feconf.GADGETS_DIR, self.type, '%s.js' % self.type))
+            html_templates = utils.get_file_contents(os.path.join(
+                feconf.GADGETS_DIR, self.type, '%s.html' % self.type))
+            self._cached_html_body = '<script>%s</script>\n%s' % (
+                js_directives, html_templates)
+        return self._cached_html_body
 
     def validate(self, customization_args):
         """Subclasses may override to perform additional validation."""
@@ -103,6 +103,11 @@ class BaseInteraction(object):
     # be None unless the interaction is linear and non-terminal.
     default_outcome_heading = None
 
+    # Memoized values of html_body and validator_html. These are read from disk
+    # on first access and held for the lifetime of this instance.
+    _cached_html_body = None
+    _cached_validator_html = None
+
     @property
     def id(self):
         return self.__class__.__name__
@@ -148,21 +153,26 @@ class BaseInteraction(object):
         interaction itself and the other for displaying the learner's response
         in a read-only view after it has been submitted.
         """
-        js_directives = utils.get_file_contents(os.path.join(
-            feconf.INTERACTIONS_DIR, self.id, '%s.js' % self.id))
-        html_templates = utils.get_file_contents(os.path.join(
-            feconf.INTERACTIONS_DIR, self.id, '%s.html' % self.id))
-        return '<script>%s</script>\n%s' % (js_directives, html_templates)
+        if self._cached_html_body is None:
+            js_directives = utils.get_file_contents(os.path.join(
+                feconf.INTERACTIONS_DIR, self.id, '%s.js' % self.id))
+            html_templates = utils.get_file_contents(os.path.join(
+                feconf.INTERACTIONS_DIR, self.id, '%s.html' % self.id))
+            self._cached_html_body = '<script>%s</script>\n%s' % (
+                js_directives, html_templates)
+        return self._cached_html_body
 
     @property
     def validator_html(self):
         """The HTML code containing validators for the interaction's
         customization_args and submission handler.
         """
-        return (
-            '<script>%s</script>\n' %
-            utils.get_file_contents(os.path.join(
-                feconf.INTERACTIONS_DIR, self.id, 'validator.js')))
+        if self._cached_validator_html is None:
+            self._cached_validator_html = (
+                '<script>%s</script>\n' %
+                utils.get_file_contents(os.path.join(
+                    feconf.INTERACTIONS_DIR, self.id, 'validator.js')))
+        return self._cached_validator_html
 
     def to_dict(self):
         """Gets a dict representing this interaction. Only default values are
@@ -56,6 +56,10 @@ class BaseRichTextComponent(object):
     # utils.convert_png_to_data_url() function. Overridden in subclasses.
     icon_data_url = ''
 
+    # Memoized value of html_body. This is read from disk on first access and
+    # held for the lifetime of this instance.
+    _cached_html_body = None
+
     @property
     def id(self):
         return self.__class__.__name__
@@ -74,11 +78,14 @@ class BaseRichTextComponent(object):
         necessary attributes are supplied. For rich-text components, this
         consists of a single directive/template pair.
         """
-        js_directives = utils.get_file_contents(os.path.join(
-            feconf.RTE_EXTENSIONS_DIR, self.id, '%s.js' % self.id))
-        html_templates = utils.get_file_contents(os.path.join(
-            feconf.RTE_EXTENSIONS_DIR, self.id, '%s.html' % self.id))
-        return '<script>%s</script>\n%s' % (js_directives, html_templates)
+        if self._cached_html_body is None:
+            js_directives = utils.get_file_contents(os.path.join(
+                feconf.RTE_EXTENSIONS_DIR, self.id, '%s.js' % self.id))
+            html_templates = utils.get_file_contents(os.path.join(
+                feconf.RTE_EXTENSIONS_DIR, self.id, '%s.html' % self.id))
+            self._cached_html_body = '<script>%s</script>\n%s' % (
+                js_directives, html_templates)
+        return self._cached_html_body
 
     def to_dict(self):
         """Gets a dict representing this component. Only the default values for
@@ -26,6 +26,11 @@ DEBUG = False
 # The platform for the storage backend. This is used in the model-switching
 # code in core/platform.
 PLATFORM = 'gae'
+# The search service to use. This is either 'gae', for the App Engine Search
+# API, or 'local', for an in-process index that is not persisted and is not
+# shared between instances. The latter is only suitable for development and
+# benchmarking.
+SEARCH_SERVICE = 'gae'
 
 # Whether we should serve the development or production experience.
 if PLATFORM == 'gae':
@@ -54,6 +59,10 @@ VALUE_GENERATORS_DIR = os.path.join('extensions', 'value_generators')
 # The maximum number of results to retrieve in a datastore query.
 DEFAULT_QUERY_LIMIT = 1000
 
+# The number of entities to fetch per datastore round trip when iterating over
+# all summaries of a given kind.
+SUMMARY_ITERATION_BATCH_SIZE = 200
+
 # The current version of the exploration states blob schema. If any backward-
 # incompatible changes are made to the states blob schema in the data store,
 # this version number must be changed and the exploration migration job
@@ -161,6 +170,25 @@ REGISTRATION_PAGE_LAST_UPDATED_UTC = datetime.datetime(2015, 10, 14, 2, 40, 0)
 
 # The maximum size of an uploaded file, in bytes.
 MAX_FILE_SIZE_BYTES = 1048576
+# The maximum size of a file whose latest version is cached in memcache, in
+# bytes. This leaves room for the key and for pickling overhead under the
+# memcache value size limit of 1 MB.
+MAX_MEMCACHED_FILE_SIZE_BYTES = 900000
+
+# The number of asset files that are fetched from the datastore at a time when
+# an exploration is exported as a ZIP file.
+EXPORT_ASSETS_BATCH_SIZE = 20
+
+# The number of seconds for which the learner-independent data of a collection
+# page is cached. This bounds how long a renamed exploration can keep its old
+# title on the pages of the collections that contain it.
+COLLECTION_PAGE_DATA_MEMCACHE_TIMEOUT_SECS = 300
+
+# The number of seconds for which the results of an exploration search query
+# are cached. Cached results are also invalidated whenever an exploration
+# summary or search document changes, so this mainly bounds how long changes
+# in search ranking take to show up.
+SEARCH_RESULTS_MEMCACHE_TIMEOUT_SECS = 60
 
 # The default language code for an exploration.
 DEFAULT_LANGUAGE_CODE = 'en'
@@ -289,6 +317,7 @@ EXPLORATION_RIGHTS_PREFIX = '/createhandler/rights'
 EXPLORATION_DATA_PREFIX = '/createhandler/data'
 EXPLORATION_URL_PREFIX = '/explore'
 EXPLORATION_INIT_URL_PREFIX = '/explorehandler/init'
+EXTENSION_SPECS_URL_PREFIX = '/extension_specs'
 FEEDBACK_LAST_UPDATED_URL_PREFIX = '/feedback_last_updated'
 FEEDBACK_THREAD_URL_PREFIX = '/threadhandler'
 FEEDBACK_THREADLIST_URL_PREFIX = '/threadlisthandler'
@@ -32,6 +32,7 @@ from core.controllers import profile
 from core.controllers import reader
 from core.controllers import recent_commits
 from core.controllers import resources
+from core.domain import player_assets_registry
 from core.platform import models
 transaction_services = models.Registry.import_transaction_services()
 
@@ -57,7 +58,7 @@ class WarmupHandler(base.BaseHandler):
 
     def get(self):
         """Handles GET warmup requests."""
-        pass
+        player_assets_registry.Registry.warm_cache()
 
 
 # Regex for base64 id encoding
@@ -164,6 +165,9 @@ urls = [
         admin.AdminTopicsCsvDownloadHandler,
         'admin_topics_csv_download_handler'),
 
+    get_redirect_route(
+        r'%s/<version>.js' % feconf.EXTENSION_SPECS_URL_PREFIX,
+        resources.ExtensionSpecsHandler, 'extension_specs_handler'),
     get_redirect_route(
         r'/imagehandler/<exploration_id>/<encoded_filepath>',
         resources.ImageHandler, 'image_handler'),
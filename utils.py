@@ -52,6 +52,28 @@ class ExplorationConversionError(Exception):
     pass
 
 
+class SlottedObject(object):
+    """Base class for domain objects that are created in large numbers and
+    held in memcache.
+
+    Direct subclasses list all their attributes in __slots__, so that their
+    instances do not carry a __dict__. Instances are pickled as a tuple of
+    their attribute values, in the order of __slots__, and are unpickled
+    without calling __init__().
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        if isinstance(state, dict):
+            # This instance was pickled before its class used __slots__.
+            state = tuple(state[name] for name in self.__slots__)
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
 def create_enum(*sequential, **names):
     enums = dict(zip(sequential, sequential), **names)
     return type('Enum', (), enums)
@@ -185,6 +207,14 @@ def to_ascii(string):
         'NFKD', unicode(string)).encode('ascii', 'ignore')
 
 
+# The YAML loader to use. The libyaml-based loader is much faster than the
+# pure-Python one, and constructs the same objects, but it is only available
+# if PyYAML was built with libyaml. Note that the libyaml-based dumper is not
+# used, since its output (e.g. the wrapping of long strings) differs from that
+# of the pure-Python dumper.
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
 def yaml_from_dict(dictionary, width=80):
     """Gets the YAML representation of a dict."""
     return yaml.safe_dump(dictionary, default_flow_style=False, width=width)
@@ -193,7 +223,7 @@ def yaml_from_dict(dictionary, width=80):
 def dict_from_yaml(yaml_str):
     """Gets the dict representation of a YAML string."""
     try:
-        retrieved_dict = yaml.safe_load(yaml_str)
+        retrieved_dict = yaml.load(yaml_str, Loader=_YAML_SAFE_LOADER)
         assert isinstance(retrieved_dict, dict)
         return retrieved_dict
     except yaml.YAMLError as e: